@@ -7,7 +7,44 @@
 STACK_NAME="resume-analyzer-stack"
 ENVIRONMENT="dev"
 REGION="us-east-1"
-S3_DEPLOYMENT_BUCKET="resume-analyzer-deployment-$(aws sts get-caller-identity --query Account --output text)"
+ACCOUNT_ID="$(aws sts get-caller-identity --query Account --output text)"
+S3_DEPLOYMENT_BUCKET="resume-analyzer-deployment-$ACCOUNT_ID"
+TABLE_ARN="arn:aws:dynamodb:$REGION:$ACCOUNT_ID:table"
+# Deployed function names (the API handler's PARSER_FUNCTION / SCORER_FUNCTION)
+PARSER_FUNCTION="${PARSER_FUNCTION:-resume-parser}"
+SCORER_FUNCTION="${SCORER_FUNCTION:-score-calculator}"
+# Supporting tables (the Lambdas' *_TABLE environment variables)
+PARSE_CACHE_TABLE="${PARSE_CACHE_TABLE:-ResumeParseCache}"
+JOBS_TABLE="${JOBS_TABLE:-JobDescriptions}"
+CANDIDATE_INDEX_TABLE="${CANDIDATE_INDEX_TABLE:-CandidateIndex}"
+# Analysis table from the SAM stack (the Lambdas' DYNAMODB_TABLE)
+ANALYSIS_TABLE="${DYNAMODB_TABLE:-ResumeAnalysisResults}"
+
+# Create a pay-per-request DynamoDB table unless it already exists
+ensure_table() {
+    local table=$1
+    shift
+    if ! aws dynamodb describe-table --table-name "$table" --region $REGION >/dev/null 2>&1; then
+        echo "Creating table: $table"
+        aws dynamodb create-table --table-name "$table" --billing-mode PAY_PER_REQUEST \
+            --region $REGION "$@" >/dev/null
+        aws dynamodb wait table-exists --table-name "$table" --region $REGION
+    fi
+}
+
+# Attach (or replace) an inline policy on a deployed function's execution role
+# Usage: grant_access FUNCTION POLICY_NAME '"dynamodb:GetItem",...' RESOURCE_ARN...
+grant_access() {
+    local function_name=$1 policy_name=$2 actions=$3
+    shift 3
+    local role_name resources
+    role_name=$(aws lambda get-function-configuration --function-name "$function_name" \
+        --region $REGION --query Role --output text | awk -F/ '{print $NF}')
+    resources=$(printf '"%s",' "$@")
+    echo "Granting $policy_name to $role_name"
+    aws iam put-role-policy --role-name "$role_name" --policy-name "$policy_name" \
+        --policy-document "{\"Version\":\"2012-10-17\",\"Statement\":[{\"Effect\":\"Allow\",\"Action\":[$actions],\"Resource\":[${resources%,}]}]}"
+}
 
 echo "=== Serverless Resume Analyzer Deployment ==="
 echo "Stack Name: $STACK_NAME"
@@ -33,6 +70,24 @@ for lambda_dir in lambda/*/; do
     fi
 done
 
+# Modules shared by the functions (lambda/shared) are vendored the same way
+for lambda_dir in lambda/*/; do
+    if [ "$lambda_dir" != "lambda/shared/" ]; then
+        cp lambda/shared/*.py "$lambda_dir"
+    fi
+done
+
+# IDF artifact shipped in the score calculator package (scripts/build_idf.py).
+# Set IDF_SOURCES to the corpus directories/JSONL files to rebuild it
+echo ""
+echo "Building IDF artifact..."
+if [ -n "$IDF_SOURCES" ]; then
+    python scripts/build_idf.py $IDF_SOURCES --min-df "${IDF_MIN_DF:-2}"
+elif [ ! -f lambda/score_calculator/idf.bin ]; then
+    echo "WARNING: lambda/score_calculator/idf.bin not found and IDF_SOURCES is not set;"
+    echo "         the scorer will use per-request IDF and job recommendations will be disabled"
+fi
+
 # Build Lambda layer for PyMuPDF
 echo ""
 echo "Building PyMuPDF layer..."
@@ -59,6 +114,59 @@ sam deploy \
     --region $REGION \
     --no-fail-on-empty-changeset
 
+# Supporting tables and permissions the SAM stack does not define
+echo ""
+echo "Provisioning supporting tables..."
+
+# Parse cache (lambda/resume_parser/parse_cache.py); entries expire via TTL
+ensure_table "$PARSE_CACHE_TABLE" \
+    --attribute-definitions AttributeName=cache_key,AttributeType=S \
+    --key-schema AttributeName=cache_key,KeyType=HASH
+aws dynamodb update-time-to-live --table-name "$PARSE_CACHE_TABLE" --region $REGION \
+    --time-to-live-specification "Enabled=true,AttributeName=expires_at" >/dev/null 2>&1 || true
+grant_access "$PARSER_FUNCTION" ParseCacheAccess '"dynamodb:GetItem","dynamodb:PutItem"' \
+    "$TABLE_ARN/$PARSE_CACHE_TABLE"
+
+# Job registry (lambda/score_calculator/job_registry.py)
+ensure_table "$JOBS_TABLE" \
+    --attribute-definitions AttributeName=jd_id,AttributeType=S \
+    --key-schema AttributeName=jd_id,KeyType=HASH
+grant_access "$SCORER_FUNCTION" JobRegistryAccess '"dynamodb:PutItem","dynamodb:BatchGetItem"' \
+    "$TABLE_ARN/$JOBS_TABLE"
+
+# Candidate index (lambda/score_calculator/candidate_index.py), kept current
+# by the scorer from the analysis table's stream
+ensure_table "$CANDIDATE_INDEX_TABLE" \
+    --attribute-definitions AttributeName=index_key,AttributeType=S AttributeName=analysis_id,AttributeType=S \
+    --key-schema AttributeName=index_key,KeyType=HASH AttributeName=analysis_id,KeyType=RANGE
+grant_access "$SCORER_FUNCTION" CandidateIndexAccess \
+    '"dynamodb:Query","dynamodb:BatchGetItem","dynamodb:BatchWriteItem","dynamodb:PutItem","dynamodb:DeleteItem"' \
+    "$TABLE_ARN/$CANDIDATE_INDEX_TABLE"
+
+STREAM_ARN=$(aws dynamodb describe-table --table-name "$ANALYSIS_TABLE" --region $REGION \
+    --query Table.LatestStreamArn --output text)
+if [ "$STREAM_ARN" = "None" ]; then
+    echo "Enabling stream on $ANALYSIS_TABLE"
+    STREAM_ARN=$(aws dynamodb update-table --table-name "$ANALYSIS_TABLE" --region $REGION \
+        --stream-specification StreamEnabled=true,StreamViewType=NEW_AND_OLD_IMAGES \
+        --query TableDescription.LatestStreamArn --output text)
+    aws dynamodb wait table-exists --table-name "$ANALYSIS_TABLE" --region $REGION
+fi
+grant_access "$SCORER_FUNCTION" AnalysisStreamRead \
+    '"dynamodb:DescribeStream","dynamodb:GetRecords","dynamodb:GetShardIterator"' "$STREAM_ARN"
+grant_access "$SCORER_FUNCTION" AnalysisStreamList '"dynamodb:ListStreams"' '*'
+
+MAPPINGS=$(aws lambda list-event-source-mappings --function-name "$SCORER_FUNCTION" \
+    --event-source-arn "$STREAM_ARN" --region $REGION --query 'length(EventSourceMappings)' --output text)
+if [ "$MAPPINGS" = "0" ]; then
+    echo "Subscribing $SCORER_FUNCTION to the $ANALYSIS_TABLE stream"
+    # The new stream permissions take a few seconds to reach the Lambda service
+    sleep 10
+    aws lambda create-event-source-mapping --function-name "$SCORER_FUNCTION" \
+        --event-source-arn "$STREAM_ARN" --starting-position LATEST \
+        --function-response-types ReportBatchItemFailures --region $REGION >/dev/null
+fi
+
 # Get outputs
 echo ""
 echo "=== Deployment Complete ==="
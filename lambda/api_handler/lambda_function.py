@@ -50,7 +50,11 @@ def lambda_handler(event, context):
     Main API Gateway handler
     Routes: 
     - POST /upload - Get presigned URL for resume upload
+    - POST /jobs - Register job descriptions once, returns their jd_ids
     - POST /analyze - Trigger full analysis (parse + score)
+    - POST /ats-score - Live ATS score from text or an incremental state plus edits
+    - POST /recommend-jobs - Best matching registered jobs for an analysis_id
+    - POST /search-candidates - Best matching parsed resumes for a job_description or jd_id
     - GET /results/{analysis_id} - Get analysis results
     """
     try:
@@ -124,13 +128,56 @@ def lambda_handler(event, context):
                     'body': json.dumps({'error': 'Failed to generate upload URL'})
                 }
         
+        # POST /jobs - Store job descriptions with their precomputed scoring features
+        elif http_method == 'POST' and path.rstrip('/').endswith('/jobs'):
+            body = json.loads(event.get('body', '{}'))
+            jobs = body.get('jobs', [])
+            
+            if not jobs:
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'error': 'Missing required field: jobs'
+                    })
+                }
+            
+            scorer_payload = {
+                'action': 'register_jobs',
+                'jobs': [
+                    {'title': job.get('title', 'Untitled Job'), 'description': job.get('description', '')}
+                    for job in jobs
+                ]
+            }
+            
+            scorer_response = lambda_client.invoke(
+                FunctionName=SCORER_FUNCTION,
+                InvocationType='RequestResponse',
+                Payload=json.dumps(scorer_payload)
+            )
+            scorer_result = json.loads(scorer_response['Payload'].read())
+            
+            return {
+                'statusCode': scorer_result.get('statusCode', 500),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': scorer_result.get('body', '{}')
+            }
+        
         # POST /analyze - Run full analysis
         elif http_method == 'POST' and '/analyze' in path:
             body = json.loads(event.get('body', '{}'))
             resume_key = body.get('resume_key')
             job_description = body.get('job_description')
+            jd_id = body.get('jd_id')
+            ats_profile = body.get('ats_profile')
             
-            if not resume_key or not job_description:
+            if not resume_key or not (job_description or jd_id):
                 return {
                     'statusCode': 400,
                     'headers': {
@@ -138,16 +185,19 @@ def lambda_handler(event, context):
                         'Access-Control-Allow-Origin': '*'
                     },
                     'body': json.dumps({
-                        'error': 'Missing required fields: resume_key and job_description'
+                        'error': 'Missing required fields: resume_key and job_description (or jd_id)'
                     })
                 }
             
             # Step 1: Invoke parser Lambda
+            parser_request = {
+                'bucket': BUCKET_NAME,
+                'key': resume_key
+            }
+            if ats_profile:
+                parser_request['ats_profile'] = ats_profile
             parser_payload = {
-                'body': json.dumps({
-                    'bucket': BUCKET_NAME,
-                    'key': resume_key
-                })
+                'body': json.dumps(parser_request)
             }
             
             parser_response = lambda_client.invoke(
@@ -174,12 +224,14 @@ def lambda_handler(event, context):
             
             analysis_id = parser_body.get('analysis_id')
             
-            # Step 2: Invoke scorer Lambda
+            # Step 2: Invoke scorer Lambda (a registered job is sent by id only)
+            scorer_request = {'analysis_id': analysis_id}
+            if jd_id:
+                scorer_request['jd_id'] = jd_id
+            else:
+                scorer_request['job_description'] = job_description
             scorer_payload = {
-                'body': json.dumps({
-                    'analysis_id': analysis_id,
-                    'job_description': job_description
-                })
+                'body': json.dumps(scorer_request)
             }
             
             scorer_response = lambda_client.invoke(
@@ -230,6 +282,126 @@ def lambda_handler(event, context):
                 })
             }
         
+        # POST /ats-score - Live ATS score while the resume is edited
+        elif http_method == 'POST' and '/ats-score' in path:
+            body = json.loads(event.get('body', '{}'))
+            if 'text' not in body and 'state' not in body:
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'error': 'Provide text, or after the first request state and edits'
+                    })
+                }
+            
+            # The parser rescans only the edited lines when given a state
+            rescore_request = {'action': 'ats_rescore'}
+            for field in ('text', 'state', 'edits', 'ats_profile'):
+                if field in body:
+                    rescore_request[field] = body[field]
+            
+            parser_response = lambda_client.invoke(
+                FunctionName=PARSER_FUNCTION,
+                InvocationType='RequestResponse',
+                Payload=json.dumps({'body': json.dumps(rescore_request)})
+            )
+            parser_result = json.loads(parser_response['Payload'].read())
+            
+            return {
+                'statusCode': parser_result.get('statusCode', 500),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': parser_result.get('body', '{}')
+            }
+        
+        # POST /recommend-jobs - Top-K registered jobs for an analyzed resume
+        elif http_method == 'POST' and '/recommend-jobs' in path:
+            body = json.loads(event.get('body', '{}'))
+            analysis_id = body.get('analysis_id')
+            
+            if not analysis_id:
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'error': 'Missing required field: analysis_id'
+                    })
+                }
+            
+            scorer_payload = {
+                'action': 'recommend_jobs',
+                'analysis_id': analysis_id,
+                'k': body.get('k', 10),
+                'feedback_limit': body.get('feedback_limit')
+            }
+            
+            scorer_response = lambda_client.invoke(
+                FunctionName=SCORER_FUNCTION,
+                InvocationType='RequestResponse',
+                Payload=json.dumps(scorer_payload)
+            )
+            scorer_result = json.loads(scorer_response['Payload'].read())
+            
+            return {
+                'statusCode': scorer_result.get('statusCode', 500),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': scorer_result.get('body', '{}')
+            }
+        
+        # POST /search-candidates - Top-K parsed resumes for a job
+        elif http_method == 'POST' and '/search-candidates' in path:
+            body = json.loads(event.get('body', '{}'))
+            job_description = body.get('job_description')
+            jd_id = body.get('jd_id')
+            
+            if not (job_description or jd_id):
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'error': 'Missing required field: job_description (or jd_id)'
+                    })
+                }
+            
+            scorer_payload = {
+                'action': 'search_candidates',
+                'k': body.get('k', 50)
+            }
+            if jd_id:
+                scorer_payload['jd_id'] = jd_id
+            else:
+                scorer_payload['job_description'] = job_description
+            
+            scorer_response = lambda_client.invoke(
+                FunctionName=SCORER_FUNCTION,
+                InvocationType='RequestResponse',
+                Payload=json.dumps(scorer_payload)
+            )
+            scorer_result = json.loads(scorer_response['Payload'].read())
+            
+            return {
+                'statusCode': scorer_result.get('statusCode', 500),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': scorer_result.get('body', '{}')
+            }
+        
         # GET /results/{analysis_id}
         elif http_method == 'GET' and '/results/' in path:
             analysis_id = path.split('/results/')[-1]
@@ -307,50 +479,42 @@ def lambda_handler(event, context):
             
             analysis_id = parser_body.get('analysis_id')
             
-            # Step 2: Score against each job
-            results = []
-            for job in jobs:
-                job_title = job.get('title', 'Untitled Job')
-                job_description = job.get('description', '')
-                
-                if not job_description.strip():
-                    continue
-                
-                scorer_payload = {
+            # Step 2: Score against all jobs in one scorer invoke (returned best first)
+            scorer_payload = {
+                'action': 'batch_compare',
+                'analysis_id': analysis_id,
+                'jobs': [
+                    {'title': job.get('title'), 'jd_id': job['jd_id']} if job.get('jd_id') else
+                    {'title': job.get('title', 'Untitled Job'), 'description': job.get('description', '')}
+                    for job in jobs
+                ],
+                'top_k': body.get('top_k'),
+                'feedback_limit': body.get('feedback_limit')
+            }
+            
+            scorer_response = lambda_client.invoke(
+                FunctionName=SCORER_FUNCTION,
+                InvocationType='RequestResponse',
+                Payload=json.dumps(scorer_payload)
+            )
+            
+            scorer_result = json.loads(scorer_response['Payload'].read())
+            scorer_body = json.loads(scorer_result.get('body', '{}'))
+            
+            if scorer_result.get('statusCode') != 200:
+                return {
+                    'statusCode': 500,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
                     'body': json.dumps({
-                        'analysis_id': analysis_id,
-                        'job_description': job_description
+                        'error': 'Batch scoring failed',
+                        'details': scorer_body
                     })
                 }
-                
-                scorer_response = lambda_client.invoke(
-                    FunctionName=SCORER_FUNCTION,
-                    InvocationType='RequestResponse',
-                    Payload=json.dumps(scorer_payload)
-                )
-                
-                scorer_result = json.loads(scorer_response['Payload'].read())
-                scorer_body = json.loads(scorer_result.get('body', '{}'))
-                
-                if scorer_result.get('statusCode') == 200:
-                    score_data = scorer_body.get('results', {})
-                    feedback = score_data.get('feedback', {})
-                    
-                    results.append({
-                        'title': job_title,
-                        'score': float(score_data.get('compatibility_score', 0)),
-                        'skill_match': float(score_data.get('skill_match', 0)),
-                        'matched_skills': feedback.get('matched_skills_count', 0),
-                        'missing_skills': len(feedback.get('missing_keywords', [])),
-                        'strengths': feedback.get('strengths', 'Good alignment with job requirements'),
-                        'improvements': feedback.get('improvements', 'Consider highlighting more relevant experience')
-                    })
             
-            # Sort by score descending
-            results.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Convert Decimals to floats for JSON serialization
-            results = convert_decimals(results)
+            results = scorer_body.get('results', [])
             
             return {
                 'statusCode': 200,
@@ -360,7 +524,9 @@ def lambda_handler(event, context):
                 },
                 'body': json.dumps({
                     'message': 'Batch comparison completed',
-                    'results': results
+                    'results': results,
+                    # Jobs that could not be scored (unknown jd_id or empty description)
+                    'errors': scorer_body.get('errors', [])
                 })
             }
         
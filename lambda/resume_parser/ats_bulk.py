@@ -0,0 +1,75 @@
+"""
+Bulk ATS Scoring
+Re-scores stored ATS feature vectors with NumPy (offline use only; the
+Lambda runtime does not ship NumPy).
+
+Each registered check is evaluated once per distinct combination of its
+input features, and the points are scattered back to every row. The
+scalar check functions stay the source of the rules, so changed
+thresholds or ATS_CHECK_WEIGHTS apply here unchanged.
+"""
+import numpy as np
+
+from ats_checker import ATS_RATINGS, FEATURE_VECTOR_FIELDS, LOWEST_ATS_RATING, is_repetitive, select_checks
+
+# Checks whose inputs are close to unique per row (a ratio of two counts)
+# get a vectorized condition instead: the same function the scalar check
+# tests, applied to whole columns. The points still come from the scalar
+# check, evaluated on one row where the condition holds
+VECTOR_CONDITIONS = {
+    'density': is_repetitive
+}
+
+
+def check_points(check, names, values):
+    """Points a check awards for one combination of its inputs (0 if any is missing)"""
+    if min(values) < 0:
+        return 0
+    outcome = check['func'](dict(zip(names, values)))
+    return outcome[0] * check['weight'] if outcome else 0
+
+
+def condition_points(check, names, columns):
+    """Points per row for a check with a vectorized condition"""
+    present = (columns >= 0).all(axis=1)
+    # Rows with a missing input never fire; zero them so the condition sees valid counts
+    fires = VECTOR_CONDITIONS[check['name']](*np.where(present[:, None], columns, 0).T) & present
+    if not fires.any():
+        return 0
+    row = columns[np.argmax(fires)].tolist()
+    return np.where(fires, check_points(check, names, row), 0)
+
+
+def score_feature_matrix(matrix, profile='full'):
+    """
+    Scores and ratings for an (n, len(FEATURE_VECTOR_FIELDS)) int matrix.
+    Returns (scores, ratings) as NumPy arrays. Points are summed as int64,
+    so check weights must be ints (load_check_weights enforces this).
+    """
+    checks = select_checks(profile)
+    for check in checks:
+        if isinstance(check['weight'], bool) or not isinstance(check['weight'], int):
+            raise ValueError(f"ATS check {check['name']!r} has non-integer weight {check['weight']!r}")
+    matrix = np.asarray(matrix, dtype=np.int64).reshape(-1, len(FEATURE_VECTOR_FIELDS))
+    scores = np.full(len(matrix), 100, dtype=np.int64)
+    if not len(matrix):
+        return scores, np.array([], dtype=object)
+
+    for check in checks:
+        names = check['inputs']
+        columns = matrix[:, [FEATURE_VECTOR_FIELDS.index(name) for name in names]]
+        if check['name'] in VECTOR_CONDITIONS:
+            scores += condition_points(check, names, columns)
+            continue
+        # Shift the -1 sentinel to 0 and pack the input columns into one key per row
+        shifted = columns + 1
+        dims = shifted.max(axis=0) + 1
+        unique_keys, inverse = np.unique(np.ravel_multi_index(shifted.T, dims), return_inverse=True)
+        combos = np.stack(np.unravel_index(unique_keys, dims), axis=1) - 1
+        points = np.array([check_points(check, names, combo) for combo in combos.tolist()], dtype=np.int64)
+        scores += points[inverse.reshape(-1)]
+
+    scores = np.clip(scores, 0, 100)
+    ratings = np.select([scores >= minimum for minimum, _ in ATS_RATINGS],
+                        [rating for _, rating in ATS_RATINGS], default=LOWEST_ATS_RATING)
+    return scores, ratings
@@ -2,161 +2,426 @@
 ATS (Applicant Tracking System) Checker
 Analyzes resume for ATS compatibility
 """
-import re
+import json
+import os
+import time
+from document import ParsedDocument
+import patterns
+from skill_matcher import is_word_char
 
-def check_ats_compatibility(text, resume_data):
+def load_check_weights(raw):
     """
-    Enhanced ATS compatibility checker
-    Returns detailed ATS score and recommendations
+    Parse per-check weight overrides. Weights must be non-negative ints:
+    scores are stored in DynamoDB, which rejects floats.
     """
-    score = 100
-    issues = []
-    recommendations = []
-    text_lower = text.lower()
+    try:
+        weights = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"ATS_CHECK_WEIGHTS is not valid JSON: {e}") from None
+    if not isinstance(weights, dict):
+        raise ValueError("ATS_CHECK_WEIGHTS must be a JSON object of check name -> weight")
+    for name, weight in weights.items():
+        if isinstance(weight, bool) or not isinstance(weight, int) or weight < 0:
+            raise ValueError(f"ATS_CHECK_WEIGHTS[{name!r}] must be a non-negative integer, got {weight!r}")
+    return weights
+
+# Per-check weight overrides, e.g. ATS_CHECK_WEIGHTS='{"density": 0}'
+ATS_CHECK_WEIGHTS = load_check_weights(os.environ.get('ATS_CHECK_WEIGHTS', '{}'))
+# Profiles cap the cost of the checks they run (None = no cap)
+ATS_PROFILES = {
+    'full': None,
+    'fast': int(os.environ.get('ATS_FAST_MAX_COST', '1'))
+}
+ATS_PROFILE = os.environ.get('ATS_PROFILE', 'full')
+
+# Keyword density: minimum tokens before it is checked, minimum unique/total ratio
+DENSITY_MIN_TOKENS = 100
+MIN_KEYWORD_DENSITY = 0.3
+
+def is_phone_separator(ch):
+    return ch in '-.' or ch.isspace()
+
+def is_phone_gap(gap):
+    """Text allowed between the area code and the exchange: ')' and/or one separator"""
+    if len(gap) == 1:
+        return gap == ')' or is_phone_separator(gap)
+    return len(gap) == 2 and gap[0] == ')' and is_phone_separator(gap[1])
+
+def has_phone_number(text, runs):
+    """
+    Whether patterns.PHONE matches anywhere, decided from the (start, end)
+    spans of the text's digit runs: 3+3+4 digits split across at most three
+    runs with the separators PHONE allows between them.
+    """
+    for i, (start, end) in enumerate(runs):
+        length = end - start
+        if length >= 10:
+            return True
+        if i + 1 == len(runs):
+            break
+        next_start, next_end = runs[i + 1]
+        next_length = next_end - next_start
+        gap = text[end:next_start]
+        # area code + exchange in one run, separator, line number
+        if length >= 6 and next_length >= 4 and len(gap) == 1 and is_phone_separator(gap):
+            return True
+        if length < 3 or not is_phone_gap(gap):
+            continue
+        # area code, gap, exchange + line number in one run
+        if next_length >= 7:
+            return True
+        # area code, gap, exchange, separator, line number
+        if next_length == 3 and i + 2 < len(runs):
+            last_start, last_end = runs[i + 2]
+            last_gap = text[next_end:last_start]
+            if last_end - last_start >= 4 and len(last_gap) == 1 and is_phone_separator(last_gap):
+                return True
+    return False
+
+def count_signals(text):
+    """
+    Dates, quantified achievements and phone presence from a single
+    patterns.ATS_SIGNALS pass over the text; the counts equal what
+    patterns.DATE, patterns.QUANTIFIED and patterns.PHONE would find.
+    """
+    dates_found = 0
+    numbers_found = 0
+    runs = []
+    text_end = len(text)
+    for match in patterns.ATS_SIGNALS.finditer(text):
+        start, end = match.span()
+        first = text[start]
+        if first.isalpha():
+            if match.group() in patterns.MONTHS:
+                dates_found += 1
+            continue
+        
+        # Digit run, possibly with a '$' prefix and a '%', '+' or 'x' suffix
+        digits_start = start + 1 if first == '$' else start
+        digits_end = end - 1 if text[end - 1] in '%+x' else end
+        if digits_start == digits_end:
+            continue
+        runs.append((digits_start, digits_end))
+        if end - start > digits_end - digits_start:
+            numbers_found += 1
+        # A standalone 19xx/20xx year
+        if (digits_end - digits_start == 4 and text.startswith(('19', '20'), digits_start)
+                and (digits_start == 0 or not is_word_char(text[digits_start - 1]))
+                and (digits_end == text_end or not is_word_char(text[digits_end]))):
+            dates_found += 1
     
-    # Check 1: Resume length (optimal 400-3000 chars)
-    text_length = len(text)
+    return {
+        'dates_found': dates_found,
+        'numbers_found': numbers_found,
+        'has_phone': has_phone_number(text, runs)
+    }
+
+def signal_features(doc, resume_data):
+    return count_signals(doc.text)
+
+def profile_features(doc, resume_data):
+    """Length, contact details and the extractor results"""
+    education = resume_data.get('education', [])
+    education_text = ' '.join(education).lower()
+    return {
+        'text_length': len(doc.text),
+        'skills_count': len(resume_data.get('skills', [])),
+        'has_education': bool(education),
+        'has_degree': any(deg in education_text for deg in patterns.DEGREE_KEYWORDS),
+        'has_positions': bool(resume_data.get('experience', {}).get('positions', [])),
+        'has_email': '@' in doc.text and '.' in doc.text
+    }
+
+# Section words, the skills label and strong verbs stay separate C substring
+# scans of the lowercased text: one overlapping-match regex over all of them
+# measured 4-7x slower than the ~27 scans together (about 30us on 2 KB)
+def section_features(doc, resume_data):
+    text_lower = doc.lower
+    return {
+        'has_skills_section': bool(patterns.SKILLS_LABEL.search(text_lower)),
+        'has_summary': any(word in text_lower for word in patterns.SUMMARY_WORDS),
+        'headers_found': sum(1 for header in patterns.STANDARD_SECTIONS if header in text_lower)
+    }
+
+def verb_features(doc, resume_data):
+    return {'verb_count': sum(1 for verb in patterns.STRONG_VERBS if verb in doc.lower)}
+
+def token_features(doc, resume_data):
+    return {'token_count': doc.token_count, 'unique_token_count': doc.unique_token_count}
+
+# Feature groups: each provider computes several features from one view of
+# the document; only 'signals' is a single regex pass
+FEATURE_GROUPS = {
+    'profile': profile_features,
+    'sections': section_features,
+    'verbs': verb_features,
+    'tokens': token_features,
+    'signals': signal_features
+}
+FEATURE_GROUP_OF = {
+    'text_length': 'profile', 'skills_count': 'profile', 'has_education': 'profile',
+    'has_degree': 'profile', 'has_positions': 'profile', 'has_email': 'profile',
+    'has_skills_section': 'sections', 'has_summary': 'sections', 'headers_found': 'sections',
+    'verb_count': 'verbs',
+    'token_count': 'tokens', 'unique_token_count': 'tokens',
+    'dates_found': 'signals', 'numbers_found': 'signals', 'has_phone': 'signals'
+}
+
+def scan_ats_features(text, resume_data, groups=None):
+    """Collect the features of the given groups (all by default) into a flat record"""
+    doc = ParsedDocument.of(text)
+    features = {}
+    for group in groups or FEATURE_GROUPS:
+        features.update(FEATURE_GROUPS[group](doc, resume_data))
+    return features
+
+# Check registry, in the order issues are reported. A check reads features
+# and returns (points, issue, recommendation) or None; issue and
+# recommendation are None for bonuses. cost is the relative price of the
+# feature groups it needs (1 is about 15us on a 2 KB resume), weight
+# multiplies its points (0 disables it)
+ATS_CHECKS = []
+
+def ats_check(name, inputs, cost=1, weight=1):
+    def register(func):
+        ATS_CHECKS.append({
+            'name': name,
+            'func': func,
+            'inputs': inputs,
+            'groups': tuple(dict.fromkeys(FEATURE_GROUP_OF[feature] for feature in inputs)),
+            'cost': cost,
+            'weight': ATS_CHECK_WEIGHTS.get(name, weight)
+        })
+        return func
+    return register
+
+@ats_check('length', inputs=('text_length',))
+def check_length(features):
+    """Resume length (optimal 400-3000 chars)"""
+    text_length = features['text_length']
     if text_length < 400:
-        score -= 25
-        issues.append("Resume is too brief - needs more detail")
-        recommendations.append("Expand your resume with detailed descriptions of your experience and achievements")
-    elif text_length > 5000:
-        score -= 10
-        issues.append("Resume is too lengthy")
-        recommendations.append("Condense to 1-2 pages focusing on most relevant experience")
-    
-    # Check 2: Skills section (critical for ATS)
-    skills_count = len(resume_data.get('skills', []))
-    
+        return (-25, "Resume is too brief - needs more detail",
+                "Expand your resume with detailed descriptions of your experience and achievements")
+    if text_length > 5000:
+        return (-10, "Resume is too lengthy",
+                "Condense to 1-2 pages focusing on most relevant experience")
+    return None
+
+@ats_check('skills', inputs=('skills_count', 'has_skills_section'))
+def check_skills(features):
+    """Skills section (critical for ATS)"""
+    skills_count = features['skills_count']
     # Check if there's a skills section even if we didn't detect many
-    has_skills_section = bool(re.search(r'(?:technical\s+)?skills?\s*:', text_lower, re.IGNORECASE))
+    has_skills_section = features['has_skills_section']
     
     if skills_count == 0 and not has_skills_section:
-        score -= 25
-        issues.append("No technical skills section detected")
-        recommendations.append("Add a dedicated Skills section with specific technologies and tools")
-    elif skills_count == 0 and has_skills_section:
-        score -= 10
-        issues.append("Skills section found but couldn't parse specific technologies")
-        recommendations.append("Use standard technology names (e.g., Python, JavaScript, AWS)")
-    elif skills_count < 3:
-        score -= 15
-        issues.append(f"Limited technical skills detected - add more relevant technologies")
-        recommendations.append("List 8-12 technical skills including languages, frameworks, and tools")
-    elif skills_count < 6:
-        score -= 5
-        issues.append("Good start on skills, but could list more")
-        recommendations.append("Expand skills section with additional relevant technologies")
-    elif skills_count >= 8:
-        score += 5  # Bonus for good skills coverage
-    
-    # Check 3: Education section
-    education = resume_data.get('education', [])
-    if not education:
-        score -= 15
-        issues.append("No education section found")
-        recommendations.append("Include degree, major, university, and graduation year")
-    else:
-        # Check for degree keywords
-        education_text = ' '.join(education).lower()
-        if any(deg in education_text for deg in ['bachelor', 'master', 'phd', 'degree', 'university']):
-            score += 5  # Bonus for clear education info
-    
-    # Check 4: Experience section with quantifiable details
-    experience = resume_data.get('experience', {})
-    positions = experience.get('positions', [])
-    years = experience.get('years', 0)
-    
-    if not positions:
-        score -= 20
-        issues.append("No work experience details detected")
-        recommendations.append("Add work history with company names, roles, dates, and responsibilities")
-    else:
-        # Check for date patterns (year formats)
-        date_patterns = r'\b(19|20)\d{2}\b|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
-        dates_found = len(re.findall(date_patterns, text))
-        if dates_found < 2:
-            score -= 10
-            issues.append("Missing dates in experience section")
-            recommendations.append("Include start and end dates for each position (MM/YYYY format)")
-    
-    # Check 5: Action verbs and impact statements
-    strong_verbs = [
-        'achieved', 'improved', 'developed', 'implemented', 'designed', 'managed',
-        'led', 'created', 'built', 'increased', 'reduced', 'optimized',
-        'established', 'launched', 'delivered', 'architected', 'engineered'
-    ]
-    verb_count = sum(1 for verb in strong_verbs if verb in text_lower)
-    
+        return (-25, "No technical skills section detected",
+                "Add a dedicated Skills section with specific technologies and tools")
+    if skills_count == 0 and has_skills_section:
+        return (-10, "Skills section found but couldn't parse specific technologies",
+                "Use standard technology names (e.g., Python, JavaScript, AWS)")
+    if skills_count < 3:
+        return (-15, "Limited technical skills detected - add more relevant technologies",
+                "List 8-12 technical skills including languages, frameworks, and tools")
+    if skills_count < 6:
+        return (-5, "Good start on skills, but could list more",
+                "Expand skills section with additional relevant technologies")
+    if skills_count >= 8:
+        return 5, None, None  # Bonus for good skills coverage
+    return None
+
+@ats_check('education', inputs=('has_education', 'has_degree'))
+def check_education(features):
+    """Education section"""
+    if not features['has_education']:
+        return (-15, "No education section found",
+                "Include degree, major, university, and graduation year")
+    if features['has_degree']:
+        return 5, None, None  # Bonus for clear education info
+    return None
+
+@ats_check('experience', inputs=('has_positions',))
+def check_experience(features):
+    """Experience section"""
+    if not features['has_positions']:
+        return (-20, "No work experience details detected",
+                "Add work history with company names, roles, dates, and responsibilities")
+    return None
+
+@ats_check('experience_dates', inputs=('has_positions', 'dates_found'), cost=4)
+def check_experience_dates(features):
+    """Dates (year formats, month names) alongside the work history"""
+    if features['has_positions'] and features['dates_found'] < 2:
+        return (-10, "Missing dates in experience section",
+                "Include start and end dates for each position (MM/YYYY format)")
+    return None
+
+@ats_check('action_verbs', inputs=('verb_count',))
+def check_action_verbs(features):
+    """Action verbs and impact statements"""
+    verb_count = features['verb_count']
     if verb_count < 3:
-        score -= 15
-        issues.append("Limited use of strong action verbs")
-        recommendations.append("Start bullet points with action verbs like 'developed', 'led', 'improved'")
-    elif verb_count >= 8:
-        score += 5  # Bonus for good verb usage
-    
-    # Check 6: Quantifiable achievements (numbers)
-    numbers = re.findall(r'\d+[%+]|\$\d+|\d+x', text)
-    if len(numbers) < 2:
-        score -= 10
-        issues.append("Few quantifiable achievements")
-        recommendations.append("Add metrics and numbers to demonstrate impact (e.g., 'improved performance by 40%')")
-    
-    # Check 7: Contact information completeness
-    has_email = '@' in text and '.' in text
-    has_phone = bool(re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text))
-    
-    if not has_email:
-        score -= 15
-        issues.append("No email address found")
-        recommendations.append("Add professional email address at the top of resume")
-    
-    if not has_phone:
-        score -= 5
-        issues.append("No phone number detected")
-        recommendations.append("Include phone number in contact section")
-    
-    # Check 8: Professional summary/objective
-    has_summary = any(word in text_lower for word in ['summary', 'objective', 'profile', 'about'])
-    if not has_summary and text_length > 500:
-        score -= 5
-        issues.append("No professional summary section")
-        recommendations.append("Consider adding a brief professional summary at the top")
-    
-    # Check 9: Keywords density (not too sparse, not keyword stuffing)
-    words = text_lower.split()
-    unique_words = set(words)
-    if len(words) > 100:  # Only check if substantial text
-        keyword_density = len(unique_words) / len(words)
-        if keyword_density < 0.3:  # Too repetitive
-            score -= 10
-            issues.append("Content appears repetitive")
-            recommendations.append("Diversify vocabulary and avoid excessive repetition")
-    
-    # Check 10: Section headers (good for ATS parsing)
-    section_headers = ['experience', 'education', 'skills', 'projects', 'certifications']
-    headers_found = sum(1 for header in section_headers if header in text_lower)
-    if headers_found < 3:
-        score -= 10
-        issues.append("Missing standard section headers")
-        recommendations.append("Use clear section headers: Experience, Education, Skills, etc.")
+        return (-15, "Limited use of strong action verbs",
+                "Start bullet points with action verbs like 'developed', 'led', 'improved'")
+    if verb_count >= 8:
+        return 5, None, None  # Bonus for good verb usage
+    return None
+
+@ats_check('quantified', inputs=('numbers_found',), cost=4)
+def check_quantified(features):
+    """Quantifiable achievements (numbers)"""
+    if features['numbers_found'] < 2:
+        return (-10, "Few quantifiable achievements",
+                "Add metrics and numbers to demonstrate impact (e.g., 'improved performance by 40%')")
+    return None
+
+@ats_check('email', inputs=('has_email',))
+def check_email(features):
+    """Contact information: email"""
+    if not features['has_email']:
+        return (-15, "No email address found",
+                "Add professional email address at the top of resume")
+    return None
+
+@ats_check('phone', inputs=('has_phone',), cost=4)
+def check_phone(features):
+    """Contact information: phone"""
+    if not features['has_phone']:
+        return (-5, "No phone number detected",
+                "Include phone number in contact section")
+    return None
+
+@ats_check('summary', inputs=('has_summary', 'text_length'))
+def check_summary(features):
+    """Professional summary/objective"""
+    if not features['has_summary'] and features['text_length'] > 500:
+        return (-5, "No professional summary section",
+                "Consider adding a brief professional summary at the top")
+    return None
+
+def is_repetitive(token_count, unique_token_count):
+    """
+    Substantial text with too few distinct tokens. Uses operators only, so
+    it also applies elementwise to NumPy arrays of non-negative counts.
+    """
+    # The guard keeps an empty text from dividing by zero
+    keyword_density = unique_token_count / (token_count + (token_count == 0))
+    return (token_count > DENSITY_MIN_TOKENS) & (keyword_density < MIN_KEYWORD_DENSITY)
+
+@ats_check('density', inputs=('token_count', 'unique_token_count'), cost=2)
+def check_density(features):
+    """Keywords density (not too sparse, not keyword stuffing)"""
+    if is_repetitive(features['token_count'], features['unique_token_count']):
+        return (-10, "Content appears repetitive",
+                "Diversify vocabulary and avoid excessive repetition")
+    return None
+
+@ats_check('section_headers', inputs=('headers_found',))
+def check_section_headers(features):
+    """Section headers (good for ATS parsing)"""
+    if features['headers_found'] < 3:
+        return (-10, "Missing standard section headers",
+                "Use clear section headers: Experience, Education, Skills, etc.")
+    return None
+
+def select_checks(profile='full'):
+    """Registered checks enabled by their weight and within the profile's cost cap"""
+    if profile not in ATS_PROFILES:
+        raise ValueError(f"Unknown ATS profile: {profile}")
+    max_cost = ATS_PROFILES[profile]
+    return [check for check in ATS_CHECKS
+            if check['weight'] and (max_cost is None or check['cost'] <= max_cost)]
+
+def run_ats_checks(text, resume_data, profile='full'):
+    """
+    Run the profile's checks, computing each feature group on first use.
+    Returns (result, timings, features) where timings maps check name to
+    microseconds, including the feature scans the check triggered.
+    """
+    doc = ParsedDocument.of(text)
+    features = {}
+    computed = set()
+    outcomes = []
+    timings = {}
+    for check in select_checks(profile):
+        start = time.perf_counter()
+        for group in check['groups']:
+            if group not in computed:
+                features.update(FEATURE_GROUPS[group](doc, resume_data))
+                computed.add(group)
+        outcomes.append((check, check['func'](features)))
+        timings[check['name']] = int((time.perf_counter() - start) * 1e6)
+    return summarize_checks(outcomes, profile), timings, features
+
+def check_ats_with_features(text, resume_data, profile=None):
+    """
+    check_ats_compatibility that also returns the feature record it scored
+    and the per-check timings: (result, features, timings)
+    """
+    result, timings, features = run_ats_checks(text, resume_data, profile or ATS_PROFILE)
+    return result, features, timings
+
+def check_ats_compatibility(text, resume_data, profile=None):
+    """
+    Enhanced ATS compatibility checker
+    Accepts a ParsedDocument (or raw text)
+    Returns detailed ATS score and recommendations
+    """
+    return check_ats_with_features(text, resume_data, profile)[0]
+
+def score_ats_features(features, profile='full'):
+    """Apply the profile's checks to a feature record from scan_ats_features"""
+    return summarize_checks([(check, check['func'](features)) for check in select_checks(profile)], profile)
+
+# Minimum score for each rating, best first
+ATS_RATINGS = ((85, "Excellent"), (70, "Good"), (50, "Fair"))
+LOWEST_ATS_RATING = "Needs Improvement"
+
+def ats_rating(score):
+    """Determine overall ATS compatibility"""
+    for minimum, rating in ATS_RATINGS:
+        if score >= minimum:
+            return rating
+    return LOWEST_ATS_RATING
+
+# Stored feature vector layout; bump the version when fields change.
+# Features a profile did not compute are stored as -1
+ATS_FEATURES_VERSION = 2
+FEATURE_VECTOR_FIELDS = (
+    'text_length', 'skills_count', 'has_skills_section', 'has_education', 'has_degree',
+    'has_positions', 'dates_found', 'verb_count', 'numbers_found', 'has_email',
+    'has_phone', 'has_summary', 'token_count', 'unique_token_count', 'headers_found'
+)
+
+def feature_vector(features):
+    """Compact list of ints for a feature record, in FEATURE_VECTOR_FIELDS order"""
+    return [int(features.get(name, -1)) for name in FEATURE_VECTOR_FIELDS]
+
+def vector_features(vector):
+    """Feature record for a stored vector, without the features that were not computed"""
+    return {name: value for name, value in zip(FEATURE_VECTOR_FIELDS, vector) if value >= 0}
+
+def summarize_checks(outcomes, profile):
+    """Total the points of (check, outcome) pairs into the ATS result"""
+    score = 100
+    issues = []
+    recommendations = []
+    for check, outcome in outcomes:
+        if outcome is None:
+            continue
+        points, issue, recommendation = outcome
+        score += points * check['weight']
+        if issue:
+            issues.append(issue)
+            recommendations.append(recommendation)
     
     # Ensure score is within bounds
     score = max(0, min(100, score))
     
-    # Determine overall ATS compatibility
-    if score >= 85:
-        ats_rating = "Excellent"
-    elif score >= 70:
-        ats_rating = "Good"
-    elif score >= 50:
-        ats_rating = "Fair"
-    else:
-        ats_rating = "Needs Improvement"
-    
     return {
         'score': score,
-        'rating': ats_rating,
+        'rating': ats_rating(score),
         'issues': issues[:8],  # Limit to top 8 issues
-        'recommendations': recommendations[:8]
+        'recommendations': recommendations[:8],
+        'profile': profile
     }
@@ -0,0 +1,203 @@
+"""
+Incremental ATS Scoring
+Keeps line-additive counters behind the ATS features, token counts
+included, so an edit only rescans the lines it changed and the text is
+not needed again. The state is plain JSON held by the client between
+requests; it grows with the resume's distinct tokens and lines. Hashes
+of the current lines let removed lines be checked before they are
+subtracted.
+"""
+import hashlib
+from collections import Counter
+
+import patterns
+from ats_checker import count_signals, score_ats_features
+
+# Bump when the state layout changes; older states are rejected and the
+# client starts over from the text
+STATE_VERSION = 2
+
+# Features that come from the extractors rather than the text counters;
+# they are carried over until the resume is parsed again
+EXTRACTED_FEATURES = ('skills_count', 'has_education', 'has_degree', 'has_positions')
+COUNTER_FIELDS = ('line_count', 'chars', 'token_count', 'dates', 'numbers', 'phone_lines', 'at_lines', 'dot_lines')
+# Substrings behind the section flags, counted by the lines containing them
+SKILLS_LABEL_MARKER = 'skills:'
+MARKERS = frozenset((SKILLS_LABEL_MARKER,) + patterns.SUMMARY_WORDS) | patterns.STANDARD_SECTIONS
+LINE_HASH_BYTES = 8
+
+
+def line_hash(line):
+    return hashlib.blake2b(line.encode('utf-8', 'surrogatepass'), digest_size=LINE_HASH_BYTES).hexdigest()
+
+
+def is_line_hash(key):
+    return len(key) == 2 * LINE_HASH_BYTES and all(c in '0123456789abcdef' for c in key)
+
+
+def is_token(key):
+    """A lowercased whitespace-free token as str.split yields it"""
+    return key.split() == [key] and key.lower() == key
+
+
+# Per-line counts kept by key, and a test for the keys each may hold
+KEYED_COUNTERS = {
+    'verbs': frozenset(patterns.STRONG_VERBS).__contains__,
+    'markers': MARKERS.__contains__,
+    'tokens': is_token,
+    'lines': is_line_hash
+}
+
+
+def bump(counts, key, delta):
+    """Add delta to counts[key], dropping keys that reach zero"""
+    value = counts.get(key, 0) + delta
+    if value > 0:
+        counts[key] = value
+    elif value == 0:
+        counts.pop(key, None)
+    else:
+        raise ValueError("edits remove lines the state does not contain")
+
+
+def add_lines(counters, lines, sign=1):
+    """Add (sign=1) or remove (sign=-1) the contribution of whole lines"""
+    for line in lines:
+        counters['line_count'] += sign
+        counters['chars'] += sign * len(line)
+        bump(counters['lines'], line_hash(line), sign)
+        signals = count_signals(line)
+        counters['dates'] += sign * signals['dates_found']
+        counters['numbers'] += sign * signals['numbers_found']
+        # A phone number (or "Skills" and its colon) split across lines is not seen line by line
+        counters['phone_lines'] += sign * signals['has_phone']
+        counters['at_lines'] += sign * ('@' in line)
+        counters['dot_lines'] += sign * ('.' in line)
+
+        line_lower = line.lower()
+        tokens = line_lower.split()
+        counters['token_count'] += sign * len(tokens)
+        for token in tokens:
+            bump(counters['tokens'], token, sign)
+        for verb in patterns.STRONG_VERBS:
+            if verb in line_lower:
+                bump(counters['verbs'], verb, sign)
+        if patterns.SKILLS_LABEL.search(line_lower):
+            bump(counters['markers'], SKILLS_LABEL_MARKER, sign)
+        for marker in MARKERS:
+            if marker != SKILLS_LABEL_MARKER and marker in line_lower:
+                bump(counters['markers'], marker, sign)
+
+
+def new_state(text, features):
+    """
+    Incremental state for a resume: counters over its lines plus the
+    extractor-derived entries of a feature record from scan_ats_features
+    """
+    counters = dict.fromkeys(COUNTER_FIELDS, 0)
+    counters.update({name: {} for name in KEYED_COUNTERS})
+    add_lines(counters, text.split('\n'))
+    return {
+        'version': STATE_VERSION,
+        'counters': counters,
+        'extracted': {name: int(features[name]) for name in EXTRACTED_FEATURES}
+    }
+
+
+def is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def validate_state(state):
+    """
+    A clean copy of a client-held state. Raises ValueError when a field is
+    missing, mistyped, negative or unknown.
+    """
+    if not isinstance(state, dict) or not isinstance(state.get('counters'), dict) \
+            or not isinstance(state.get('extracted'), dict):
+        raise ValueError("state must be an object with 'counters' and 'extracted' objects")
+    if state.get('version') != STATE_VERSION:
+        raise ValueError("state is from another version; send the text without a state to start over")
+    counters = {}
+    for name in COUNTER_FIELDS:
+        value = state['counters'].get(name)
+        if not is_count(value):
+            raise ValueError(f"state counter {name!r} must be a non-negative integer")
+        counters[name] = value
+    for name, is_key in KEYED_COUNTERS.items():
+        counts = state['counters'].get(name)
+        if not isinstance(counts, dict) or not all(is_key(key) and is_count(value) and value
+                                                   for key, value in counts.items()):
+            raise ValueError(f"state counter {name!r} must map known keys to positive integers")
+        counters[name] = dict(counts)
+    extracted = {}
+    for name in EXTRACTED_FEATURES:
+        value = state['extracted'].get(name)
+        # Flags arrive as booleans from older states
+        if isinstance(value, bool):
+            value = int(value)
+        if not is_count(value):
+            raise ValueError(f"state feature {name!r} must be a non-negative integer")
+        extracted[name] = value
+    return {'version': STATE_VERSION, 'counters': counters, 'extracted': extracted}
+
+
+def validate_edits(edits):
+    """Raise ValueError unless edits is a list of {'removed': [str], 'added': [str]}"""
+    if not isinstance(edits, list):
+        raise ValueError("edits must be a list")
+    for edit in edits:
+        if not isinstance(edit, dict):
+            raise ValueError("each edit must be an object with 'removed' and 'added' lines")
+        for field in ('removed', 'added'):
+            lines = edit.get(field, [])
+            if not isinstance(lines, list) or not all(isinstance(line, str) for line in lines):
+                raise ValueError(f"edit {field!r} must be a list of strings")
+
+
+def apply_edits(state, edits):
+    """
+    Update the state in place for a list of edits, each the lines of a
+    changed range before and after the edit: {'removed': [...], 'added': [...]}.
+    Raises ValueError, leaving the state partly edited, if an edit removes
+    a line the state does not hold.
+    """
+    counters = state['counters']
+    for edit in edits:
+        removed = edit.get('removed', [])
+        # Checked before anything is subtracted, so the counters never
+        # take off a line that was not counted in
+        wanted = Counter(line_hash(line) for line in removed)
+        if any(counters['lines'].get(key, 0) < count for key, count in wanted.items()):
+            raise ValueError("edits remove lines the state does not contain")
+        add_lines(counters, removed, -1)
+        add_lines(counters, edit.get('added', []))
+    if any(counters[name] < 0 for name in COUNTER_FIELDS):
+        raise ValueError("edits remove lines the state does not contain")
+    return state
+
+
+def state_features(state):
+    """Feature record equivalent to scan_ats_features on the edited text"""
+    counters = state['counters']
+    markers = counters['markers']
+    features = dict(state['extracted'])
+    features.update({
+        'text_length': max(0, counters['chars'] + counters['line_count'] - 1),
+        'has_email': counters['at_lines'] > 0 and counters['dot_lines'] > 0,
+        'has_skills_section': SKILLS_LABEL_MARKER in markers,
+        'has_summary': any(word in markers for word in patterns.SUMMARY_WORDS),
+        'headers_found': len(patterns.STANDARD_SECTIONS.intersection(markers)),
+        'verb_count': len(counters['verbs']),
+        'token_count': counters['token_count'],
+        'unique_token_count': len(counters['tokens']),
+        'dates_found': counters['dates'],
+        'numbers_found': counters['numbers'],
+        'has_phone': counters['phone_lines'] > 0
+    })
+    return features
+
+
+def rescore(state, profile='full'):
+    """ATS result for the current state"""
+    return score_ats_features(state_features(state), profile)
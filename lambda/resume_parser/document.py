@@ -0,0 +1,55 @@
+"""
+Parsed Document
+Normalizes resume text once and shares the derived views across extractors
+"""
+from functools import cached_property
+from sections import segment_sections
+
+
+class ParsedDocument:
+    """
+    Created once per resume in lambda_handler and passed to every extractor.
+    Each view (lowercased text, tokens, lines, sections, counts)
+    is computed on first access and cached on the instance.
+    """
+
+    def __init__(self, text):
+        self.text = text or ''
+
+    @classmethod
+    def of(cls, text_or_doc):
+        """Accept either a ParsedDocument or a raw string"""
+        if isinstance(text_or_doc, cls):
+            return text_or_doc
+        return cls(text_or_doc)
+
+    def __len__(self):
+        return len(self.text)
+
+    @cached_property
+    def lower(self):
+        """Lowercased text"""
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        """Whitespace tokens of the lowercased text"""
+        return self.lower.split()
+
+    @cached_property
+    def token_count(self):
+        return len(self.tokens)
+
+    @cached_property
+    def unique_token_count(self):
+        return len(set(self.tokens))
+
+    @cached_property
+    def lines(self):
+        """Lines of the original text"""
+        return self.text.split('\n')
+
+    @cached_property
+    def sections(self):
+        """SectionMap from the one-pass line classifier"""
+        return segment_sections(self.lines)
@@ -4,11 +4,21 @@ Extracts skills, education, and experience from uploaded resumes
 """
 import json
 import boto3
-import re
 import os
 from datetime import datetime
 import io
-from ats_checker import check_ats_compatibility
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote_plus
+from ats_checker import (ATS_FEATURES_VERSION, ATS_PROFILE, ATS_PROFILES, check_ats_with_features,
+                         feature_vector, scan_ats_features)
+import ats_incremental
+from document import ParsedDocument
+from lru_cache import LRUCache
+import parse_cache
+import patterns
+from process_pool import map_in_processes, worker_count
+from skill_matcher import SkillMatcher
 
 # Import PDF parsing
 try:
@@ -22,6 +32,27 @@ s3_client = boto3.client('s3')
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'ResumeAnalysisResults'))
 
+# PDF extraction budgets (portfolio PDFs can run to dozens of pages)
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', '20'))
+PDF_MAX_CHARS = int(os.environ.get('PDF_MAX_CHARS', '100000'))
+# A PDF whose first pages carry almost no text is treated as image-only
+PDF_PROBE_PAGES = int(os.environ.get('PDF_PROBE_PAGES', '3'))
+PDF_MIN_PROBE_CHARS = int(os.environ.get('PDF_MIN_PROBE_CHARS', '50'))
+# Documents with more pages than this are split across worker processes;
+# PDF_WORKERS=0 uses one worker per vCPU granted by the Lambda memory setting
+PDF_PARALLEL_PAGE_THRESHOLD = int(os.environ.get('PDF_PARALLEL_PAGE_THRESHOLD', '8'))
+PDF_WORKERS = int(os.environ.get('PDF_WORKERS', '0'))
+
+# Batched S3 notifications: downloads overlap on threads, parsing fans out
+# to worker processes (RECORD_WORKERS=0 uses one per vCPU)
+S3_DOWNLOAD_THREADS = int(os.environ.get('S3_DOWNLOAD_THREADS', '8'))
+RECORD_WORKERS = int(os.environ.get('RECORD_WORKERS', '0'))
+
+# Skill-candidate verdicts are memoized per container; SKILL_TABLE_PATH
+# optionally points at a precomputed table (see save_skill_table)
+SKILL_MEMO_SIZE = int(os.environ.get('SKILL_MEMO_SIZE', '8192'))
+SKILL_TABLE_PATH = os.environ.get('SKILL_TABLE_PATH', '')
+
 # Domain-specific skills database
 SKILLS_BY_DOMAIN = {
     'tech': [
@@ -92,6 +123,9 @@ SKILLS_BY_DOMAIN = {
 # For backward compatibility
 COMMON_SKILLS = SKILLS_BY_DOMAIN['tech']
 
+# One automaton per domain, built once per container and reused by every parse
+SKILL_MATCHERS = {domain: SkillMatcher(skills) for domain, skills in SKILLS_BY_DOMAIN.items()}
+
 # Domain detection keywords
 DOMAIN_KEYWORDS = {
     'tech': ['software', 'developer', 'engineer', 'programmer', 'coding', 'programming',
@@ -110,7 +144,7 @@ DOMAIN_KEYWORDS = {
 
 def detect_domain(text):
     """Detect the primary domain of a resume/job description"""
-    text_lower = text.lower()
+    text_lower = ParsedDocument.of(text).lower
     domain_scores = {}
     
     for domain, keywords in DOMAIN_KEYWORDS.items():
@@ -159,22 +193,23 @@ def looks_like_tech_skill(skill):
         return True
     
     # Pattern 6: Tech-specific word parts
-    tech_parts = ['script', 'base', 'flow', 'ware', 'sys', 'sql', 'data',
-                  'web', 'net', 'cloud', 'micro', 'api', 'dev', 'ops', 'bot',
-                  'app', 'mobile', 'server', 'client', 'proto', 'graph']
-    if any(part in skill_lower for part in tech_parts):
+    if patterns.TECH_WORD_PARTS.search(skill_lower):
         return True
     
     # Pattern 7: Common programming language patterns
-    lang_patterns = ['python', 'java', 'ruby', 'rust', 'swift', 'kotlin',
-                    'scala', 'perl', 'php', 'bash', 'shell', 'react', 'angular',
-                    'vue', 'node', 'django', 'flask', 'spring', 'docker', 'kubernetes']
-    if any(lang in skill_lower for lang in lang_patterns):
+    if patterns.LANGUAGE_PARTS.search(skill_lower):
         return True
     
     return False
 
-def is_valid_skill(skill):
+def is_soft_skill_shape(skill_lower):
+    """Whether a lowercased candidate has the shape of a soft skill or filler word"""
+    for suffixes, exceptions in patterns.SOFT_SKILL_SUFFIX_RULES:
+        if skill_lower.endswith(suffixes) and not (exceptions and exceptions.search(skill_lower)):
+            return True
+    return skill_lower in patterns.SOFT_SKILL_WORDS
+
+def classify_skill_candidate(skill):
     """Check if extracted skill is valid using pattern recognition"""
     skill_lower = skill.lower().strip()
     
@@ -182,125 +217,210 @@ def is_valid_skill(skill):
     if skill_lower in INVALID_SKILLS or len(skill_lower) < 2:
         return False
     
-    if not re.search(r'[a-zA-Z]', skill) or skill.isdigit():
+    if not patterns.HAS_LETTER.search(skill) or skill.isdigit():
         return False
     
     # Pattern-based soft skill detection (reject these)
-    soft_skill_patterns = [
-        # Ends in -ing (but not tech terms)
-        lambda s: s.endswith('ing') and not any(t in s for t in ['testing', 'programming', 'debugging', 'logging', 'caching', 'parsing', 'rendering', 'scaling', 'monitoring', 'computing', 'processing', 'engineering', 'modeling', 'training']),
-        # Ends in abstract noun suffixes
-        lambda s: s.endswith(('ness', 'ship', 'hood', 'dom')) and not any(t in s for t in ['relationship']),
-        # Ends in -tion/-sion (but not tech terms)
-        lambda s: s.endswith(('tion', 'sion')) and not any(t in s for t in ['authentication', 'authorization', 'implementation', 'configuration', 'automation', 'virtualization', 'integration', 'migration']),
-        # Ends in -ment (but not tech terms)
-        lambda s: s.endswith('ment') and not any(t in s for t in ['development', 'deployment', 'environment', 'management']),
-        # Ends in -ance/-ence
-        lambda s: s.endswith(('ance', 'ence')) and not any(t in s for t in ['performance', 'intelligence', 'compliance']),
-        # Ends in -ful/-ive/-able/-ible (adjectives)
-        lambda s: s.endswith(('ful', 'ive', 'able', 'ible', 'ous', 'ent', 'ant')),
-        # Common soft skill words
-        lambda s: s in {'clinical', 'others', 'matters', 'details', 'various', 'multiple',
-                       'several', 'strong', 'excellent', 'great', 'issues', 'needs',
-                       'results', 'benefits', 'values', 'people', 'teams', 'ways'}
-    ]
-    
-    # If it matches soft skill patterns, check if it has tech characteristics
-    if any(pattern(skill_lower) for pattern in soft_skill_patterns):
+    if is_soft_skill_shape(skill_lower):
         # Only accept if it clearly looks like a tech skill
         if not looks_like_tech_skill(skill):
             return False
     
     return True
 
-def extract_text_from_pdf(file_content):
-    """Extract text from PDF file"""
+def load_skill_table(path):
+    """Precomputed {candidate: verdict} table, or {} when there is none"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_skill_table(path, verdicts):
+    """Write a {candidate: verdict} table that load_skill_table can read"""
+    with open(path, 'w') as f:
+        json.dump(verdicts, f, sort_keys=True)
+
+skill_table = load_skill_table(SKILL_TABLE_PATH)
+skill_memo = LRUCache(SKILL_MEMO_SIZE)
+# Set to a dict to collect every fresh verdict (bulk ingestion builds its table this way)
+skill_verdict_log = None
+
+def is_valid_skill(skill):
+    """Memoized classify_skill_candidate; candidates recur across nearly every resume"""
+    verdict = skill_table.get(skill)
+    if verdict is None:
+        verdict = skill_memo.get(skill)
+    if verdict is None:
+        verdict = classify_skill_candidate(skill)
+        skill_memo.put(skill, verdict)
+        if skill_verdict_log is not None:
+            skill_verdict_log[skill] = verdict
+    return verdict
+
+def extract_page_range(file_content, start, stop):
+    """Worker body: open the document from its bytes and extract pages [start, stop)"""
+    pdf_document = fitz.open(stream=file_content, filetype="pdf")
+    try:
+        return [pdf_document[page_num].get_text() for page_num in range(start, stop)]
+    finally:
+        pdf_document.close()
+
+def extract_pages_parallel(file_content, start, stop, workers):
+    """Fan a page range out to worker processes and return page texts in order"""
+    chunk = -(-(stop - start) // workers)
+    ranges = [(file_content, first, min(first + chunk, stop)) for first in range(start, stop, chunk)]
+    pages = []
+    for (_, first, last), (ok, result) in zip(ranges, map_in_processes(extract_page_range, ranges, workers)):
+        if not ok:
+            print(f"Parallel extraction of pages {first}-{last} failed ({result}), retrying serially")
+            result = extract_page_range(file_content, first, last)
+        pages.extend(result)
+    return pages
+
+def iter_pdf_pages(pdf_document, file_content, max_pages):
+    """
+    Yield page text one page at a time, stopping at max_pages.
+    The probe pages are always read in-process so image-only documents are
+    rejected before any worker starts; the rest of a long document is
+    extracted in parallel when more than one vCPU is available.
+    """
+    pages_to_read = min(pdf_document.page_count, max_pages)
+    probe_pages = min(pages_to_read, PDF_PROBE_PAGES)
+    for page_num in range(probe_pages):
+        yield pdf_document[page_num].get_text()
+    
+    remaining = pages_to_read - probe_pages
+    workers = min(worker_count(PDF_WORKERS), remaining)
+    if remaining > PDF_PARALLEL_PAGE_THRESHOLD and workers > 1:
+        yield from extract_pages_parallel(file_content, probe_pages, pages_to_read, workers)
+    else:
+        for page_num in range(probe_pages, pages_to_read):
+            yield pdf_document[page_num].get_text()
+
+def extract_text_from_pdf(file_content, max_pages=None, max_chars=None):
+    """
+    Extract text from PDF file within page and character budgets
+    Returns (text, extraction) where extraction reports page count, pages read,
+    extracted bytes, truncation and whether a text layer was found.
+    text is None when the PDF could not be read at all.
+    """
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = PDF_MAX_CHARS if max_chars is None else max_chars
+    extraction = {
+        'page_count': 0,
+        'pages_read': 0,
+        'chars': 0,
+        'bytes': 0,
+        'truncated': False,
+        'text_layer': True
+    }
+    
     if fitz is None:
-        return None
+        return None, extraction
     
     try:
         pdf_document = fitz.open(stream=file_content, filetype="pdf")
-        text = ""
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            text += page.get_text()
-        pdf_document.close()
-        return text
     except Exception as e:
         print(f"Error extracting PDF text: {str(e)}")
-        return None
+        return None, extraction
+    
+    parts = []
+    chars = 0
+    probe_chars = 0
+    try:
+        extraction['page_count'] = pdf_document.page_count
+        for page_num, page_text in enumerate(iter_pdf_pages(pdf_document, file_content, max_pages)):
+            extraction['pages_read'] += 1
+            
+            # Bail out early on scanned/image-only documents
+            if page_num < PDF_PROBE_PAGES:
+                probe_chars += len(page_text.strip())
+                if page_num == PDF_PROBE_PAGES - 1 and probe_chars < PDF_MIN_PROBE_CHARS:
+                    extraction['text_layer'] = False
+                    break
+            
+            remaining = max_chars - chars
+            if len(page_text) > remaining:
+                parts.append(page_text[:remaining])
+                chars += remaining
+                extraction['truncated'] = True
+                break
+            parts.append(page_text)
+            chars += len(page_text)
+            if chars == max_chars:
+                # Budget exactly used: truncated below only if pages remain
+                break
+    except Exception as e:
+        print(f"Error extracting PDF text: {str(e)}")
+        return None, extraction
+    finally:
+        pdf_document.close()
+    
+    if probe_chars < PDF_MIN_PROBE_CHARS and extraction['pages_read'] < PDF_PROBE_PAGES:
+        # Short document that never reached the probe limit
+        extraction['text_layer'] = False
+    if not extraction['text_layer']:
+        parts = []
+    elif extraction['pages_read'] < extraction['page_count']:
+        extraction['truncated'] = True
+    
+    text = ''.join(parts)
+    extraction['chars'] = len(text)
+    extraction['bytes'] = len(text.encode('utf-8'))
+    return text, extraction
 
 def extract_skills(text):
     """Extract skills from resume text using domain-aware pattern matching"""
+    doc = ParsedDocument.of(text)
     found_skills = []
-    text_lower = text.lower()
+    text = doc.text
+    text_lower = doc.lower
     
     # Detect domain first
-    domain = detect_domain(text)
-    domain_skills = SKILLS_BY_DOMAIN.get(domain, SKILLS_BY_DOMAIN['tech'])
-    
-    # Method 1: Match against domain-specific skills list
-    for skill in domain_skills:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.append(skill)
-    
-    # Method 2: Extract from Skills section with enhanced parsing
-    skills_section_patterns = [
-        # "Skills:" or "Technical Skills:" section
-        r'(?:technical\s+)?skills?\s*:?\s*\n((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
-        # "Key Skills" or "Core Competencies"
-        r'(?:key|core)\s+(?:technical\s+)?(?:skills|competencies|technologies)\s*:?\s*\n((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
-        # "Technologies Used"
-        r'technologies?\s+(?:used|known|familiar)\s*:?\s*\n?((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
-        # "Programming Languages"
-        r'programming\s+languages?\s*:?\s*\n?((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)'
-    ]
-    
-    for pattern in skills_section_patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if match:
-            skills_text = match.group(1)
-            # Split by various separators
-            potential_skills = re.split(r'[,;•●○▪▫|・\n\t&]', skills_text)
+    domain = detect_domain(doc)
+    matcher = SKILL_MATCHERS.get(domain, SKILL_MATCHERS['tech'])
+    
+    # Method 1: Match against domain-specific skills list (single automaton pass)
+    found_skills.extend(matcher.find_terms(text_lower))
+    
+    # Method 2: Extract from the Skills section found by the section segmenter
+    skills_lines = []
+    for line in doc.sections.first_block('skills'):
+        # Drop sub-labels such as "Languages:" or "Frameworks:"
+        label, separator, rest = line.partition(':')
+        if separator and len(label.strip()) <= 30:
+            line = rest
+        skills_lines.append(line)
+    
+    if skills_lines:
+        skills_text = '\n'.join(skills_lines)
+        # Split by various separators
+        potential_skills = patterns.SKILL_SEPARATORS.split(skills_text)
+        
+        for skill in potential_skills:
+            skill = skill.strip()
+            # Remove leading bullets/dashes/numbers/parentheses
+            skill = patterns.SKILL_LEADING_NOISE.sub('', skill)
+            # Remove trailing parentheses content (e.g., "Python (Expert)")
+            skill = patterns.SKILL_TRAILING_PARENTHETICAL.sub('', skill)
+            skill = skill.strip()
             
-            for skill in potential_skills:
-                skill = skill.strip()
-                # Remove leading bullets/dashes/numbers/parentheses
-                skill = re.sub(r'^[-–—\s*\d.()[\]]+', '', skill)
-                # Remove trailing parentheses content (e.g., "Python (Expert)")
-                skill = re.sub(r'\s*\([^)]*\)\s*$', '', skill)
-                skill = skill.strip()
-                
-                if 2 <= len(skill) <= 35 and is_valid_skill(skill):
-                    found_skills.append(skill)
+            if 2 <= len(skill) <= 35 and is_valid_skill(skill):
+                found_skills.append(skill)
     
     # Method 3: ONLY extract well-known CamelCase tech terms (strict whitelist)
-    camel_case_tech = {
-        'JavaScript', 'TypeScript', 'DevOps', 'GraphQL', 'MongoDB', 'PostgreSQL',
-        'MySQL', 'DynamoDB', 'CloudFormation', 'CloudFront', 'GitHub', 'GitLab',
-        'BitBucket', 'TensorFlow', 'PyTorch', 'PowerShell', 'AutoCAD'
-    }
-    for tech in camel_case_tech:
+    for tech in patterns.CAMEL_CASE_TECH:
         if tech in text:
             found_skills.append(tech)
     
     # Method 4: ONLY extract known tech acronyms (strict whitelist)
-    tech_acronyms = {
-        'AWS', 'GCP', 'SQL', 'API', 'REST', 'HTTP', 'HTTPS', 'JSON', 'XML', 
-        'HTML', 'CSS', 'iOS', 'SDK', 'IDE', 'CLI', 'ORM', 'JWT',
-        'CI/CD', 'ML', 'AI', 'NLP', 'UI', 'UX', 'DOM', 'SPA',
-        'MVC', 'MVVM', 'TDD', 'BDD', 'OOP', 'ETL', 'CRUD', 'AJAX'
-    }
-    acronym_pattern = r'\b([A-Z]{2,6}(?:/[A-Z]{2,6})?)\b'
-    matches = re.findall(acronym_pattern, text)
+    matches = patterns.ACRONYM.findall(text)
     for match in matches:
-        if match in tech_acronyms:
+        if match in patterns.TECH_ACRONYMS:
             found_skills.append(match)
     
     # Method 5: Extract .js, .py framework names (node.js, vue.js, etc.)
-    dotjs_pattern = r'\b([a-z]+\.js)\b'
-    matches = re.findall(dotjs_pattern, text_lower)
+    matches = patterns.DOTJS_NAME.findall(text_lower)
     for match in matches:
         if len(match) <= 12:  # Reasonable length
             found_skills.append(match)
@@ -327,124 +447,321 @@ def extract_skills(text):
 
 def extract_education(text):
     """Extract education information"""
+    text = ParsedDocument.of(text).text
     education = []
     
     # Degree patterns
-    degree_patterns = [
-        r'(bachelor|b\.?s\.?|b\.?a\.?|master|m\.?s\.?|m\.?a\.?|phd|ph\.?d\.?|doctorate)\s+(of|in)?\s+([a-zA-Z\s]+)',
-        r'(undergraduate|graduate)\s+degree\s+in\s+([a-zA-Z\s]+)'
-    ]
-    
-    for pattern in degree_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in patterns.DEGREE_PATTERNS:
+        for match in pattern.finditer(text):
             education.append(match.group(0).strip())
     
     # Universities
-    university_pattern = r'(university|college|institute)\s+of\s+([a-zA-Z\s]+)|([a-zA-Z\s]+)\s+(university|college|institute)'
-    matches = re.finditer(university_pattern, text, re.IGNORECASE)
-    for match in matches:
+    for match in patterns.UNIVERSITY.finditer(text):
         education.append(match.group(0).strip())
     
     return list(set(education))[:5]  # Limit to 5 entries
 
+# Common job titles, matched in one pass like the skills dictionary
+JOB_TITLES = [
+    'software engineer', 'developer', 'data scientist', 'analyst', 'manager',
+    'architect', 'consultant', 'designer', 'administrator', 'specialist',
+    'lead', 'senior', 'junior', 'intern', 'director', 'coordinator'
+]
+JOB_TITLE_MATCHER = SkillMatcher(JOB_TITLES)
+
 def extract_experience(text):
     """Extract years of experience and job titles"""
+    doc = ParsedDocument.of(text)
     experience = {
         'years': 0,
         'positions': []
     }
     
     # Extract years of experience
-    year_patterns = [
-        r'(\d+)\+?\s*years?\s*(of)?\s*experience',
-        r'experience\s*[:\-]?\s*(\d+)\+?\s*years?'
-    ]
-    
-    for pattern in year_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in patterns.YEARS_OF_EXPERIENCE:
+        for match in pattern.finditer(doc.lower):
             years = int(match.group(1))
             if years > experience['years']:
                 experience['years'] = years
     
     # Extract job titles (common patterns)
-    job_titles = [
-        'software engineer', 'developer', 'data scientist', 'analyst', 'manager',
-        'architect', 'consultant', 'designer', 'administrator', 'specialist',
-        'lead', 'senior', 'junior', 'intern', 'director', 'coordinator'
-    ]
-    
-    for title in job_titles:
-        pattern = r'\b' + re.escape(title) + r'\b'
-        if re.search(pattern, text, re.IGNORECASE):
-            experience['positions'].append(title)
-    
-    experience['positions'] = list(set(experience['positions']))[:10]
+    experience['positions'] = JOB_TITLE_MATCHER.find_terms(doc.lower)[:10]
     
     return experience
 
+def parse_resume_bytes(key, file_content, ats_profile=ATS_PROFILE):
+    """Extract text from a resume file and run every extractor on it"""
+    # Extract text based on file type
+    extraction = None
+    if key.lower().endswith('.pdf'):
+        text, extraction = extract_text_from_pdf(file_content)
+        print(f"PDF extraction: {json.dumps(extraction)}")
+        if text is None:
+            text = file_content.decode('utf-8', errors='ignore')
+    else:
+        text = file_content.decode('utf-8', errors='ignore')
+    
+    # Parse resume (text is normalized once and shared by every extractor)
+    doc = ParsedDocument(text)
+    skills = extract_skills(doc)
+    education = extract_education(doc)
+    experience = extract_experience(doc)
+    
+    # Check ATS compatibility
+    ats_data, ats_features, ats_timings = check_ats_with_features(doc, {
+        'skills': skills,
+        'education': education,
+        'experience': experience
+    }, ats_profile)
+    print(f"ATS check timings (us): {json.dumps(ats_timings)}")
+    
+    parsed = {
+        'skills': skills,
+        'education': education,
+        'experience': experience,
+        'ats_score': ats_data,
+        # Lets scripts/rescore_ats.py re-rate stored resumes without their text
+        'ats_features': feature_vector(ats_features),
+        'ats_features_version': ATS_FEATURES_VERSION,
+        'raw_text_length': len(text)
+    }
+    if extraction is not None:
+        parsed['extraction'] = extraction
+    return parsed
+
+def cache_variant(ats_profile):
+    """Parse-cache key variant: results of non-default ATS profiles are cached apart"""
+    return '' if ats_profile == 'full' else f"ats-{ats_profile}"
+
+def fetch_resume_object(bucket, key, ats_profile=ATS_PROFILE):
+    """
+    Return (cached_parsed, cache_source, file_content, etag) for a resume in S3.
+    On a cache hit file_content is None; on a miss the object is downloaded.
+    """
+    # The ETag identifies the content without downloading it
+    head = s3_client.head_object(Bucket=bucket, Key=key)
+    cached, source = parse_cache.lookup(parse_cache.cache_key(etag=head.get('ETag'), variant=cache_variant(ats_profile)))
+    if cached is not None:
+        return cached, source, None, None
+    
+    # Download file from S3
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    return None, None, response['Body'].read(), response.get('ETag')
+
+def parse_resume_object(bucket, key, ats_profile=ATS_PROFILE):
+    """
+    Parse a resume stored in S3, reusing the cached result when the same
+    content was parsed before. Returns (parsed, cache_source).
+    """
+    cached, source, file_content, etag = fetch_resume_object(bucket, key, ats_profile)
+    if cached is not None:
+        return cached, source
+    
+    parsed = parse_resume_bytes(key, file_content, ats_profile)
+    # Key by the ETag of the bytes actually parsed (the object may have changed since the HEAD)
+    parse_cache.store(parse_cache.cache_key(etag=etag, content=file_content, variant=cache_variant(ats_profile)), parsed)
+    return parsed, None
+
+def build_analysis(key, parsed):
+    """Analysis record stored in DynamoDB for one parse request"""
+    analysis_id = f"{key.split('/')[-1]}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+    result = {
+        'analysis_id': analysis_id,
+        'resume_key': key
+    }
+    result.update(parsed)
+    result['parsed_at'] = datetime.now().isoformat()
+    result['status'] = 'parsed'
+    return result
+
+def parse_in_record_worker(key, file_content):
+    """
+    parse_resume_bytes in a record worker process. The records already use
+    every worker, so PDF pages are read serially instead of each record
+    starting its own page workers.
+    """
+    global PDF_WORKERS
+    PDF_WORKERS = 1
+    return parse_resume_bytes(key, file_content)
+
+def process_s3_records(records):
+    """
+    Parse every object in an S3 notification.
+    Downloads run on a thread pool, cache misses are parsed in worker
+    processes, and each record succeeds or fails on its own.
+    Returns one outcome per record, in record order:
+    {'key', 'status': 'parsed', 'analysis_id'} or {'key', 'status': 'failed', 'error'}.
+    """
+    objects = []
+    for record in records:
+        # Object keys arrive URL-encoded in S3 notifications
+        objects.append((record['s3']['bucket']['name'], unquote_plus(record['s3']['object']['key'])))
+    
+    # Indexed by record: the same key can appear twice when an object is overwritten
+    results = [None] * len(objects)
+    parsed_by_record = {}
+    
+    # Overlap the S3 round trips (HEAD, cache lookup, GET)
+    def fetch(bucket_key):
+        try:
+            return True, fetch_resume_object(*bucket_key)
+        except Exception as e:
+            return False, f"{type(e).__name__}: {e}"
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(S3_DOWNLOAD_THREADS, len(objects)))) as executor:
+        fetched = list(executor.map(fetch, objects))
+    
+    to_parse = []
+    for index, ((bucket, key), (ok, value)) in enumerate(zip(objects, fetched)):
+        if not ok:
+            results[index] = {'key': key, 'status': 'failed', 'error': value}
+        elif value[0] is not None:
+            parsed_by_record[index] = value[0]
+        else:
+            to_parse.append((index, key, value[2], value[3]))
+    
+    # Parsing is CPU-bound; a single miss is parsed in-process
+    workers = worker_count(RECORD_WORKERS)
+    if len(to_parse) > 1 and workers > 1:
+        outcomes = map_in_processes(parse_in_record_worker, [(key, content) for _, key, content, _ in to_parse], workers)
+    else:
+        outcomes = []
+        for _, key, content, _ in to_parse:
+            try:
+                outcomes.append((True, parse_resume_bytes(key, content)))
+            except Exception as e:
+                outcomes.append((False, f"{type(e).__name__}: {e}"))
+    
+    for (index, key, content, etag), (ok, value) in zip(to_parse, outcomes):
+        if ok:
+            parse_cache.store(parse_cache.cache_key(etag=etag, content=content, variant=cache_variant(ATS_PROFILE)), value)
+            parsed_by_record[index] = value
+        else:
+            results[index] = {'key': key, 'status': 'failed', 'error': value}
+    
+    for index, parsed in sorted(parsed_by_record.items()):
+        key = objects[index][1]
+        try:
+            result = build_analysis(key, parsed)
+            table.put_item(Item=result)
+            results[index] = {'key': key, 'status': 'parsed', 'analysis_id': result['analysis_id']}
+        except Exception as e:
+            results[index] = {'key': key, 'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+    
+    return results
+
+def handle_s3_event(records):
+    """
+    Parse the objects of an S3 notification. S3 invokes Lambda
+    asynchronously, so a failed record raises: the invocation is then
+    retried (and sent to the on-failure destination or DLQ after the last
+    attempt). Records that succeeded are served from the parse cache on
+    the retry.
+    """
+    results = process_s3_records(records)
+    print(f"Parse cache: {json.dumps(parse_cache.memory_cache.stats())}")
+    print(f"Skill memo: {json.dumps(skill_memo.stats())}")
+    failures = [outcome for outcome in results if outcome['status'] == 'failed']
+    for outcome in failures:
+        print(f"Error processing resume {outcome['key']}: {outcome['error']}")
+    if failures:
+        raise RuntimeError(f"Failed to parse {len(failures)} of {len(results)} resumes: "
+                           f"{', '.join(outcome['key'] for outcome in failures)}")
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': f"Parsed {len(results)} resumes",
+            'results': results
+        })
+    }
+
+def ats_rescore(body):
+    """
+    Live ATS scoring while a resume is edited. The first request sends the
+    'text' and gets back an incremental 'state'; later requests send that
+    state plus 'edits' (changed line ranges) and no text, so only those
+    lines are rescanned. Extractor results are carried over from the first
+    request. Raises ValueError for a malformed request.
+    """
+    start = time.perf_counter()
+    ats_profile = body.get('ats_profile') or ATS_PROFILE
+    if ats_profile not in ATS_PROFILES:
+        raise ValueError(f"Unknown ATS profile: {ats_profile}")
+    if 'state' in body:
+        state = ats_incremental.validate_state(body['state'])
+        edits = body.get('edits', [])
+        ats_incremental.validate_edits(edits)
+        ats_incremental.apply_edits(state, edits)
+    else:
+        text = body.get('text')
+        if not isinstance(text, str):
+            raise ValueError("text must be a string")
+        doc = ParsedDocument(text)
+        resume_data = {
+            'skills': extract_skills(doc),
+            'education': extract_education(doc),
+            'experience': extract_experience(doc)
+        }
+        features = scan_ats_features(doc, resume_data, groups=('profile',))
+        state = ats_incremental.new_state(doc.text, features)
+    ats_score = ats_incremental.rescore(state, ats_profile)
+    print(f"ATS rescore: {'incremental' if 'state' in body else 'initial'} in {(time.perf_counter() - start) * 1000:.2f} ms")
+    return {'ats_score': ats_score, 'state': state}
+
 def lambda_handler(event, context):
     """
     Lambda handler for resume parsing
     Triggered by S3 upload event or API Gateway request
     """
+    print(f"Received event: {json.dumps(event)}")
+    
+    # Handle S3 trigger (a notification may batch several uploads). Errors
+    # propagate so the asynchronous invocation is retried
+    if isinstance(event, dict) and event.get('Records') and event['Records'][0].get('eventSource') == 'aws:s3':
+        return handle_s3_event(event['Records'])
+    
     try:
-        print(f"Received event: {json.dumps(event)}")
-        
-        # Handle S3 trigger
-        if 'Records' in event and event['Records'][0].get('eventSource') == 'aws:s3':
-            bucket = event['Records'][0]['s3']['bucket']['name']
-            key = event['Records'][0]['s3']['object']['key']
         # Handle API Gateway request
-        elif 'body' in event:
+        if 'body' in event:
             body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
+            if body.get('action') == 'ats_rescore':
+                try:
+                    rescored = ats_rescore(body)
+                except ValueError as e:
+                    return {
+                        'statusCode': 400,
+                        'body': json.dumps({'error': str(e)})
+                    }
+                return {
+                    'statusCode': 200,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps(rescored)
+                }
             bucket = body.get('bucket')
             key = body.get('key')
+            # Callers under latency pressure can ask for the 'fast' ATS profile
+            ats_profile = body.get('ats_profile') or ATS_PROFILE
+            if ats_profile not in ATS_PROFILES:
+                return {
+                    'statusCode': 400,
+                    'body': json.dumps({'error': f"Unknown ATS profile: {ats_profile}"})
+                }
         else:
             return {
                 'statusCode': 400,
                 'body': json.dumps({'error': 'Invalid event format'})
             }
         
-        # Download file from S3
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        file_content = response['Body'].read()
-        
-        # Extract text based on file type
-        if key.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(file_content)
-            if text is None:
-                text = file_content.decode('utf-8', errors='ignore')
-        else:
-            text = file_content.decode('utf-8', errors='ignore')
-        
-        # Parse resume
-        skills = extract_skills(text)
-        education = extract_education(text)
-        experience = extract_experience(text)
-        
-        # Check ATS compatibility
-        ats_data = check_ats_compatibility(text, {
-            'skills': skills,
-            'education': education,
-            'experience': experience
-        })
+        # Parse (or reuse the cached parse of identical content)
+        parsed, cache_source = parse_resume_object(bucket, key, ats_profile)
+        print(f"Parse cache: {cache_source or 'miss'} {json.dumps(parse_cache.memory_cache.stats())}")
+        print(f"Skill memo: {json.dumps(skill_memo.stats())}")
         
-        # Prepare result
-        analysis_id = f"{key.split('/')[-1]}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        result = {
-            'analysis_id': analysis_id,
-            'resume_key': key,
-            'skills': skills,
-            'education': education,
-            'experience': experience,
-            'ats_score': ats_data,
-            'raw_text_length': len(text),
-            'parsed_at': datetime.now().isoformat(),
-            'status': 'parsed'
-        }
+        result = build_analysis(key, parsed)
+        analysis_id = result['analysis_id']
         
         # Store in DynamoDB
         table.put_item(Item=result)
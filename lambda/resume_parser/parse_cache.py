@@ -0,0 +1,79 @@
+"""
+Parse Cache
+Reuses parse results for identical resume content across invocations.
+An in-container LRU sits in front of a DynamoDB table keyed by content
+identity (S3 ETag or SHA-256 of the bytes) plus the extractor version.
+"""
+import hashlib
+import json
+import os
+import time
+
+import boto3
+
+from lru_cache import LRUCache
+
+# Bump whenever extraction or ATS logic changes so stale results are ignored
+EXTRACTOR_VERSION = '2'
+
+PARSE_CACHE_TABLE = os.environ.get('PARSE_CACHE_TABLE', 'ResumeParseCache')
+PARSE_CACHE_SIZE = int(os.environ.get('PARSE_CACHE_SIZE', '256'))
+PARSE_CACHE_TTL_DAYS = int(os.environ.get('PARSE_CACHE_TTL_DAYS', '30'))
+
+dynamodb = boto3.resource('dynamodb')
+cache_table = dynamodb.Table(PARSE_CACHE_TABLE)
+
+
+# Serialized JSON is cached so callers never share mutable results
+memory_cache = LRUCache(PARSE_CACHE_SIZE)
+
+
+def cache_key(etag=None, content=None, variant=''):
+    """
+    Key for a resume's parse result. Prefer the S3 ETag (available from a
+    HEAD request, before any download); fall back to hashing the bytes.
+    variant distinguishes parse options that change the result.
+    """
+    if etag:
+        identity = 'etag:' + etag.strip('"')
+    else:
+        identity = 'sha256:' + hashlib.sha256(content or b'').hexdigest()
+    key = f"v{EXTRACTOR_VERSION}:{identity}"
+    return f"{key}:{variant}" if variant else key
+
+
+def lookup(key):
+    """
+    Return (parsed, source) where source is 'memory', 'table' or None on a miss.
+    Table errors are logged and treated as misses.
+    """
+    cached = memory_cache.get(key)
+    if cached is not None:
+        return json.loads(cached), 'memory'
+
+    try:
+        response = cache_table.get_item(Key={'cache_key': key})
+    except Exception as e:
+        print(f"Parse cache lookup failed: {str(e)}")
+        return None, None
+
+    item = response.get('Item')
+    if not item:
+        return None, None
+    memory_cache.put(key, item['parsed'])
+    return json.loads(item['parsed']), 'table'
+
+
+def store(key, parsed):
+    """Save a parse result in both cache levels"""
+    serialized = json.dumps(parsed)
+    memory_cache.put(key, serialized)
+    try:
+        cache_table.put_item(Item={
+            'cache_key': key,
+            'parsed': serialized,
+            'extractor_version': EXTRACTOR_VERSION,
+            'expires_at': int(time.time()) + PARSE_CACHE_TTL_DAYS * 86400
+        })
+    except Exception as e:
+        print(f"Parse cache store failed: {str(e)}")
@@ -0,0 +1,103 @@
+"""
+Pattern Registry
+Regexes and lookup tables used by the extractors and the ATS checker,
+compiled and frozen once per container instead of on every call.
+"""
+import re
+
+
+def any_substring(parts):
+    """One compiled alternation equivalent to any(part in s for part in parts)"""
+    return re.compile('|'.join(re.escape(part) for part in parts))
+
+
+# Skill validation (is_valid_skill / looks_like_tech_skill)
+HAS_LETTER = re.compile(r'[a-zA-Z]')
+
+TECH_WORD_PARTS = any_substring([
+    'script', 'base', 'flow', 'ware', 'sys', 'sql', 'data',
+    'web', 'net', 'cloud', 'micro', 'api', 'dev', 'ops', 'bot',
+    'app', 'mobile', 'server', 'client', 'proto', 'graph'
+])
+LANGUAGE_PARTS = any_substring([
+    'python', 'java', 'ruby', 'rust', 'swift', 'kotlin',
+    'scala', 'perl', 'php', 'bash', 'shell', 'react', 'angular',
+    'vue', 'node', 'django', 'flask', 'spring', 'docker', 'kubernetes'
+])
+
+# Soft-skill shapes as (suffixes, tech terms that exempt a match or None)
+SOFT_SKILL_SUFFIX_RULES = (
+    # Ends in -ing (but not tech terms)
+    (('ing',), any_substring(['testing', 'programming', 'debugging', 'logging', 'caching', 'parsing',
+                              'rendering', 'scaling', 'monitoring', 'computing', 'processing',
+                              'engineering', 'modeling', 'training'])),
+    # Ends in abstract noun suffixes
+    (('ness', 'ship', 'hood', 'dom'), any_substring(['relationship'])),
+    # Ends in -tion/-sion (but not tech terms)
+    (('tion', 'sion'), any_substring(['authentication', 'authorization', 'implementation', 'configuration',
+                                      'automation', 'virtualization', 'integration', 'migration'])),
+    # Ends in -ment (but not tech terms)
+    (('ment',), any_substring(['development', 'deployment', 'environment', 'management'])),
+    # Ends in -ance/-ence
+    (('ance', 'ence'), any_substring(['performance', 'intelligence', 'compliance'])),
+    # Ends in -ful/-ive/-able/-ible (adjectives)
+    (('ful', 'ive', 'able', 'ible', 'ous', 'ent', 'ant'), None)
+)
+SOFT_SKILL_WORDS = frozenset({
+    'clinical', 'others', 'matters', 'details', 'various', 'multiple',
+    'several', 'strong', 'excellent', 'great', 'issues', 'needs',
+    'results', 'benefits', 'values', 'people', 'teams', 'ways'
+})
+
+# Skills section splitting and cleanup (extract_skills)
+SKILL_SEPARATORS = re.compile(r'[,;•●○▪▫|・\n\t&]')
+SKILL_LEADING_NOISE = re.compile(r'^[-–—\s*\d.()[\]]+')
+SKILL_TRAILING_PARENTHETICAL = re.compile(r'\s*\([^)]*\)\s*$')
+
+CAMEL_CASE_TECH = (
+    'JavaScript', 'TypeScript', 'DevOps', 'GraphQL', 'MongoDB', 'PostgreSQL',
+    'MySQL', 'DynamoDB', 'CloudFormation', 'CloudFront', 'GitHub', 'GitLab',
+    'BitBucket', 'TensorFlow', 'PyTorch', 'PowerShell', 'AutoCAD'
+)
+TECH_ACRONYMS = frozenset({
+    'AWS', 'GCP', 'SQL', 'API', 'REST', 'HTTP', 'HTTPS', 'JSON', 'XML',
+    'HTML', 'CSS', 'iOS', 'SDK', 'IDE', 'CLI', 'ORM', 'JWT',
+    'CI/CD', 'ML', 'AI', 'NLP', 'UI', 'UX', 'DOM', 'SPA',
+    'MVC', 'MVVM', 'TDD', 'BDD', 'OOP', 'ETL', 'CRUD', 'AJAX'
+})
+ACRONYM = re.compile(r'\b([A-Z]{2,6}(?:/[A-Z]{2,6})?)\b')
+DOTJS_NAME = re.compile(r'\b([a-z]+\.js)\b')
+
+# Education and experience
+DEGREE_PATTERNS = (
+    re.compile(r'(bachelor|b\.?s\.?|b\.?a\.?|master|m\.?s\.?|m\.?a\.?|phd|ph\.?d\.?|doctorate)\s+(of|in)?\s+([a-zA-Z\s]+)', re.IGNORECASE),
+    re.compile(r'(undergraduate|graduate)\s+degree\s+in\s+([a-zA-Z\s]+)', re.IGNORECASE)
+)
+UNIVERSITY = re.compile(r'(university|college|institute)\s+of\s+([a-zA-Z\s]+)|([a-zA-Z\s]+)\s+(university|college|institute)', re.IGNORECASE)
+YEARS_OF_EXPERIENCE = (
+    re.compile(r'(\d+)\+?\s*years?\s*(of)?\s*experience'),
+    re.compile(r'experience\s*[:\-]?\s*(\d+)\+?\s*years?')
+)
+
+# ATS checks. DATE, QUANTIFIED and PHONE define the signals; the ATS
+# scanner derives the same counts from one ATS_SIGNALS pass. Precompiling
+# them alone gains nothing over inline re calls, which re caches
+DATE = re.compile(r'\b(19|20)\d{2}\b|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+QUANTIFIED = re.compile(r'\d+[%+]|\$\d+|\d+x')
+PHONE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+# Digit runs with an optional '$' prefix and '%', '+' or 'x' suffix, and
+# month-shaped words (filtered against MONTHS). Every branch starts with a
+# character class so the engine can skip ahead between candidates
+ATS_SIGNALS = re.compile(r'[$\d]\d*[%+x]?|[JFMASOND](?:an|eb|ar|pr|ay|un|ul|ug|ep|ct|ov|ec)')
+MONTHS = frozenset({'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'})
+DEGREE_KEYWORDS = ('bachelor', 'master', 'phd', 'degree', 'university')
+STRONG_VERBS = (
+    'achieved', 'improved', 'developed', 'implemented', 'designed', 'managed',
+    'led', 'created', 'built', 'increased', 'reduced', 'optimized',
+    'established', 'launched', 'delivered', 'architected', 'engineered'
+)
+# Heading signals are substring hits anywhere in the text, so compound
+# headings ("Skills & Tools") and inline labels count
+SKILLS_LABEL = re.compile(r'(?:technical\s+)?skills?\s*:')
+SUMMARY_WORDS = ('summary', 'objective', 'profile', 'about')
+STANDARD_SECTIONS = frozenset({'experience', 'education', 'skills', 'projects', 'certifications'})
@@ -0,0 +1,65 @@
+"""
+Process Pool
+Small process fan-out built on multiprocessing.Process and Pipe.
+multiprocessing.Pool and concurrent.futures.ProcessPoolExecutor need /dev/shm,
+which the Lambda runtime does not provide; Process and Pipe work there.
+"""
+import multiprocessing
+import os
+from multiprocessing.connection import wait
+
+
+def available_cpus():
+    """CPUs this process may run on (Lambda grants vCPUs with memory size)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(limit=0):
+    """Number of workers to use; limit <= 0 means one per available CPU"""
+    cpus = available_cpus()
+    return max(1, min(cpus, limit) if limit > 0 else cpus)
+
+
+def _run(conn, func, args):
+    """Child process body: run func and send (ok, result_or_error) back"""
+    try:
+        conn.send((True, func(*args)))
+    except Exception as e:
+        conn.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def map_in_processes(func, arg_list, max_workers):
+    """
+    Call func(*args) for every tuple in arg_list, each in its own child
+    process, with at most max_workers running at once.
+    Returns a list of (ok, result_or_error) in input order; a failing item
+    does not affect the others.
+    """
+    results = [None] * len(arg_list)
+    pending = list(enumerate(arg_list))
+    pending.reverse()
+    running = {}
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            index, args = pending.pop()
+            reader, writer = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_run, args=(writer, func, args))
+            process.start()
+            writer.close()
+            running[reader] = (index, process)
+
+        for reader in wait(list(running)):
+            index, process = running.pop(reader)
+            try:
+                results[index] = reader.recv()
+            except EOFError:
+                results[index] = (False, f"worker exited with code {process.exitcode}")
+            reader.close()
+            process.join()
+
+    return results
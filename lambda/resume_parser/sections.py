@@ -0,0 +1,148 @@
+"""
+Resume Section Segmenter
+Splits resume text into sections with a single pass over its lines
+"""
+import re
+
+# Canonical section -> heading phrases that introduce it (compared lowercased,
+# whitespace-collapsed and without trailing colon/decoration)
+SECTION_HEADINGS = {
+    'summary': [
+        'summary', 'professional summary', 'career summary', 'executive summary',
+        'profile', 'professional profile', 'objective', 'career objective',
+        'about', 'about me'
+    ],
+    'skills': [
+        'skills', 'skill', 'technical skills', 'key skills', 'core skills',
+        'key technical skills', 'core technical skills', 'core competencies',
+        'key competencies', 'competencies', 'technologies', 'core technologies',
+        'key technologies', 'technologies used', 'technologies known',
+        'technologies familiar', 'technical proficiencies', 'technical expertise',
+        'programming languages', 'programming language', 'tools and technologies',
+        'skills and technologies', 'tech stack'
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history'
+    ],
+    'education': [
+        'education', 'academic background', 'academics', 'education and training',
+        'educational background'
+    ],
+    'projects': [
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'selected projects', 'project experience'
+    ],
+    'certifications': [
+        'certifications', 'certification', 'certificates', 'licenses and certifications',
+        'licenses & certifications', 'courses and certifications'
+    ]
+}
+
+HEADING_LOOKUP = {
+    phrase: section
+    for section, phrases in SECTION_HEADINGS.items()
+    for phrase in phrases
+}
+
+# Lines longer than this are never treated as headings
+MAX_HEADING_LENGTH = 60
+
+# Characters commonly used to decorate headings ("== SKILLS ==", "# Education")
+HEADING_DECORATION = ' \t:-–—=_*#•|'
+
+# Joins the parts of compound headings ("Skills & Tools", "Education and Certifications")
+HEADING_JOINERS = re.compile(r'\s*(?:&|\band\b|/)\s*')
+
+
+class Section:
+    """A run of lines belonging to one resume section"""
+
+    __slots__ = ('name', 'heading', 'start', 'end', 'inline')
+
+    def __init__(self, name, heading, start, inline=''):
+        self.name = name
+        self.heading = heading
+        self.start = start  # first body line index
+        self.end = start    # one past the last body line index
+        self.inline = inline  # content on the heading line after "Heading:"
+
+    def __repr__(self):
+        return f"Section({self.name!r}, lines {self.start}-{self.end})"
+
+
+class SectionMap:
+    """Ordered sections of a document with lookup by canonical name"""
+
+    def __init__(self, lines, sections):
+        self._lines = lines
+        self.sections = sections
+
+    def get(self, name):
+        """All sections with the given canonical name"""
+        return [section for section in self.sections if section.name == name]
+
+    def first_block(self, name):
+        """
+        Lines of the named section(s) up to the first blank line after some
+        content. Skills lists end there even when the next heading is unknown.
+        """
+        block = []
+        for section in self.get(name):
+            lines = [section.inline] if section.inline else []
+            for line in self._lines[section.start:section.end]:
+                if line.strip():
+                    lines.append(line)
+                elif lines:
+                    break
+            block.extend(lines)
+        return block
+
+
+def classify_heading(line):
+    """
+    Return (section_name, inline_content) if the line is a known section
+    heading, otherwise None. Only known phrases count: all-caps company names
+    and "Frameworks:" sub-labels are too common inside sections to treat
+    unknown heading-shaped lines as breaks. A compound heading ("Skills &
+    Tools") counts when one of its parts is a known phrase.
+    """
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_HEADING_LENGTH:
+        return None
+
+    label, _, inline = stripped.partition(':')
+    key = ' '.join(label.strip(HEADING_DECORATION).lower().split())
+    if not key:
+        return None
+
+    section = HEADING_LOOKUP.get(key)
+    if section is None:
+        # A compound heading belongs to its first known part
+        parts = HEADING_JOINERS.split(key)
+        section = next((HEADING_LOOKUP[part] for part in parts if part in HEADING_LOOKUP), None)
+        if section is None:
+            return None
+    return section, inline.strip()
+
+
+def segment_sections(lines):
+    """
+    Single pass over the lines. Lines before the first heading are collected
+    under 'header' (name, contact details).
+    """
+    sections = []
+    current = Section('header', '', 0)
+    for index, line in enumerate(lines):
+        heading = classify_heading(line)
+        if heading is None:
+            continue
+        current.end = index
+        if current.end > current.start or current.inline or current.name != 'header':
+            sections.append(current)
+        name, inline = heading
+        current = Section(name, line.strip(), index + 1, inline)
+    current.end = len(lines)
+    if current.end > current.start or current.inline or current.name != 'header':
+        sections.append(current)
+    return SectionMap(lines, sections)
@@ -0,0 +1,111 @@
+"""
+Skill Matcher
+Aho-Corasick automaton that finds every dictionary term in one pass over the text
+"""
+
+
+def is_word_char(ch):
+    """Same notion of a word character as the regex \\w class"""
+    return ch.isalnum() or ch == '_'
+
+
+class SkillMatcher:
+    """
+    Multi-pattern matcher built once from a term dictionary.
+    Scanning is linear in the text length regardless of dictionary size.
+
+    With word_boundaries=True a match is only reported when it is not glued
+    to surrounding word characters. The check is applied per edge and only
+    when the term itself starts/ends with a word character, so 'c++' and
+    '.net' match in 'c++ and .net' while 'java' does not match 'javascript'.
+    """
+
+    def __init__(self, terms, word_boundaries=True):
+        self.word_boundaries = word_boundaries
+        self.terms = []
+        self._lengths = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+
+        seen = set()
+        for term in terms:
+            if term and term not in seen:
+                seen.add(term)
+                self._insert(term)
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _insert(self, term):
+        """Add a term to the trie"""
+        state = 0
+        for ch in term:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (len(self.terms),)
+        self.terms.append(term)
+        self._lengths.append(len(term))
+
+    def _build_failure_links(self):
+        """Breadth-first pass computing failure links and merged outputs"""
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _at_boundary(self, text, start, end):
+        """Check that a match is not part of a longer word"""
+        if start > 0 and is_word_char(text[start]) and is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and is_word_char(text[end - 1]) and is_word_char(text[end]):
+            return False
+        return True
+
+    def find_all(self, text):
+        """
+        Return (start, end, term) for every occurrence, overlaps included.
+        The text must already be normalised the same way as the terms (lowercase).
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        lengths = self._lengths
+        terms = self.terms
+        check = self.word_boundaries
+
+        matches = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for idx in out[state]:
+                    start = end - lengths[idx]
+                    if not check or self._at_boundary(text, start, end):
+                        matches.append((start, end, terms[idx]))
+        return matches
+
+    def find_terms(self, text):
+        """Return the distinct terms present in the text, in dictionary order"""
+        present = {term for _, _, term in self.find_all(text)}
+        return [term for term in self.terms if term in present]
@@ -0,0 +1,274 @@
+"""
+Batch Scoring
+Scores one resume against many job descriptions in one pass and ranks
+them. Jobs are laid out as a sparse document-term matrix (one entry per
+job and term), so similarities, tech-term boosts and the final weighted
+scores are computed for every job at once with NumPy, which
+requirements.txt bundles with the function. Where NumPy is not installed
+(local tools and tests) it falls back to the single-job functions; the
+unit tests run both paths.
+
+Scores equal what the single-job scorer computes for each pair (to
+float rounding in the cosine sums).
+
+When only the top K are wanted, jobs are ranked in two stages: a cheap
+upper bound on every job's score, then full scoring in bound order
+until no job left can reach the K-th score.
+"""
+import heapq
+import math
+from collections import Counter
+
+import lambda_function as scorer
+from sparse import Vocabulary
+
+try:
+    import numpy as np
+except ImportError:  # bundled in the Lambda package; optional for local runs
+    np = None
+
+# log(2 / (1 + 2)): per-pair IDF of a term both documents share when no
+# corpus artifact is deployed; terms in only one document get log(1) = 0
+PAIR_SHARED_IDF = math.log(2 / 3)
+# Jobs fully scored per cascade round (at least K)
+CASCADE_BATCH = 64
+# Covers float rounding between a bound and the score it bounds
+BOUND_SLACK = 1e-6
+
+
+def job_term_matrix(job_tokens, vocabulary):
+    """CSR-style (row_of_entry, term_ids, tf) arrays for tokenized jobs"""
+    rows, term_ids, tf = [], [], []
+    for row, tokens in enumerate(job_tokens):
+        token_count = len(tokens)
+        for token, count in Counter(tokens).items():
+            rows.append(row)
+            term_ids.append(vocabulary.intern(token))
+            tf.append(count / token_count)
+    return np.array(rows, dtype=np.int64), np.array(term_ids, dtype=np.int64), np.array(tf)
+
+
+def similarity_scores(resume_tokens, job_tokens):
+    """calculate_enhanced_similarity of the resume against every job, as an array"""
+    vocabulary = Vocabulary()
+    rows, term_ids, job_tf = job_term_matrix(job_tokens, vocabulary)
+    n_jobs = len(job_tokens)
+
+    resume_counts = Counter(resume_tokens)
+    resume_ids = [vocabulary.intern(token) for token in resume_counts]
+    size = len(vocabulary)
+    resume_tf = np.zeros(size)
+    if resume_tokens:
+        resume_tf[resume_ids] = [count / len(resume_tokens) for count in resume_counts.values()]
+    in_resume = resume_tf > 0
+    resume_tech = np.zeros(size, dtype=bool)
+    resume_tech[resume_ids] = [scorer.is_technical_keyword(token) for token in resume_counts]
+
+    shared = in_resume[term_ids]
+    if scorer.idf_table is not None:
+        tokens_by_id = list(vocabulary.ids)
+        idf = np.array([scorer.idf_table.get(token) for token in tokens_by_id])
+        resume_weights = resume_tf * idf
+        job_weights = job_tf * idf[term_ids]
+        resume_norm = math.sqrt(float(resume_weights @ resume_weights))
+        job_norms = np.sqrt(np.bincount(rows, weights=job_weights * job_weights, minlength=n_jobs))
+        dots = np.bincount(rows, weights=resume_weights[term_ids] * job_weights, minlength=n_jobs)
+        norms = resume_norm * job_norms
+    else:
+        # Two-document IDF per pair: only shared terms carry weight
+        resume_weights = np.where(shared, resume_tf[term_ids] * PAIR_SHARED_IDF, 0.0)
+        job_weights = np.where(shared, job_tf * PAIR_SHARED_IDF, 0.0)
+        dots = np.bincount(rows, weights=resume_weights * job_weights, minlength=n_jobs)
+        norms = (np.sqrt(np.bincount(rows, weights=resume_weights * resume_weights, minlength=n_jobs)) *
+                 np.sqrt(np.bincount(rows, weights=job_weights * job_weights, minlength=n_jobs)))
+
+    base = np.divide(dots, norms, out=np.zeros(n_jobs), where=norms > 0)
+    shared_tech = np.bincount(rows, weights=shared & resume_tech[term_ids], minlength=n_jobs)
+    tech_boost = np.minimum(scorer.TECH_BOOST_MAX, shared_tech * scorer.TECH_BOOST_PER_TERM)
+    return np.minimum(1.0, base + tech_boost)
+
+
+def resolve_jobs(jobs):
+    """
+    ([{'title'[, 'jd_id']}], [JobProfile], errors) for jobs given as
+    [{'title', 'description'}] or [{'jd_id'}] of registered jobs. Jobs with
+    an unknown id or a blank description are left out and reported in
+    errors as {'index', 'jd_id' or 'title', 'error'}.
+    """
+    registered = scorer.registered_jobs([job['jd_id'] for job in jobs if job.get('jd_id')])
+    # Profiles are held here as well as in the container cache, so a batch
+    # larger than the cache never rebuilds one
+    resolved, profiles, errors = [], [], []
+    for i, job in enumerate(jobs):
+        if job.get('jd_id') in registered:
+            title, profile = registered[job['jd_id']]
+            resolved.append({'title': job.get('title') or title, 'jd_id': job['jd_id']})
+            profiles.append(profile)
+        elif (job.get('description') or '').strip():
+            resolved.append(job)
+            profiles.append(scorer.job_profile(job['description']))
+        elif job.get('jd_id'):
+            errors.append({'index': i, 'jd_id': job['jd_id'], 'error': 'Job description not found'})
+        else:
+            errors.append({'index': i, 'title': job.get('title', 'Untitled Job'), 'error': 'Empty job description'})
+    return resolved, profiles, errors
+
+
+def score_profiles(resume_data, profiles):
+    """
+    (scores, skill_match, matched_counts, resume_skill_count) of one resume
+    against each JobProfile, unrounded
+    """
+    resume_text = scorer.build_resume_text(resume_data)
+    resume_skill_set = scorer.normalize_resume_skills(resume_data.get('skills', []))
+    matched_counts = [
+        len(scorer.match_resume_skills(resume_skill_set, profile.lower, profile.token_set, profile.canonical_skills))
+        for profile in profiles
+    ] if resume_skill_set else [0] * len(profiles)
+    experience = [scorer.experience_relevance(resume_data, profile) for profile in profiles]
+    education = scorer.education_relevance(resume_data)
+
+    if np is not None:
+        similarity = similarity_scores(scorer.tokenize(resume_text), [profile.tokens for profile in profiles])
+        counts = np.array(matched_counts)
+        skill_match = counts / len(resume_skill_set) * 100 if resume_skill_set else np.zeros(len(profiles))
+        scores = np.clip(scorer.combine_scores(similarity, skill_match, np.array(experience), education), 0, 100)
+        scores, skill_match = scores.tolist(), skill_match.tolist()
+    else:
+        similarity = [scorer.calculate_enhanced_similarity(resume_text, profile) for profile in profiles]
+        skill_match = [count / len(resume_skill_set) * 100 if resume_skill_set else 0.0 for count in matched_counts]
+        scores = [min(100, max(0, scorer.combine_scores(*components)))
+                  for components in zip(similarity, skill_match, experience, [education] * len(profiles))]
+    return scores, skill_match, matched_counts, len(resume_skill_set)
+
+
+def upper_bounds(resume_data, profiles):
+    """
+    Upper bound on score_profiles' score of one resume against each
+    JobProfile. Skill match counts the resume skills each job could match
+    (a bitmask per job); similarity bounds the cosine by the resume's
+    weight on terms the job shares, and adds the exact tech-term boost.
+    Experience and education are exact.
+    """
+    resume_tokens = scorer.tokenize(scorer.build_resume_text(resume_data))
+    resume_terms = frozenset(resume_tokens)
+    resume_skill_set = scorer.normalize_resume_skills(resume_data.get('skills', []))
+    # Bit i stands for resume_skill_set[i]: masks of the skills a canonical
+    # skill or a job token can match, and the skills only a substring can
+    canonical_bits, token_bits, substrings = {}, {}, []
+    for i, skill in enumerate(resume_skill_set):
+        bit = 1 << i
+        canonicals = scorer.SYNONYM_INDEX.get(skill)
+        if canonicals is not None:
+            for canonical in canonicals:
+                canonical_bits[canonical] = canonical_bits.get(canonical, 0) | bit
+        else:
+            substrings.append((skill, bit))
+        for part in skill.split():
+            token_bits[part] = token_bits.get(part, 0) | bit
+    if scorer.idf_table is not None:
+        # cos <= |resume weights on shared terms| / |resume weights|
+        squares = {term: (count * scorer.idf_table.get(term)) ** 2 for term, count in Counter(resume_tokens).items()}
+        resume_square = sum(squares.values())
+    education = scorer.education_relevance(resume_data)
+
+    bounds = []
+    for profile in profiles:
+        mask = 0
+        for canonical in profile.canonical_skills.intersection(canonical_bits):
+            mask |= canonical_bits[canonical]
+        for token in profile.token_set.intersection(token_bits):
+            mask |= token_bits[token]
+        for skill, bit in substrings:
+            if not mask & bit and skill in profile.lower:
+                mask |= bit
+        skill_match = mask.bit_count() / len(resume_skill_set) * 100 if resume_skill_set else 0.0
+
+        if scorer.idf_table is not None:
+            shared = sum(squares[term] for term in profile.token_set.intersection(squares))
+            cosine = math.sqrt(shared / resume_square) if resume_square else 0.0
+        else:
+            # Per-pair IDF weighs shared terms only, so any overlap can reach 1
+            cosine = 0.0 if profile.token_set.isdisjoint(resume_terms) else 1.0
+        tech_boost = min(scorer.TECH_BOOST_MAX, len(profile.tech_tokens.intersection(resume_terms)) * scorer.TECH_BOOST_PER_TERM)
+        similarity = min(1.0, cosine + tech_boost)
+        bounds.append(min(100, scorer.combine_scores(
+            similarity, skill_match, scorer.experience_relevance(resume_data, profile), education)))
+    return bounds
+
+
+def cascade(resume_data, profiles, k):
+    """
+    (score_profiles output, top k job numbers best first), fully scoring
+    only the jobs whose upper bound can reach the k-th score; the others
+    are left at 0 and never ranked
+    """
+    n_jobs = len(profiles)
+    bounds = upper_bounds(resume_data, profiles)
+    by_bound = sorted(range(n_jobs), key=bounds.__getitem__, reverse=True)
+    scores, skill_match, matched_counts = [0.0] * n_jobs, [0.0] * n_jobs, [0] * n_jobs
+    resume_skill_count = 0
+    done = 0
+    cutoff = -math.inf
+    while done < n_jobs and bounds[by_bound[done]] + BOUND_SLACK >= cutoff:
+        batch = by_bound[done:done + max(k, CASCADE_BATCH)]
+        batch_scores, batch_skill_match, batch_counts, resume_skill_count = score_profiles(
+            resume_data, [profiles[i] for i in batch])
+        for i, score, match, count in zip(batch, batch_scores, batch_skill_match, batch_counts):
+            scores[i], skill_match[i], matched_counts[i] = score, match, count
+        done += len(batch)
+        cutoff = heapq.nlargest(k, (scores[i] for i in by_bound[:done]))[-1]
+    print(f"Batch cascade: {done} of {n_jobs} jobs fully scored")
+    # Equal scores keep the order the jobs were given in, as in score_jobs
+    order = sorted(by_bound[:done], key=lambda i: (-scores[i], i))[:k]
+    return (scores, skill_match, matched_counts, resume_skill_count), order
+
+
+def build_results(resume_data, jobs, profiles, scored, order, feedback_limit=None):
+    """
+    Result rows for jobs in the given order, from score_profiles output,
+    with feedback for the first feedback_limit of them (all by default)
+    """
+    scores, skill_match, matched_counts, resume_skill_count = scored
+    results = []
+    for rank, i in enumerate(order):
+        result = {
+            'title': jobs[i].get('title', 'Untitled Job'),
+            'score': round(scores[i], 2),
+            'skill_match': round(skill_match[i], 2),
+            'matched_skills': matched_counts[i]
+        }
+        if jobs[i].get('jd_id'):
+            result['jd_id'] = jobs[i]['jd_id']
+        if feedback_limit is None or rank < feedback_limit:
+            feedback = scorer.generate_feedback(
+                scores[i], skill_match[i], resume_data, profiles[i].keywords,
+                profiles[i], matched_counts[i], resume_skill_count
+            )
+            result.update({
+                'missing_skills': len(feedback['missing_keywords']),
+                'strengths': feedback['strengths'],
+                'improvements': feedback['improvements']
+            })
+        results.append(result)
+    return results
+
+
+def score_jobs(resume_data, jobs, feedback_limit=None, top_k=None):
+    """
+    Rank jobs ([{'title', 'description'}] or [{'jd_id'}] of registered
+    jobs) for one resume. Returns (results, errors): results best first
+    (only the top_k best when given), with feedback for the first
+    feedback_limit of them (all by default), and the resolve_jobs errors
+    for jobs that could not be scored.
+    """
+    jobs, profiles, errors = resolve_jobs(jobs)
+    if not jobs:
+        return [], errors
+    if top_k is not None and top_k < len(jobs):
+        scored, order = cascade(resume_data, profiles, top_k)
+        return build_results(resume_data, jobs, profiles, scored, order, feedback_limit), errors
+    scored = score_profiles(resume_data, profiles)
+    # Stable: equal scores keep the order the jobs were given in
+    order = sorted(range(len(jobs)), key=scored[0].__getitem__, reverse=True)
+    return build_results(resume_data, jobs, profiles, scored, order, feedback_limit), errors
@@ -0,0 +1,209 @@
+"""
+Candidate Index
+Skill-keyed inverted index over the parsed analyses, for ranking resumes
+against one job. In CANDIDATE_INDEX_TABLE (partition key index_key, sort
+key analysis_id) each analysis has:
+  - a posting per skill key: the canonical skill of a known synonym, else
+    the skill's longest token, with how many of its skills share that key,
+    how many valid skills it has, its years of experience and its
+    education score
+  - a compact feature record holding only what the scorer reads (skills,
+    education, experience) and the resume key
+It is kept current from the analysis table's DynamoDB stream.
+
+A search runs one Query per job key (CANDIDATE_QUERY_THREADS at a time)
+and estimates the score of every resume that shares a key with the job
+from the postings alone: skill match as shared skills / skills, plus
+experience and education, leaving out text similarity. It keeps the
+CANDIDATE_POOL best and re-scores those with the full scorer. Resumes
+outside the pool are not scored, so one whose score comes mostly from
+text similarity can be missed.
+"""
+import heapq
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from boto3.dynamodb.types import TypeDeserializer
+
+import lambda_function as scorer
+
+CANDIDATE_INDEX_TABLE = os.environ.get('CANDIDATE_INDEX_TABLE', 'CandidateIndex')
+CANDIDATE_POOL = int(os.environ.get('CANDIDATE_POOL', '200'))
+QUERY_THREADS = int(os.environ.get('CANDIDATE_QUERY_THREADS', '16'))
+# BatchGetItem limit
+BATCH_GET_SIZE = 100
+SKILL_PREFIX = 'skill:'
+RESUME_PREFIX = 'resume:'
+# Analysis fields the scorer reads; changes to anything else leave the index alone
+SCORED_FIELDS = ('skills', 'education', 'experience')
+
+dynamodb = boto3.resource('dynamodb')
+index_table = dynamodb.Table(CANDIDATE_INDEX_TABLE)
+# Low-level client for the parallel posting queries (clients are thread-safe, resources are not)
+dynamodb_client = boto3.client('dynamodb')
+deserializer = TypeDeserializer()
+
+
+def skill_keys(skills):
+    """({skill key: number of skills with it}, valid skill count) for a resume's skills"""
+    keys = Counter()
+    valid = scorer.normalize_resume_skills(skills)
+    for skill in valid:
+        canonicals = scorer.SYNONYM_INDEX.get(skill)
+        if canonicals is not None:
+            keys.update(canonicals)
+            continue
+        tokens = scorer.tokenize(skill)
+        if tokens:
+            keys[max(tokens, key=len)] += 1
+    return keys, len(valid)
+
+
+def job_keys(job):
+    """
+    Skill keys a job description (or JobProfile) can share with resumes:
+    its canonical skills and the tokens that pass as skills. Resume keys
+    come from valid skills only, so the rest of the job's words would
+    each cost a Query that rarely finds postings.
+    """
+    profile = scorer.job_profile(job)
+    return profile.canonical_skills | {token for token in profile.token_set if scorer.is_valid_skill(token)}
+
+
+def index_resume(analysis_id, resume_data, previous_skills=None):
+    """Write an analysis's postings and feature record, dropping keys only its previous skills had"""
+    keys, skill_count = skill_keys(resume_data.get('skills', []))
+    years = resume_data.get('experience', {}).get('years', 0) or 0
+    education_score = scorer.education_relevance(resume_data)
+    stale = set(skill_keys(previous_skills)[0]) - set(keys) if previous_skills else set()
+    with index_table.batch_writer() as batch:
+        for key in stale:
+            batch.delete_item(Key={'index_key': SKILL_PREFIX + key, 'analysis_id': analysis_id})
+        for key, count in keys.items():
+            batch.put_item(Item={
+                'index_key': SKILL_PREFIX + key,
+                'analysis_id': analysis_id,
+                'skill_weight': count,
+                'skill_count': skill_count,
+                'years': years,
+                'education_score': education_score
+            })
+        record = {'index_key': RESUME_PREFIX + analysis_id, 'analysis_id': analysis_id}
+        record.update({field: resume_data[field] for field in SCORED_FIELDS + ('resume_key',) if field in resume_data})
+        batch.put_item(Item=record)
+
+
+def remove_resume(analysis_id, skills):
+    """Delete an analysis's postings and feature record"""
+    keys, _ = skill_keys(skills or [])
+    with index_table.batch_writer() as batch:
+        for key in keys:
+            batch.delete_item(Key={'index_key': SKILL_PREFIX + key, 'analysis_id': analysis_id})
+        batch.delete_item(Key={'index_key': RESUME_PREFIX + analysis_id, 'analysis_id': analysis_id})
+
+
+def apply_stream_records(records):
+    """
+    Update the index from analysis table stream records (NEW_AND_OLD_IMAGES).
+    Returns the sequence numbers of the records that failed.
+    """
+    failures = []
+    for record in records:
+        try:
+            change = record['dynamodb']
+            old = {name: deserializer.deserialize(value) for name, value in change.get('OldImage', {}).items()}
+            new = {name: deserializer.deserialize(value) for name, value in change.get('NewImage', {}).items()}
+            analysis_id = (new or old).get('analysis_id')
+            if record['eventName'] == 'REMOVE':
+                remove_resume(analysis_id, old.get('skills'))
+            elif any(old.get(field) != new.get(field) for field in SCORED_FIELDS):
+                # Scoring writes back to the same item; only re-parses change these fields
+                index_resume(analysis_id, new, old.get('skills'))
+        except Exception as e:
+            print(f"Error indexing stream record {record.get('eventID')}: {type(e).__name__}: {e}")
+            failures.append(record['dynamodb']['SequenceNumber'])
+    return failures
+
+
+def query_postings(key):
+    """[(analysis_id, skill weight, skill count, years, education score)] for one skill key"""
+    request = {
+        'TableName': CANDIDATE_INDEX_TABLE,
+        'KeyConditionExpression': 'index_key = :key',
+        'ExpressionAttributeValues': {':key': {'S': SKILL_PREFIX + key}},
+        'ProjectionExpression': 'analysis_id, skill_weight, skill_count, years, education_score'
+    }
+    postings = []
+    while True:
+        response = dynamodb_client.query(**request)
+        for item in response['Items']:
+            postings.append((item['analysis_id']['S'], int(item['skill_weight']['N']), int(item['skill_count']['N']),
+                             float(item['years']['N']), float(item['education_score']['N'])))
+        if 'LastEvaluatedKey' not in response:
+            return postings
+        request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def candidate_pool(job, posting_lists, pool=CANDIDATE_POOL):
+    """
+    Up to pool analysis ids with the highest score estimate against a job
+    description (or JobProfile) over its posting lists
+    """
+    required = scorer.job_profile(job).required_years
+    shared = Counter()
+    fixed = {}
+    for postings in posting_lists:
+        for analysis_id, weight, skill_count, years, education_score in postings:
+            shared[analysis_id] += weight
+            if analysis_id not in fixed:
+                experience_score = scorer.experience_score(years, required) if years > 0 else 0
+                fixed[analysis_id] = (skill_count, scorer.combine_scores(0, 0, experience_score, education_score))
+    estimates = {
+        analysis_id: scorer.combine_scores(0, min(100.0, count / fixed[analysis_id][0] * 100), 0, 0) + fixed[analysis_id][1]
+        for analysis_id, count in shared.items()
+    }
+    return heapq.nlargest(pool, estimates, key=estimates.__getitem__)
+
+
+def feature_records(analysis_ids):
+    """{analysis_id: feature record} for indexed analyses, fetched with BatchGetItem"""
+    records = {}
+    for start in range(0, len(analysis_ids), BATCH_GET_SIZE):
+        request = {CANDIDATE_INDEX_TABLE: {'Keys': [
+            {'index_key': RESUME_PREFIX + analysis_id, 'analysis_id': analysis_id}
+            for analysis_id in analysis_ids[start:start + BATCH_GET_SIZE]
+        ]}}
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(CANDIDATE_INDEX_TABLE, []):
+                records[item['analysis_id']] = item
+            request = response.get('UnprocessedKeys')
+    return records
+
+
+def rank_candidates(job, records, k):
+    """Top k of {analysis_id: resume data} by the full score against a job description (or JobProfile)"""
+    profile = scorer.job_profile(job)
+    scored = {analysis_id: scorer.score_resume(resume_data, profile) for analysis_id, resume_data in records.items()}
+    return [
+        {
+            'analysis_id': analysis_id,
+            'resume_key': records[analysis_id].get('resume_key'),
+            'score': round(scored[analysis_id][0], 2),
+            'skill_match': round(scored[analysis_id][1], 2),
+            'matched_skills': scored[analysis_id][2]
+        }
+        for analysis_id in heapq.nlargest(k, scored, key=lambda analysis_id: scored[analysis_id][0])
+    ]
+
+
+def search(job, k=50, pool=CANDIDATE_POOL):
+    """Best k indexed resumes for a job description (or JobProfile), best first"""
+    keys = sorted(job_keys(job))
+    with ThreadPoolExecutor(max_workers=max(1, min(QUERY_THREADS, len(keys)))) as executor:
+        survivors = candidate_pool(job, executor.map(query_postings, keys), max(pool, k))
+    records = feature_records(survivors)
+    print(f"Candidate search: {len(keys)} skill keys, {len(survivors)} resumes re-scored")
+    return rank_candidates(job, records, k)
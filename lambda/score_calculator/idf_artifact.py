@@ -0,0 +1,92 @@
+"""
+IDF Artifact
+Corpus-level inverse document frequencies, built offline by
+scripts/build_idf.py and memory-mapped by the scorer at cold start.
+
+Layout (little-endian):
+  header   magic, format version, tokenizer version, document count,
+           term count, IDF for unseen terms, vocab byte length
+  vocab    sorted terms, UTF-8, each followed by a newline
+  padding  to a 4-byte boundary
+  offsets  uint32 start of each term in vocab, plus the end
+  values   float32 IDF per term, in vocab order
+
+Terms are looked up by bisecting the mapped vocab (see sorted_terms), so
+loading decodes nothing but the header.
+"""
+import math
+import mmap
+import os
+import struct
+from functools import lru_cache
+
+from sorted_terms import SortedTerms, pack_terms
+
+MAGIC = b'RIDF'
+FORMAT_VERSION = 2
+# Recently looked-up terms, so common words skip the bisect
+IDF_LOOKUP_CACHE_SIZE = int(os.environ.get('IDF_LOOKUP_CACHE_SIZE', '16384'))
+HEADER = struct.Struct('<4sHHIIfI')
+
+
+def smoothed_idf(doc_count, doc_freq):
+    """log((1 + N) / (1 + df)) + 1: positive, largest for unseen terms"""
+    return math.log((1 + doc_count) / (1 + doc_freq)) + 1
+
+
+def write_idf_artifact(path, doc_freqs, doc_count, tokenizer_version):
+    """Write the artifact for {term: document frequency} over doc_count documents"""
+    vocab = sorted(doc_freqs)
+    vocab_bytes, offsets = pack_terms(vocab)
+    padding = -(HEADER.size + len(vocab_bytes)) % 4
+    values = struct.pack(f'<{len(vocab)}f', *(smoothed_idf(doc_count, doc_freqs[term]) for term in vocab))
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, tokenizer_version, doc_count, len(vocab),
+                            smoothed_idf(doc_count, 0), len(vocab_bytes)))
+        f.write(vocab_bytes)
+        f.write(b'\0' * padding)
+        f.write(offsets.tobytes())
+        f.write(values)
+
+
+class IdfTable:
+    """Read-only IDF lookup over a memory-mapped artifact"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, format_version, self.tokenizer_version, self.doc_count, term_count,
+         self.default, vocab_length) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} IDF artifact")
+
+        offsets_start = HEADER.size + vocab_length + (-(HEADER.size + vocab_length) % 4)
+        values_start = offsets_start + 4 * (term_count + 1)
+        # uint32 offsets and float32 values are read in place; Lambda runs on little-endian hosts only
+        view = memoryview(self.buffer)
+        self.terms = SortedTerms(self.buffer, HEADER.size, view[offsets_start:values_start].cast('I'))
+        self.values = view[values_start:values_start + 4 * term_count].cast('f')
+        self.find = lru_cache(maxsize=IDF_LOOKUP_CACHE_SIZE)(self.terms.find)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def get(self, term):
+        """IDF of a term, or the unseen-term IDF"""
+        i = self.find(term)
+        return self.values[i] if i is not None else self.default
+
+
+def load_idf_table(path, tokenizer_version):
+    """IdfTable for path, or None if it is missing or was built with another tokenizer"""
+    try:
+        idf_table = IdfTable(path)
+    except FileNotFoundError:
+        print(f"IDF artifact {path} not found; using per-request IDF")
+        return None
+    if idf_table.tokenizer_version != tokenizer_version:
+        print(f"IDF artifact {path} was built for tokenizer v{idf_table.tokenizer_version}, "
+              f"expected v{tokenizer_version}; using per-request IDF")
+        return None
+    print(f"Loaded IDF artifact {path}: {len(idf_table)} terms over {idf_table.doc_count} documents")
+    return idf_table
@@ -0,0 +1,195 @@
+"""
+Job Index
+Inverted index over the registered job descriptions, built offline by
+scripts/build_job_index.py and memory-mapped by the scorer for job
+recommendations.
+
+Term postings carry each job's TF-IDF weight divided by the job vector's
+norm, so a resume's cosine with every job is a sum over its own terms.
+Skill postings list the jobs that mention each canonical skill.
+
+Layout (little-endian):
+  header     magic, format version, tokenizer version, IDF document and
+             term count, job count, term count, posting count, skill
+             count, skill posting count, vocab and skills byte lengths,
+             build time (Unix seconds)
+  jd ids     JD_ID_LENGTH ASCII bytes per job
+  vocab      sorted terms, UTF-8, each followed by a newline
+  skills     sorted canonical skills, UTF-8, each followed by a newline
+  padding    to a 4-byte boundary
+  years      int32 required years per job (-1 if unstated)
+  term starts  uint32 start of each term in vocab, plus the end
+  skill starts uint32 start of each skill in skills, plus the end
+  offsets    uint32 start of each term's postings, plus the end
+  max        float32 largest weight in each term's postings
+  postings   uint32 job numbers (ascending per term), then float32 weights
+  skills     uint32 start of each skill's postings plus the end, then
+             uint32 job numbers
+
+Terms and skills are looked up by bisecting the mapped bytes (see
+sorted_terms), so loading decodes nothing but the header.
+
+Jobs registered after the index was built are not in it until it is
+rebuilt; the build time is kept so callers can tell how current it is.
+"""
+import math
+import mmap
+import struct
+import time
+from array import array
+from collections import Counter
+
+from sorted_terms import SortedTerms, pack_terms
+
+MAGIC = b'RJIX'
+FORMAT_VERSION = 2
+HEADER = struct.Struct('<4sHHIIIIIIIIII')
+# job_registry.job_id(): 'jd_' and 32 hex digits
+JD_ID_LENGTH = 35
+NO_YEARS = -1
+
+
+def job_weights(term_counts, idf):
+    """{term: TF-IDF weight / norm} of one job, as tfidf_vector weighs it"""
+    token_count = sum(term_counts.values())
+    weights = {term: count / token_count * idf.get(term) for term, count in term_counts.items()}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {term: weight / norm if norm else 0.0 for term, weight in weights.items()}
+
+
+def write_job_index(path, jobs, idf_table, tokenizer_version):
+    """
+    Write the index for jobs, an iterable of (jd_id, features) with
+    features from JobProfile.to_features(), weighted with idf_table
+    """
+    jd_ids = bytearray()
+    years = array('i')
+    term_docs, term_weights = {}, {}
+    skill_docs = {}
+    for doc, (jd_id, features) in enumerate(jobs):
+        encoded = jd_id.encode('ascii')
+        if len(encoded) != JD_ID_LENGTH:
+            raise ValueError(f"unexpected jd_id {jd_id!r}")
+        jd_ids += encoded
+        required = features.get('required_years')
+        years.append(NO_YEARS if required is None else min(int(required), 2 ** 31 - 1))
+        for term, weight in job_weights(Counter(features['term_counts']), idf_table).items():
+            term_docs.setdefault(term, array('I')).append(doc)
+            term_weights.setdefault(term, array('f')).append(weight)
+        for skill in features['skills']:
+            skill_docs.setdefault(skill, array('I')).append(doc)
+
+    vocab = sorted(term_docs)
+    skills = sorted(skill_docs)
+    vocab_bytes, term_starts = pack_terms(vocab)
+    skills_bytes, skill_starts = pack_terms(skills)
+    offsets, maxima, docs, weights = array('I', [0]), array('f'), array('I'), array('f')
+    for term in vocab:
+        docs += term_docs[term]
+        weights += term_weights[term]
+        offsets.append(len(docs))
+        maxima.append(max(term_weights[term]))
+    skill_offsets, skill_postings = array('I', [0]), array('I')
+    for skill in skills:
+        skill_postings += skill_docs[skill]
+        skill_offsets.append(len(skill_postings))
+
+    text_length = HEADER.size + len(jd_ids) + len(vocab_bytes) + len(skills_bytes)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, tokenizer_version, idf_table.doc_count, len(idf_table),
+                            len(years), len(vocab), len(docs), len(skills), len(skill_postings),
+                            len(vocab_bytes), len(skills_bytes), int(time.time())))
+        f.write(jd_ids)
+        f.write(vocab_bytes)
+        f.write(skills_bytes)
+        f.write(b'\0' * (-text_length % 4))
+        for values in (years, term_starts, skill_starts, offsets, maxima, docs, weights, skill_offsets, skill_postings):
+            f.write(values.tobytes())
+
+
+class JobIndex:
+    """Read-only postings over a memory-mapped job index"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, format_version, self.tokenizer_version, self.idf_doc_count, self.idf_term_count,
+         self.job_count, term_count, posting_count, skill_count, skill_posting_count,
+         vocab_length, skills_length, self.built_at) = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} job index")
+
+        position = HEADER.size
+        self.jd_ids = self.buffer[position:position + self.job_count * JD_ID_LENGTH]
+        position += self.job_count * JD_ID_LENGTH
+        vocab_start = position
+        skills_start = position + vocab_length
+        position = skills_start + skills_length
+        position += -position % 4
+
+        # Lambda runs on little-endian hosts only, so the arrays are read in place
+        view = memoryview(self.buffer)
+
+        def section(code, count):
+            nonlocal position
+            values = view[position:position + 4 * count].cast(code)
+            position += 4 * count
+            return values
+
+        self.years = section('i', self.job_count)
+        self.terms = SortedTerms(self.buffer, vocab_start, section('I', term_count + 1))
+        self.skills = SortedTerms(self.buffer, skills_start, section('I', skill_count + 1))
+        self.offsets = section('I', term_count + 1)
+        self.maxima = section('f', term_count)
+        self.docs = section('I', posting_count)
+        self.weights = section('f', posting_count)
+        self.skill_offsets = section('I', skill_count + 1)
+        self.skill_docs = section('I', skill_posting_count)
+
+    def __len__(self):
+        return self.job_count
+
+    def jd_id(self, doc):
+        return self.jd_ids[doc * JD_ID_LENGTH:(doc + 1) * JD_ID_LENGTH].decode('ascii')
+
+    def required_years(self, doc):
+        """Years the job asks for, or None"""
+        years = self.years[doc]
+        return None if years == NO_YEARS else years
+
+    def term_id(self, term):
+        return self.terms.find(term)
+
+    def term_postings(self, term_id):
+        """(job numbers, weights, largest weight) of a term"""
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        return self.docs[start:end], self.weights[start:end], self.maxima[term_id]
+
+    def terms_containing(self, fragment):
+        """Ids of the terms with fragment inside them"""
+        return self.terms.containing(fragment)
+
+    def skill_postings(self, skill):
+        """Job numbers of the jobs that mention a canonical skill"""
+        i = self.skills.find(skill)
+        if i is None:
+            return self.skill_docs[0:0]
+        return self.skill_docs[self.skill_offsets[i]:self.skill_offsets[i + 1]]
+
+
+def load_job_index(path, tokenizer_version, idf_table):
+    """JobIndex for path, or None if it is missing or does not match the scorer's tokenizer and IDF"""
+    try:
+        job_index = JobIndex(path)
+    except FileNotFoundError:
+        print(f"Job index {path} not found; job recommendations are disabled")
+        return None
+    if job_index.tokenizer_version != tokenizer_version:
+        print(f"Job index {path} was built for tokenizer v{job_index.tokenizer_version}, "
+              f"expected v{tokenizer_version}; job recommendations are disabled")
+        return None
+    if idf_table is None or (job_index.idf_doc_count, job_index.idf_term_count) != (idf_table.doc_count, len(idf_table)):
+        print(f"Job index {path} was built with another IDF artifact; job recommendations are disabled")
+        return None
+    print(f"Loaded job index {path}: {job_index.job_count} jobs, {len(job_index.terms)} terms")
+    return job_index
@@ -0,0 +1,75 @@
+"""
+Job Registry
+Job descriptions ingested once and stored with their precomputed
+scoring features under a stable jd_id (a hash of the normalized text),
+so callers score against the id instead of re-sending the text.
+An in-container LRU of built job profiles sits in front of the table.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+import boto3
+
+from lru_cache import LRUCache
+
+JOBS_TABLE = os.environ.get('JOBS_TABLE', 'JobDescriptions')
+JOB_REGISTRY_CACHE_SIZE = int(os.environ.get('JOB_REGISTRY_CACHE_SIZE', '512'))
+# BatchGetItem limit
+BATCH_GET_SIZE = 100
+
+dynamodb = boto3.resource('dynamodb')
+jobs_table = dynamodb.Table(JOBS_TABLE)
+
+
+# {jd_id: whatever lookup()'s build returned for the stored item}
+memory_cache = LRUCache(JOB_REGISTRY_CACHE_SIZE)
+
+
+def normalize_job_text(text):
+    """Case- and whitespace-insensitive form of a job description"""
+    return ' '.join(text.split()).lower()
+
+
+def job_id(text):
+    """Stable id of a job description: re-posting the same text gives the same id"""
+    return 'jd_' + hashlib.sha256(normalize_job_text(text).encode('utf-8')).hexdigest()[:32]
+
+
+def store(jd_id, title, text, features):
+    """Save a job description and its features (a JSON-serializable dict)"""
+    jobs_table.put_item(Item={
+        'jd_id': jd_id,
+        'title': title,
+        'job_description': text,
+        'features': json.dumps(features),
+        'created_at': datetime.now(timezone.utc).isoformat()
+    })
+
+
+def lookup(jd_ids, build):
+    """
+    {jd_id: build(item)} for registered jobs, where item has title,
+    job_description and features (decoded). Ids not cached in this
+    container are fetched with BatchGetItem; unknown ids are left out.
+    """
+    found = {}
+    missing = []
+    for jd_id in dict.fromkeys(jd_ids):
+        cached = memory_cache.get(jd_id)
+        if cached is not None:
+            found[jd_id] = cached
+        else:
+            missing.append(jd_id)
+
+    for start in range(0, len(missing), BATCH_GET_SIZE):
+        request = {JOBS_TABLE: {'Keys': [{'jd_id': jd_id} for jd_id in missing[start:start + BATCH_GET_SIZE]]}}
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(JOBS_TABLE, []):
+                item['features'] = json.loads(item.get('features') or '{}')
+                found[item['jd_id']] = built = build(item)
+                memory_cache.put(item['jd_id'], built)
+            request = response.get('UnprocessedKeys')
+    return found
@@ -6,15 +6,39 @@ using Enhanced TF-IDF with domain awareness (Lightweight Hybrid approach)
 import json
 import boto3
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 import re
 from collections import Counter
 import math
+import time
 from decimal import Decimal
+from functools import cached_property, lru_cache
+import job_registry
+from idf_artifact import load_idf_table
+from sparse import Vocabulary, tfidf_vector
 
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(os.environ.get('DYNAMODB_TABLE', 'ResumeAnalysisResults'))
 
+# Bump when tokenize() changes; IDF artifacts built with another version are ignored
+TOKENIZER_VERSION = 1
+# Corpus IDF built by scripts/build_idf.py, memory-mapped once per container
+IDF_ARTIFACT = os.environ.get('IDF_ARTIFACT', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'idf.bin'))
+idf_table = load_idf_table(IDF_ARTIFACT, TOKENIZER_VERSION)
+# Term ids for TF-IDF vectors; forgotten between requests once it grows past the cap
+vocabulary = Vocabulary(max_terms=int(os.environ.get('VOCABULARY_MAX_TERMS', '200000')))
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has',
+    'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
+    'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
+    'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
+    'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same',
+    'so', 'than', 'too', 'very', 's', 't', 'just', 'don', 'now'
+})
+
 def tokenize(text):
     """Tokenize text into words"""
     # Convert to lowercase and split into words
@@ -24,150 +48,142 @@ def tokenize(text):
     words = text.split()
     
     # Remove common stop words
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'is', 'are', 'was', 'were', 'been', 'be', 'have', 'has',
-        'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may',
-        'might', 'must', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
-        'he', 'she', 'it', 'we', 'they', 'what', 'which', 'who', 'when', 'where',
-        'why', 'how', 'all', 'each', 'every', 'both', 'few', 'more', 'most',
-        'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same',
-        'so', 'than', 'too', 'very', 's', 't', 'just', 'don', 'now'
-    }
-    
-    return [word for word in words if word and len(word) > 2 and word not in stop_words]
-
-def compute_tf(tokens):
-    """Compute term frequency"""
-    tf_dict = {}
-    token_count = len(tokens)
-    counter = Counter(tokens)
-    
-    for word, count in counter.items():
-        tf_dict[word] = count / token_count
-    
-    return tf_dict
+    return [word for word in words if word and len(word) > 2 and word not in STOP_WORDS]
 
 def compute_idf(documents):
     """Compute inverse document frequency"""
     idf_dict = {}
     n_documents = len(documents)
     
-    # Get all unique words
+    # Get all unique words (and each document's, for membership tests)
+    doc_words = [set(doc) for doc in documents]
     all_words = set()
-    for doc in documents:
-        all_words.update(doc)
+    for words in doc_words:
+        all_words.update(words)
     
     # Calculate IDF for each word
     for word in all_words:
-        doc_count = sum(1 for doc in documents if word in doc)
+        doc_count = sum(1 for words in doc_words if word in words)
         idf_dict[word] = math.log(n_documents / (1 + doc_count))
     
     return idf_dict
 
-def compute_tfidf(tf, idf):
-    """Compute TF-IDF"""
-    tfidf = {}
-    for word, tf_value in tf.items():
-        tfidf[word] = tf_value * idf.get(word, 0)
-    return tfidf
+def build_resume_text(resume_data):
+    """Text compared against job descriptions: skills, education, positions"""
+    return ' '.join([
+        ' '.join(resume_data.get('skills', [])),
+        ' '.join(resume_data.get('education', [])),
+        ' '.join(resume_data.get('experience', {}).get('positions', []))
+    ])
 
-def cosine_similarity(vec1, vec2):
-    """Calculate cosine similarity between two TF-IDF vectors"""
-    # Get all unique words
-    all_words = set(vec1.keys()) | set(vec2.keys())
-    
-    # Calculate dot product
-    dot_product = sum(vec1.get(word, 0) * vec2.get(word, 0) for word in all_words)
-    
-    # Calculate magnitudes
-    magnitude1 = math.sqrt(sum(val ** 2 for val in vec1.values()))
-    magnitude2 = math.sqrt(sum(val ** 2 for val in vec2.values()))
-    
-    # Avoid division by zero
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
-    
-    return dot_product / (magnitude1 * magnitude2)
+# Similarity boost per technical term shared by resume and job, and its cap
+TECH_BOOST_PER_TERM = 0.02
+TECH_BOOST_MAX = 0.15
 
 def calculate_enhanced_similarity(text1, text2):
     """
     Calculate enhanced TF-IDF similarity with domain-aware boosting.
     Lightweight hybrid approach without external ML libraries.
+    text2 is the job description (or its JobProfile).
     """
     tokens1 = tokenize(text1)
-    tokens2 = tokenize(text2)
+    job = job_profile(text2)
     
     # Standard TF-IDF calculation
-    tf1 = compute_tf(tokens1)
-    tf2 = compute_tf(tokens2)
-    idf = compute_idf([tokens1, tokens2])
-    tfidf1 = {word: tf1[word] * idf[word] for word in tf1}
-    tfidf2 = {word: tf2[word] * idf[word] for word in tf2}
+    if idf_table is not None:
+        vector1 = tfidf_vector(tokens1, vocabulary, idf_table)
+        vector2 = job.vector
+    else:
+        # No corpus artifact deployed: two-document IDF
+        idf = compute_idf([tokens1, job.tokens])
+        vector1 = tfidf_vector(tokens1, vocabulary, idf)
+        vector2 = tfidf_vector(job.tokens, vocabulary, idf)
     
-    base_similarity = cosine_similarity(tfidf1, tfidf2)
+    base_similarity = vector1.cosine(vector2)
     
     # Boost similarity if there are exact technical keyword matches
     tech_boost = 0
-    tokens1_set = set(tokens1)
-    tokens2_set = set(tokens2)
     
     # Find technical terms that appear in both
-    common_tech_terms = []
-    for token in tokens1_set.intersection(tokens2_set):
-        if is_technical_keyword(token):
-            common_tech_terms.append(token)
+    common_tech_terms = job.tech_tokens.intersection(tokens1)
     
     # Apply boost based on number of shared technical terms
     if len(common_tech_terms) > 0:
         # Each shared technical term adds a small boost (max 15% total)
-        tech_boost = min(0.15, len(common_tech_terms) * 0.02)
+        tech_boost = min(TECH_BOOST_MAX, len(common_tech_terms) * TECH_BOOST_PER_TERM)
     
     # Return boosted similarity (capped at 1.0)
     return min(1.0, base_similarity + tech_boost)
 
+# Term classification tables, built once per container
+TECH_DOMAINS = {
+    'languages': ['python', 'java', 'javascript', 'typescript', 'kotlin', 'swift', 'ruby', 
+                  'php', 'golang', 'rust', 'scala', 'cpp', 'csharp', 'perl', 'dart', 'sql'],
+    'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 
+                   'fastapi', 'nextjs', 'gatsby', 'svelte', 'rails', 'laravel', 'dotnet', 'redux'],
+    'cloud': ['aws', 'azure', 'gcp', 'ec2', 's3', 'lambda', 'dynamodb', 'cloudformation',
+              'terraform', 'ansible', 'puppet', 'chef', 'kubernetes', 'docker', 'k8s'],
+    'databases': ['mongodb', 'postgresql', 'mysql', 'redis', 'cassandra', 'elasticsearch', 
+                  'neo4j', 'oracle', 'sqlite', 'dynamodb', 'firebase', 'mariadb'],
+    'tools': ['git', 'jenkins', 'gitlab', 'github', 'circleci', 'jira', 'gradle', 'maven', 
+              'npm', 'yarn', 'webpack', 'vite', 'babel'],
+    'ml_ai': ['tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'spark', 'scikit',
+              'hadoop', 'airflow', 'mlflow', 'sagemaker', 'opencv'],
+    'testing': ['junit', 'pytest', 'jest', 'mocha', 'selenium', 'cypress', 'testng'],
+    'protocols': ['graphql', 'grpc', 'websocket', 'mqtt', 'amqp', 'kafka', 'rabbitmq'],
+}
+TECH_TERMS = frozenset(term for keywords in TECH_DOMAINS.values() for term in keywords)
+# A word containing one of these is technical (e.g. "react-native" contains "react")
+TECH_TERM_INSIDE = re.compile('|'.join(re.escape(term) for term in sorted(TECH_TERMS) if len(term) > 3))
+# Terms have no newlines, so "part in TECH_TERMS_JOINED" asks whether part
+# occurs inside any single tech term
+TECH_TERMS_JOINED = '\n'.join(sorted(TECH_TERMS))
+TECH_ACRONYM_PARTS = re.compile('sdk|ide|cli|orm|jwt|oauth|saml|xml|json|yaml')
+
+TECH_ING_WORDS = frozenset({'testing', 'profiling', 'debugging', 'logging', 'caching', 
+                            'hashing', 'parsing', 'rendering', 'scaling', 'monitoring'})
+GENERIC_PLURALS = frozenset({'team', 'peer', 'partner', 'people', 'person', 'member', 
+                             'client', 'customer', 'user', 'engineer', 'developer', 'blocker', 'answer'})
+ACTION_VERBS = frozenset({'identify', 'escalate', 'coordinate', 'facilitate', 'enable', 'drive',
+                          'ensure', 'provide', 'support', 'assist', 'help', 'deliver', 'achieve',
+                          'establish', 'maintain', 'develop', 'create', 'build', 'implement',
+                          'execute', 'perform', 'conduct', 'manage', 'oversee', 'direct'})
+SOFT_SKILL_ROOTS = re.compile('trust|leader|manage|collaborat|communi|organiz|'
+                              'motiv|passion|creativ|innov|strate|vision|escalat|'
+                              'integrit|hones|ethic|transparen|accountab|depend|'
+                              'cooperat|interpers|empath|adapt|resilien|patien|diligen')
+EXACT_SOFT_SKILLS = frozenset({'trust', 'integrity', 'honesty', 'ethics', 'transparency',
+                               'accountability', 'teamwork', 'leadership', 'empathy', 'patience',
+                               'adaptability', 'flexibility', 'resilience', 'diligence'})
+
+# Classifier verdicts are memoized per container (keyword extraction asks
+# about the same few thousand tokens over and over)
+TERM_CACHE_SIZE = int(os.environ.get('TERM_CACHE_SIZE', '16384'))
+
 def is_technical_keyword(word, context_words=None):
     """
     Use NLP-based scoring to determine if a word is a technical keyword.
     Uses pattern recognition and semantic analysis instead of hardcoded lists.
     """
+    return classify_technical_term(word)
+
+@lru_cache(maxsize=TERM_CACHE_SIZE)
+def classify_technical_term(word):
+    """Uncached is_technical_keyword"""
     word_lower = word.lower()
     
     # First, check against known technical domains (core technical terms only)
-    tech_domains = {
-        'languages': ['python', 'java', 'javascript', 'typescript', 'kotlin', 'swift', 'ruby', 
-                      'php', 'golang', 'rust', 'scala', 'cpp', 'csharp', 'perl', 'dart', 'sql'],
-        'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 
-                       'fastapi', 'nextjs', 'gatsby', 'svelte', 'rails', 'laravel', 'dotnet', 'redux'],
-        'cloud': ['aws', 'azure', 'gcp', 'ec2', 's3', 'lambda', 'dynamodb', 'cloudformation',
-                  'terraform', 'ansible', 'puppet', 'chef', 'kubernetes', 'docker', 'k8s'],
-        'databases': ['mongodb', 'postgresql', 'mysql', 'redis', 'cassandra', 'elasticsearch', 
-                      'neo4j', 'oracle', 'sqlite', 'dynamodb', 'firebase', 'mariadb'],
-        'tools': ['git', 'jenkins', 'gitlab', 'github', 'circleci', 'jira', 'gradle', 'maven', 
-                  'npm', 'yarn', 'webpack', 'vite', 'babel'],
-        'ml_ai': ['tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'spark', 'scikit',
-                  'hadoop', 'airflow', 'mlflow', 'sagemaker', 'opencv'],
-        'testing': ['junit', 'pytest', 'jest', 'mocha', 'selenium', 'cypress', 'testng'],
-        'protocols': ['graphql', 'grpc', 'websocket', 'mqtt', 'amqp', 'kafka', 'rabbitmq'],
-    }
-    
-    # Check if word is in any technical domain
-    for domain, keywords in tech_domains.items():
-        if word_lower in keywords:
-            return True
-        # Check if word contains a technical term (e.g., "react-native" contains "react")
-        if any(tech in word_lower for tech in keywords if len(tech) > 3):
-            return True
+    if word_lower in TECH_TERMS or TECH_TERM_INSIDE.search(word_lower):
+        return True
     
     # Pattern-based detection for technical terms
-    tech_patterns = [
-        lambda w: w.endswith(('js', 'py', 'rb', 'go', 'rs')) and len(w) <= 10,  # Language extensions
-        lambda w: w.endswith(('.js', '.py', '.java', '.cpp', '.rb')),  # File extensions
-        lambda w: w.endswith(('sql', 'db', 'ql')) and len(w) > 2,  # Database/Query languages
-        lambda w: any(x in w for x in ['sdk', 'ide', 'cli', 'orm', 'jwt', 'oauth', 'saml', 'xml', 'json', 'yaml']) and len(w) <= 15,  # Tech acronyms
-    ]
-    
-    if any(pattern(word_lower) for pattern in tech_patterns):
+    if word_lower.endswith(('js', 'py', 'rb', 'go', 'rs')) and len(word_lower) <= 10:  # Language extensions
+        return True
+    if word_lower.endswith(('.js', '.py', '.java', '.cpp', '.rb')):  # File extensions
+        return True
+    if word_lower.endswith(('sql', 'db', 'ql')) and len(word_lower) > 2:  # Database/Query languages
+        return True
+    if len(word_lower) <= 15 and TECH_ACRONYM_PARTS.search(word_lower):  # Tech acronyms
         return True
     
     # Technical acronyms (2-4 uppercase letters)
@@ -176,7 +192,7 @@ def is_technical_keyword(word, context_words=None):
     
     # Semantic pattern recognition: technical words have specific characteristics
     # 1. Contains version numbers or dots (e.g., "node.js", "c++", "python3")
-    if any(char in word_lower for char in ['.', '+']) and len(word_lower) <= 12:
+    if ('.' in word_lower or '+' in word_lower) and len(word_lower) <= 12:
         return True
     
     # 2. CamelCase or PascalCase (common in tech: "TypeScript", "JavaScript", "DevOps")
@@ -187,7 +203,7 @@ def is_technical_keyword(word, context_words=None):
     if '-' in word_lower and len(word_lower) > 5:
         parts = word_lower.split('-')
         # At least one part should be a known technical term
-        if any(part in tech_term for domain in tech_domains.values() for tech_term in domain for part in parts):
+        if any(part in TECH_TERMS_JOINED for part in parts):
             return True
     
     # 4. Contains numbers (version indicators: python3, angular2, etc.)
@@ -199,52 +215,51 @@ def is_technical_keyword(word, context_words=None):
     # If none of the patterns match, it's likely not a technical keyword
     return False
 
+# Core stop words for keyword extraction - supplemented by pattern-based detection
+KEYWORD_GENERIC_WORDS = frozenset({
+    # Common verbs (will catch -ing forms with pattern detection)
+    'experience', 'work', 'build', 'create', 'develop', 'implement', 'maintain',
+    'design', 'write', 'test', 'deploy', 'drive', 'manage', 'lead', 'help',
+    
+    # Position-related terms
+    'senior', 'junior', 'lead', 'principal', 'staff', 'associate', 'intern',
+    'manager', 'director', 'engineer', 'engineers', 'developer', 'developers',
+    'architect', 'consultant', 'team', 'teams', 'member', 'members',
+    
+    # Generic tech context words
+    'product', 'products', 'project', 'projects', 'platform', 'platforms',
+    'system', 'systems', 'service', 'services', 'application', 'applications',
+    'solution', 'solutions', 'feature', 'features', 'component', 'components',
+    'code', 'software', 'hardware', 'tool', 'tools', 'environment',
+    
+    # Time & quantities
+    'years', 'year', 'months', 'month', 'day', 'days', 'experience',
+    'millions', 'thousands', 'scale', 'least', 'active',
+    
+    # Role descriptors
+    'requirements', 'responsibilities', 'duties', 'tasks', 'qualifications',
+    'skills', 'skill', 'ability', 'knowledge', 'expertise', 'proficiency',
+    
+    # Common tech-adjacent words that aren't skills
+    'production', 'field', 'based', 'related', 'using', 'native',
+    'computer', 'machines', 'user', 'users', 'client', 'clients',
+    'customer', 'customers', 'people', 'person', 'business', 'company'
+})
+
 def extract_keywords(text, top_n=20):
     """Extract top technical keywords from text using ML-inspired approach"""
-    tokens = tokenize(text)
-    
-    # Get context words for better classification
-    context_words = set(text.lower().split())
-    
-    # Core stop words - supplemented by pattern-based detection
-    generic_words = {
-        # Common verbs (will catch -ing forms with pattern detection)
-        'experience', 'work', 'build', 'create', 'develop', 'implement', 'maintain',
-        'design', 'write', 'test', 'deploy', 'drive', 'manage', 'lead', 'help',
-        
-        # Position-related terms
-        'senior', 'junior', 'lead', 'principal', 'staff', 'associate', 'intern',
-        'manager', 'director', 'engineer', 'engineers', 'developer', 'developers',
-        'architect', 'consultant', 'team', 'teams', 'member', 'members',
-        
-        # Generic tech context words
-        'product', 'products', 'project', 'projects', 'platform', 'platforms',
-        'system', 'systems', 'service', 'services', 'application', 'applications',
-        'solution', 'solutions', 'feature', 'features', 'component', 'components',
-        'code', 'software', 'hardware', 'tool', 'tools', 'environment',
-        
-        # Time & quantities
-        'years', 'year', 'months', 'month', 'day', 'days', 'experience',
-        'millions', 'thousands', 'scale', 'least', 'active',
-        
-        # Role descriptors
-        'requirements', 'responsibilities', 'duties', 'tasks', 'qualifications',
-        'skills', 'skill', 'ability', 'knowledge', 'expertise', 'proficiency',
-        
-        # Common tech-adjacent words that aren't skills
-        'production', 'field', 'based', 'related', 'using', 'native',
-        'computer', 'machines', 'user', 'users', 'client', 'clients',
-        'customer', 'customers', 'people', 'person', 'business', 'company'
-    }
-    
+    return rank_keywords(tokenize(text), top_n)
+
+def rank_keywords(tokens, top_n=20):
+    """Top technical keywords among already tokenized text"""
     # Use ML-inspired scoring: combine frequency + technical classification
     technical_tokens = []
     for token in tokens:
         # Skip generic words and very short words
-        if token in generic_words or len(token) < 3:
+        if token in KEYWORD_GENERIC_WORDS or len(token) < 3:
             continue
         # Only include if it's classified as technical
-        if is_technical_keyword(token, context_words):
+        if is_technical_keyword(token):
             technical_tokens.append(token)
     
     # Score tokens by frequency (TF-IDF intuition)
@@ -253,6 +268,7 @@ def extract_keywords(text, top_n=20):
     # Return top N most frequent technical keywords
     return [word for word, _ in counter.most_common(top_n)]
 
+@lru_cache(maxsize=TERM_CACHE_SIZE)
 def is_likely_soft_skill_or_business_term(word):
     """
     Use linguistic patterns to detect soft skills and business terms.
@@ -263,9 +279,7 @@ def is_likely_soft_skill_or_business_term(word):
     # Pattern 1: Gerunds (ending in -ing) are often soft skills or actions
     if word_lower.endswith('ing') and len(word_lower) > 5:
         # Exceptions: some -ing words are technical (e.g., "testing", "profiling")
-        tech_ing_words = {'testing', 'profiling', 'debugging', 'logging', 'caching', 
-                          'hashing', 'parsing', 'rendering', 'scaling', 'monitoring'}
-        if word_lower not in tech_ing_words:
+        if word_lower not in TECH_ING_WORDS:
             return True
     
     # Pattern 2: Abstract nouns ending in -tion, -ment, -ness, -ship, -ity
@@ -273,42 +287,28 @@ def is_likely_soft_skill_or_business_term(word):
         return True
     
     # Pattern 3: Plural generic terms (teams, peers, partners, people, users)
-    if word_lower.endswith('s') and len(word_lower) > 3:
-        singular = word_lower[:-1]
-        generic_plurals = ['team', 'peer', 'partner', 'people', 'person', 'member', 
-                          'client', 'customer', 'user', 'engineer', 'developer', 'blocker', 'answer']
-        if singular in generic_plurals or word_lower in [p + 's' for p in generic_plurals]:
-            return True
+    if word_lower.endswith('s') and len(word_lower) > 3 and word_lower[:-1] in GENERIC_PLURALS:
+        return True
     
     # Pattern 4: Adjectives ending in -ful, -ive, -able, -ible (meaningful, effective, scalable)
     if word_lower.endswith(('ful', 'ive', 'able', 'ible', 'ous', 'ent', 'ant')):
         return True
     
     # Pattern 5: Common action verbs (identify, escalate, coordinate, etc.)
-    action_verbs = {'identify', 'escalate', 'coordinate', 'facilitate', 'enable', 'drive',
-                    'ensure', 'provide', 'support', 'assist', 'help', 'deliver', 'achieve',
-                    'establish', 'maintain', 'develop', 'create', 'build', 'implement',
-                    'execute', 'perform', 'conduct', 'manage', 'oversee', 'direct'}
-    if word_lower in action_verbs:
+    if word_lower in ACTION_VERBS:
         return True
     
     # Pattern 6: Common soft skill roots
-    soft_skill_roots = ['trust', 'leader', 'manage', 'collaborat', 'communi', 'organiz',
-                       'motiv', 'passion', 'creativ', 'innov', 'strate', 'vision', 'escalat',
-                       'integrit', 'hones', 'ethic', 'transparen', 'accountab', 'depend',
-                       'cooperat', 'interpers', 'empath', 'adapt', 'resilien', 'patien', 'diligen']
-    if any(root in word_lower for root in soft_skill_roots):
+    if SOFT_SKILL_ROOTS.search(word_lower):
         return True
     
     # Pattern 7: Exact soft skill words (catch common ones directly)
-    exact_soft_skills = {'trust', 'integrity', 'honesty', 'ethics', 'transparency',
-                        'accountability', 'teamwork', 'leadership', 'empathy', 'patience',
-                        'adaptability', 'flexibility', 'resilience', 'diligence'}
-    if word_lower in exact_soft_skills:
+    if word_lower in EXACT_SOFT_SKILLS:
         return True
     
     return False
 
+@lru_cache(maxsize=TERM_CACHE_SIZE)
 def is_valid_skill(skill):
     """Check if extracted skill is valid and likely technical"""
     if not skill:
@@ -334,62 +334,93 @@ def is_valid_skill(skill):
     
     return True
 
-def calculate_skill_match(resume_skills, job_description):
-    """Calculate percentage of required skills matched with better accuracy"""
-    # Filter out invalid skills
-    resume_skills = [skill for skill in resume_skills if is_valid_skill(skill)]
-    
-    if not resume_skills:
-        return 0.0, 0, 0
-    
-    job_text_lower = job_description.lower()
-    job_tokens = set(tokenize(job_description))
-    
-    # Define skill synonyms for better matching
-    skill_synonyms = {
-        'python': ['python', 'py', 'python3'],
-        'javascript': ['javascript', 'js', 'nodejs', 'node.js', 'node'],
-        'java': ['java', 'jvm'],
-        'react': ['react', 'reactjs', 'react.js'],
-        'angular': ['angular', 'angularjs'],
-        'vue': ['vue', 'vuejs', 'vue.js'],
-        'docker': ['docker', 'containerization', 'containers'],
-        'kubernetes': ['kubernetes', 'k8s'],
-        'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda'],
-        'azure': ['azure', 'microsoft azure'],
-        'gcp': ['gcp', 'google cloud', 'google cloud platform'],
-        'sql': ['sql', 'mysql', 'postgresql', 'postgres', 'database'],
-        'nosql': ['nosql', 'mongodb', 'cassandra', 'dynamodb'],
-        'api': ['api', 'rest', 'restful', 'graphql'],
-        'ci/cd': ['ci/cd', 'cicd', 'jenkins', 'github actions', 'gitlab'],
-        'machine learning': ['machine learning', 'ml', 'ai', 'artificial intelligence'],
-        'android': ['android', 'android sdk'],
-        'ios': ['ios', 'swift', 'objective-c'],
-        'kotlin': ['kotlin', 'kt']
-    }
-    
+# Skill synonyms for better matching
+SKILL_SYNONYMS = {
+    'python': ['python', 'py', 'python3'],
+    'javascript': ['javascript', 'js', 'nodejs', 'node.js', 'node'],
+    'java': ['java', 'jvm'],
+    'react': ['react', 'reactjs', 'react.js'],
+    'angular': ['angular', 'angularjs'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'docker': ['docker', 'containerization', 'containers'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'aws': ['aws', 'amazon web services', 'ec2', 's3', 'lambda'],
+    'azure': ['azure', 'microsoft azure'],
+    'gcp': ['gcp', 'google cloud', 'google cloud platform'],
+    'sql': ['sql', 'mysql', 'postgresql', 'postgres', 'database'],
+    'nosql': ['nosql', 'mongodb', 'cassandra', 'dynamodb'],
+    'api': ['api', 'rest', 'restful', 'graphql'],
+    'ci/cd': ['ci/cd', 'cicd', 'jenkins', 'github actions', 'gitlab'],
+    'machine learning': ['machine learning', 'ml', 'ai', 'artificial intelligence'],
+    'android': ['android', 'android sdk'],
+    'ios': ['ios', 'swift', 'objective-c'],
+    'kotlin': ['kotlin', 'kt']
+}
+
+def normalize_resume_skills(resume_skills):
+    """Valid resume skills, lowercased and stripped"""
+    return [skill.lower().strip() for skill in resume_skills if skill and is_valid_skill(skill)]
+
+def build_synonym_index(synonyms):
+    """Inverted synonym index: variant -> canonical skills it stands for"""
+    index = {}
+    for canonical, variants in synonyms.items():
+        for variant in variants:
+            index.setdefault(variant, set()).add(canonical)
+    return index
+
+SYNONYM_INDEX = build_synonym_index(SKILL_SYNONYMS)
+
+# Job descriptions are analyzed once per container and cached by their text
+JOB_PROFILE_CACHE_SIZE = int(os.environ.get('JOB_PROFILE_CACHE_SIZE', '512'))
+
+@lru_cache(maxsize=JOB_PROFILE_CACHE_SIZE)
+def job_canonical_skills(job_text_lower):
+    """
+    Canonical skills with at least one variant present in the job text.
+    Each variant is a substring test, so the cost grows with the job text
+    and the synonym table; results are cached per job text, which also
+    covers registry jobs whose stored features are rebuilt.
+    """
+    return frozenset(
+        canonical for canonical, variants in SKILL_SYNONYMS.items()
+        if any(variant in job_text_lower for variant in variants)
+    )
+
+def match_resume_skills(resume_skill_set, job_text_lower, job_tokens, job_canonicals=None):
+    """
+    Resume skills (from normalize_resume_skills) the job description covers.
+    job_canonicals (from job_canonical_skills) can be passed in when the same
+    job is matched against several resumes.
+    """
+    # Without job_canonicals, canonical skills are looked up in the job text
+    # on first use: {canonical: present}
+    checked = {}
     matched_skills = []
-    resume_skill_set = [skill.lower().strip() for skill in resume_skills if skill]
-    
     for resume_skill in resume_skill_set:
+        # A known variant matches when the job mentions any variant of the same
+        # skill (this also covers a direct substring match of the variant itself)
+        canonicals = SYNONYM_INDEX.get(resume_skill)
+        if canonicals is not None:
+            if job_canonicals is not None:
+                present = not canonicals.isdisjoint(job_canonicals)
+            else:
+                present = False
+                for canonical in canonicals:
+                    if canonical not in checked:
+                        checked[canonical] = any(variant in job_text_lower for variant in SKILL_SYNONYMS[canonical])
+                    if checked[canonical]:
+                        present = True
+                        break
+            if present:
+                matched_skills.append(resume_skill)
+                continue
+        
         # Direct substring match in job description
-        if resume_skill in job_text_lower:
+        elif resume_skill in job_text_lower:
             matched_skills.append(resume_skill)
             continue
         
-        # Check with synonyms
-        matched = False
-        for canonical, variants in skill_synonyms.items():
-            if resume_skill in variants:
-                # Check if any variant is in job description
-                if any(variant in job_text_lower for variant in variants):
-                    matched_skills.append(resume_skill)
-                    matched = True
-                    break
-        
-        if matched:
-            continue
-        
         # Token-based matching for multi-word skills
         resume_skill_tokens = set(resume_skill.split())
         if resume_skill_tokens.issubset(job_tokens):
@@ -401,15 +432,245 @@ def calculate_skill_match(resume_skills, job_description):
             overlap = resume_skill_tokens.intersection(job_tokens)
             if len(overlap) / len(resume_skill_tokens) >= 0.7:
                 matched_skills.append(resume_skill)
+    return matched_skills
+
+def calculate_skill_match(resume_skills, job_description):
+    """
+    Calculate percentage of required skills matched with better accuracy
+    (job_description may be a JobProfile)
+    """
+    # Filter out invalid skills
+    resume_skill_set = normalize_resume_skills(resume_skills)
     
     if not resume_skill_set:
         return 0.0, 0, 0
     
+    job = job_profile(job_description)
+    matched_skills = match_resume_skills(resume_skill_set, job.lower, job.token_set, job.canonical_skills)
+    
     # Return: (percentage, matched_count, total_resume_skills)
     return (len(matched_skills) / len(resume_skill_set)) * 100, len(matched_skills), len(resume_skill_set)
 
+def required_years(job_lower):
+    """Most years of experience the job asks for, or None if it names no number"""
+    if 'years' in job_lower or 'experience' in job_lower:
+        # Extract required years from job description
+        year_matches = re.findall(r'(\d+)\+?\s*year', job_lower)
+        if year_matches:
+            return max([int(y) for y in year_matches])
+    return None
+
+def experience_relevance(resume_data, job_description):
+    """Experience score (0-100) against the years the job asks for"""
+    # DynamoDB returns numbers as Decimal, which does not mix with the float weights
+    years = float(resume_data.get('experience', {}).get('years', 0) or 0)
+    if years > 0:
+        return experience_score(years, job_profile(job_description).required_years)
+    return 0
+
+def experience_score(years, required):
+    """Experience score (0-100) for years > 0 against required years (None if unstated)"""
+    if required is not None:
+        return min(100, (years / required) * 100) if required > 0 else 50
+    return min(100, years * 20)  # 5 years = 100%
+
+def education_relevance(resume_data):
+    """Education score (0-100) from degree level and field"""
+    education_score = 0
+    if resume_data.get('education'):
+        education_text = ' '.join(resume_data['education']).lower()
+        
+        # Check for degree match
+        if any(deg in education_text for deg in ['phd', 'doctorate']):
+            education_score = 100
+        elif any(deg in education_text for deg in ['master', 'msc', 'ms', 'mba']):
+            education_score = 85
+        elif any(deg in education_text for deg in ['bachelor', 'bsc', 'bs', 'be', 'btech']):
+            education_score = 70
+        
+        # Boost if relevant field
+        relevant_fields = ['computer science', 'software', 'engineering', 'information technology', 'cs']
+        if any(field in education_text for field in relevant_fields):
+            education_score = min(100, education_score + 15)
+    return education_score
+
+def combine_scores(similarity_score, skill_match, experience_score, education_score):
+    """
+    Weighted final score before capping (all components are 0-100 scale,
+    similarity 0-1); works elementwise on NumPy arrays too.
+    Weights: TF-IDF similarity (40%), Skill match (35%), Experience relevance (15%), Education (10%)
+    """
+    return (
+        (similarity_score * 100) * 0.40 +
+        skill_match * 0.35 +
+        experience_score * 0.15 +
+        education_score * 0.10
+    )
+
+# Comprehensive whitelist of technical terms for missing-keyword feedback
+TECH_WHITELIST = frozenset({
+    # Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust',
+    'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'c', 'objective-c',
+    # Frameworks
+    'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 'nextjs',
+    'node.js', 'nodejs', 'node', 'fastapi', 'laravel', 'rails', '.net', 'asp.net',
+    # Cloud/DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'k8s', 'terraform', 'ansible',
+    'jenkins', 'gitlab', 'github', 'circleci', 'cloudformation', 'lambda', 'ec2', 's3',
+    # Databases
+    'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'dynamodb', 'cassandra',
+    'elasticsearch', 'oracle', 'sqlite', 'mariadb',
+    # ML/Data
+    'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'spark', 'hadoop',
+    'scikit-learn', 'scikit', 'machine learning', 'ml', 'deep learning', 'ai',
+    # Testing
+    'junit', 'pytest', 'jest', 'mocha', 'selenium', 'cypress', 'testng',
+    # Other
+    'graphql', 'rest', 'restful', 'api', 'microservices', 'git', 'linux', 'unix', 'bash'
+})
+
+# Characters that glue a term to its neighbours: "c" is not a term of
+# "c++", "c#" or "r&d", nor "net" of "asp.net"
+TERM_CHARS = r'\w+#&'
+TERM_TOKEN_PATTERN = re.compile(f'[{TERM_CHARS}]+')
+
+def bounded_term_pattern(term):
+    """Regex for a term that is not glued to term characters on either side"""
+    return re.compile(f'(?<![{TERM_CHARS}]){re.escape(term)}(?![{TERM_CHARS}])')
+
+# Terms made only of term characters (python, c++, c#) are looked up in the
+# job's token set; the few with other punctuation or spaces (.net,
+# machine learning) get a regex each
+TECH_WHITELIST_WORDS = frozenset(term for term in TECH_WHITELIST if TERM_TOKEN_PATTERN.fullmatch(term))
+TECH_WHITELIST_PHRASES = tuple(
+    (term, bounded_term_pattern(term)) for term in sorted(TECH_WHITELIST - TECH_WHITELIST_WORDS)
+)
+
+def whitelist_terms_in(job_lower):
+    """Whitelisted technical terms that occur in the job text as whole terms"""
+    present = set(TERM_TOKEN_PATTERN.findall(job_lower)).intersection(TECH_WHITELIST_WORDS)
+    # The plain substring test is cheap and rules out most phrases before the regex runs
+    present.update(term for term, pattern in TECH_WHITELIST_PHRASES if term in job_lower and pattern.search(job_lower))
+    return present
+
+# Technical areas a job can be about, as named in the cover letter
+TECH_AREAS = {
+    'backend': ['backend', 'server', 'api', 'database', 'sql', 'python', 'java', 'node'],
+    'frontend': ['frontend', 'react', 'angular', 'vue', 'javascript', 'ui', 'ux'],
+    'cloud': ['aws', 'azure', 'gcp', 'cloud', 'serverless', 'lambda', 'docker', 'kubernetes'],
+    'mobile': ['android', 'ios', 'mobile', 'swift', 'kotlin', 'react native'],
+    'data': ['data', 'analytics', 'machine learning', 'ml', 'ai', 'tensorflow', 'spark'],
+    'devops': ['devops', 'ci/cd', 'jenkins', 'gitlab', 'terraform', 'ansible']
+}
+
+# Bump when JobProfile.to_features() changes; older registry features are recomputed
+JOB_FEATURES_VERSION = 2
+
+class JobProfile:
+    """
+    Everything scoring needs from one job description, computed once:
+    tokens, TF-IDF vector, skills and whitelist terms it mentions, the
+    years it asks for, keywords and technical areas. Feedback-only parts
+    are computed on first use. Shared through the cache, so treat it as
+    read-only.
+    """
+
+    def __init__(self, job_description, features=None):
+        """features: a stored to_features() dict, used instead of re-analyzing the text"""
+        self.text = job_description
+        self.lower = job_description.lower()
+        if (features and features.get('version') == JOB_FEATURES_VERSION and
+                features.get('tokenizer_version') == TOKENIZER_VERSION):
+            # Token order only matters through first occurrences, which the counts keep
+            self.tokens = [token for token, count in features['term_counts'].items() for _ in range(count)]
+            self.canonical_skills = frozenset(features['skills'])
+            self.required_years = features['required_years']
+            self.keywords = tuple(features['keywords'])
+            self.whitelist_terms = frozenset(features['whitelist_terms'])
+        else:
+            self.tokens = tokenize(job_description)
+            self.canonical_skills = job_canonical_skills(self.lower)
+            self.required_years = required_years(self.lower)
+        self.token_set = frozenset(self.tokens)
+        # Corpus IDF does not depend on the resume, so the job vector is built
+        # once; with two-document IDF it is rebuilt for every comparison
+        self.vector = tfidf_vector(self.tokens, vocabulary, idf_table) if idf_table is not None else None
+
+    def to_features(self):
+        """JSON-serializable features for the job registry (term counts rather than container-local ids)"""
+        return {
+            'version': JOB_FEATURES_VERSION,
+            'tokenizer_version': TOKENIZER_VERSION,
+            'term_counts': dict(Counter(self.tokens)),
+            'skills': sorted(self.canonical_skills),
+            'required_years': self.required_years,
+            'keywords': list(self.keywords),
+            'whitelist_terms': sorted(self.whitelist_terms)
+        }
+
+    @cached_property
+    def tech_tokens(self):
+        return frozenset(token for token in self.token_set if is_technical_keyword(token))
+
+    @cached_property
+    def keywords(self):
+        return tuple(rank_keywords(self.tokens))
+
+    @cached_property
+    def whitelist_terms(self):
+        return frozenset(whitelist_terms_in(self.lower))
+
+    @cached_property
+    def areas(self):
+        return tuple(area for area, keywords in TECH_AREAS.items() if any(kw in self.lower for kw in keywords))
+
+@lru_cache(maxsize=JOB_PROFILE_CACHE_SIZE)
+def cached_job_profile(job_description):
+    return JobProfile(job_description)
+
+def job_profile(job):
+    """
+    JobProfile for a job description, cached per container by its text so
+    retries, batch compares and other candidates for the same job skip the
+    preprocessing. An existing JobProfile is returned as is.
+    """
+    if isinstance(job, JobProfile):
+        return job
+    return cached_job_profile(job)
+
+def registered_jobs(jd_ids):
+    """{jd_id: (title, JobProfile)} for jobs stored by register_jobs; unknown ids are left out"""
+    return job_registry.lookup(jd_ids, lambda item: (
+        item.get('title') or 'Untitled Job', JobProfile(item['job_description'], item['features'])
+    ))
+
+def score_resume(resume_data, job_description):
+    """
+    (final score, skill match, matched skills, valid resume skills) of one
+    resume against one job description (or its JobProfile)
+    """
+    # Prepare texts for comparison
+    resume_text = build_resume_text(resume_data)
+    
+    # Calculate enhanced TF-IDF similarity with domain-aware boosting
+    # Lightweight hybrid approach - no external ML libraries needed
+    # Returns 0-1, we'll convert to percentage in final_score calculation
+    similarity_score = calculate_enhanced_similarity(resume_text, job_description)
+    
+    # Calculate skill match percentage
+    skill_match, matched_count, total_resume_skills = calculate_skill_match(resume_data.get('skills', []), job_description)
+    
+    # Enhanced weighted scoring with multiple factors
+    experience_score = experience_relevance(resume_data, job_description)
+    education_score = education_relevance(resume_data)
+    final_score = combine_scores(similarity_score, skill_match, experience_score, education_score)
+    
+    # Ensure score is capped at 100
+    return min(100, max(0, final_score)), skill_match, matched_count, total_resume_skills
+
 def generate_feedback(score, skill_match, resume_data, job_keywords, job_description="", matched_count=0, total_resume_skills=0):
-    """Generate detailed feedback with ML-inspired keyword filtering"""
+    """Generate detailed feedback with ML-inspired keyword filtering (job_description may be a JobProfile)"""
     feedback = {
         'overall_score': round(score, 2),
         'skill_match_percentage': round(skill_match, 2),
@@ -422,43 +683,6 @@ def generate_feedback(score, skill_match, resume_data, job_keywords, job_descrip
         'resume_skills': resume_data.get('skills', [])
     }
     
-    # Enhanced filtering for missing keywords
-    non_skill_words = {
-        'distributed', 'drive', 'end', 'engineer', 'features', 'platforms',
-        'impactful', 'systems', 'services', 'tools', 'solutions', 'processes',
-        'environment', 'infrastructure', 'architecture', 'implementation',
-        'development', 'application', 'system', 'service', 'tool', 'solution',
-        'process', 'feature', 'platform', 'component', 'module', 'library',
-        'package', 'framework', 'project', 'product', 'user', 'users',
-        'client', 'server', 'backend', 'frontend', 'fullstack', 'senior',
-        'junior', 'lead', 'principal', 'staff', 'associate', 'intern',
-        'mission', 'critical', 'scalable', 'reliable', 'efficient', 'optimize',
-        'improve', 'enhance', 'develop', 'create', 'build', 'implement',
-        'deploy', 'maintain', 'support', 'deliver', 'collaborate', 'work',
-        'responsible', 'ownership', 'initiative', 'proactive', 'detail',
-        'android', 'restful', 'apis', 'interest', 'learning', 'curiosity',
-        'passion', 'motivated', 'team', 'communication', 'skills', 'ability',
-        'years', 'knowledge', 'understanding', 'problem', 'solving', 'based',
-        'machines', 'interested', 'excited', 'enthusiastic', 'eager', 'dedicated',
-        'focused', 'oriented', 'minded', 'driven', 'proficiency', 'expertise',
-        'professional', 'quality', 'best', 'practices', 'standards', 'requirements',
-        'responsibilities', 'duties', 'tasks', 'activities', 'operations',
-        # Additional soft skills and buzzwords
-        'scalability', 'flexibility', 'reliability', 'availability', 'maintainability',
-        'productivity', 'efficiency', 'performance', 'optimization', 'integration',
-        'collaboration', 'innovation', 'creativity', 'leadership', 'management',
-        'strategy', 'planning', 'execution', 'delivery', 'success', 'growth',
-        'impact', 'value', 'excellence', 'commitment', 'dedication', 'passion',
-        'experience', 'background', 'knowledge', 'expertise', 'proficiency',
-        'capability', 'competency', 'skill', 'qualification', 'requirement',
-        'strong', 'excellent', 'good', 'great', 'high', 'advanced', 'expert',
-        # Soft skill words that should NEVER appear as technical skills
-        'trust', 'trustworthy', 'integrity', 'honest', 'honesty', 'ethics', 'ethical',
-        'transparency', 'accountable', 'accountability', 'dependable', 'reliable',
-        'collaborative', 'cooperative', 'teamwork', 'interpersonal', 'empathy',
-        'adaptable', 'flexible', 'resilient', 'patient', 'persistent', 'diligent'
-    }
-    
     # Find matched skills
     all_resume_skills = resume_data.get('skills', [])
     # Filter out invalid skills
@@ -466,8 +690,11 @@ def generate_feedback(score, skill_match, resume_data, job_keywords, job_descrip
     resume_skills_lower = {skill.lower(): skill for skill in valid_resume_skills}
     job_keywords_lower = set(kw.lower() for kw in job_keywords[:20])
     
+    # One substring test against the joined keywords covers exact hits and
+    # skills inside a keyword; only the remaining skills scan the keywords
+    joined_keywords = '\0'.join(job_keywords_lower)
     for skill_lower, skill_original in resume_skills_lower.items():
-        if skill_lower in job_keywords_lower or any(skill_lower in kw or kw in skill_lower for kw in job_keywords_lower):
+        if skill_lower in joined_keywords or any(kw in skill_lower for kw in job_keywords_lower):
             feedback['matched_skills'].append(skill_original)
     
     # Strengths with more specific criteria
@@ -506,42 +733,12 @@ def generate_feedback(score, skill_match, resume_data, job_keywords, job_descrip
     
     # SIMPLIFIED APPROACH: Extract technical keywords directly from job description
     # Only show keywords that appear explicitly in the job text
-    job_lower = job_description.lower()
-    
-    # Define a comprehensive whitelist of technical terms
-    tech_whitelist = {
-        # Languages
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'rust',
-        'php', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl', 'c', 'objective-c',
-        # Frameworks
-        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 'nextjs',
-        'node.js', 'nodejs', 'node', 'fastapi', 'laravel', 'rails', '.net', 'asp.net',
-        # Cloud/DevOps
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'k8s', 'terraform', 'ansible',
-        'jenkins', 'gitlab', 'github', 'circleci', 'cloudformation', 'lambda', 'ec2', 's3',
-        # Databases
-        'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'dynamodb', 'cassandra',
-        'elasticsearch', 'oracle', 'sqlite', 'mariadb',
-        # ML/Data
-        'tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'spark', 'hadoop',
-        'scikit-learn', 'scikit', 'machine learning', 'ml', 'deep learning', 'ai',
-        # Testing
-        'junit', 'pytest', 'jest', 'mocha', 'selenium', 'cypress', 'testng',
-        # Other
-        'graphql', 'rest', 'restful', 'api', 'microservices', 'git', 'linux', 'unix', 'bash'
-    }
-    
     # Find technical terms mentioned in job description but missing from resume
-    missing_technical = []
-    for tech in tech_whitelist:
-        # Check if technical term is in job description
-        if tech in job_lower:
-            # Check if it's NOT in resume skills (case-insensitive)
-            if tech not in {s.lower() for s in resume_data.get('skills', [])}:
-                missing_technical.append(tech)
+    resume_skill_set = {s.lower() for s in resume_data.get('skills', [])}
+    missing_technical = list(job_profile(job_description).whitelist_terms - resume_skill_set)
     
     # Limit to 8 most important ones (prioritize by length - longer = more specific)
-    missing_technical.sort(key=len, reverse=True)
+    missing_technical.sort(key=lambda term: (-len(term), term))
     feedback['missing_keywords'] = missing_technical[:8]
     feedback['matched_skills'] = feedback['matched_skills'][:15]
     
@@ -558,12 +755,11 @@ def generate_cover_letter(resume_data, job_description):
     positions = experience_data.get('positions', [])
     
     # Analyze job description for key requirements
-    job_tokens = tokenize(job_description)
-    job_keywords = extract_keywords(job_description, top_n=10)
+    job = job_profile(job_description)
     
     # Find matching skills
     matched_skills = []
-    job_text_lower = job_description.lower()
+    job_text_lower = job.lower
     for skill in skills[:15]:
         if skill.lower() in job_text_lower:
             matched_skills.append(skill)
@@ -572,19 +768,7 @@ def generate_cover_letter(resume_data, job_description):
     top_skills = matched_skills[:5] if len(matched_skills) >= 5 else skills[:5]
     
     # Identify key technical areas mentioned in job
-    tech_areas = {
-        'backend': ['backend', 'server', 'api', 'database', 'sql', 'python', 'java', 'node'],
-        'frontend': ['frontend', 'react', 'angular', 'vue', 'javascript', 'ui', 'ux'],
-        'cloud': ['aws', 'azure', 'gcp', 'cloud', 'serverless', 'lambda', 'docker', 'kubernetes'],
-        'mobile': ['android', 'ios', 'mobile', 'swift', 'kotlin', 'react native'],
-        'data': ['data', 'analytics', 'machine learning', 'ml', 'ai', 'tensorflow', 'spark'],
-        'devops': ['devops', 'ci/cd', 'jenkins', 'gitlab', 'terraform', 'ansible']
-    }
-    
-    relevant_areas = []
-    for area, keywords in tech_areas.items():
-        if any(kw in job_text_lower for kw in keywords):
-            relevant_areas.append(area)
+    relevant_areas = job.areas
     
     # Build cover letter sections
     
@@ -672,11 +856,183 @@ def generate_cover_letter(resume_data, job_description):
     
     return cover_letter
 
+def register_jobs(event):
+    """Handle the register_jobs action: {jobs: [{title, description}]} -> [{jd_id, title}]"""
+    jobs = [job for job in event.get('jobs') or [] if job.get('description', '').strip()]
+    if not jobs:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({
+                'error': 'Missing jobs'
+            })
+        }
+    
+    registered = []
+    for job in jobs:
+        description = job['description']
+        title = job.get('title') or 'Untitled Job'
+        jd_id = job_registry.job_id(description)
+        job_registry.store(jd_id, title, description, job_profile(description).to_features())
+        registered.append({'jd_id': jd_id, 'title': title})
+    print(f"Registered {len(registered)} job descriptions")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Job descriptions registered',
+            'jobs': registered
+        })
+    }
+
+def batch_compare(event):
+    """Handle the batch_compare action: {analysis_id, jobs: [{title, description} or {jd_id}], feedback_limit?, top_k?}"""
+    from batch_scoring import score_jobs
+    
+    analysis_id = event.get('analysis_id')
+    jobs = event.get('jobs') or []
+    if not analysis_id or not jobs:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({
+                'error': 'Missing analysis_id or jobs'
+            })
+        }
+    
+    response = table.get_item(Key={'analysis_id': analysis_id})
+    if 'Item' not in response:
+        return {
+            'statusCode': 404,
+            'body': json.dumps({
+                'error': 'Resume analysis not found'
+            })
+        }
+    
+    top_k = max(1, int(event['top_k'])) if event.get('top_k') else None
+    start = time.perf_counter()
+    results, errors = score_jobs(response['Item'], jobs, event.get('feedback_limit'), top_k)
+    print(f"Batch compare: {len(jobs)} jobs ({len(errors)} unscorable) in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Batch comparison completed',
+            'analysis_id': analysis_id,
+            'results': results,
+            'errors': errors
+        })
+    }
+
+MAX_RECOMMENDATIONS = 100
+
+def recommend_jobs(event):
+    """Handle the recommend_jobs action: {analysis_id, k?, feedback_limit?} -> best registered jobs"""
+    from recommendation import job_index, recommend
+    
+    analysis_id = event.get('analysis_id')
+    if not analysis_id:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({
+                'error': 'Missing analysis_id'
+            })
+        }
+    if job_index is None:
+        return {
+            'statusCode': 503,
+            'body': json.dumps({
+                'error': 'Job index not available'
+            })
+        }
+    
+    response = table.get_item(Key={'analysis_id': analysis_id})
+    if 'Item' not in response:
+        return {
+            'statusCode': 404,
+            'body': json.dumps({
+                'error': 'Resume analysis not found'
+            })
+        }
+    
+    k = max(1, min(int(event.get('k') or 10), MAX_RECOMMENDATIONS))
+    start = time.perf_counter()
+    results = recommend(response['Item'], k, event.get('feedback_limit'))
+    print(f"Recommended {len(results)} of {len(job_index)} jobs in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Job recommendations completed',
+            'analysis_id': analysis_id,
+            'results': results,
+            # Jobs registered after this are not recommended until the index is rebuilt
+            'index_built_at': datetime.fromtimestamp(job_index.built_at, timezone.utc).isoformat()
+        })
+    }
+
+MAX_CANDIDATES = 200
+# Every pooled resume is fetched and fully scored
+MAX_CANDIDATE_POOL = 1000
+
+def search_candidates(event):
+    """Handle the search_candidates action: {job_description or jd_id, k?, pool?} -> best indexed resumes"""
+    from candidate_index import CANDIDATE_POOL, search
+    
+    job = event.get('job_description')
+    jd_id = event.get('jd_id')
+    if jd_id:
+        job = registered_jobs([jd_id]).get(jd_id, (None, None))[1]
+        if job is None:
+            return {
+                'statusCode': 404,
+                'body': json.dumps({
+                    'error': 'Job description not found'
+                })
+            }
+    if not job:
+        return {
+            'statusCode': 400,
+            'body': json.dumps({
+                'error': 'Missing job_description or jd_id'
+            })
+        }
+    
+    k = max(1, min(int(event.get('k') or 50), MAX_CANDIDATES))
+    start = time.perf_counter()
+    pool = max(1, min(int(event.get('pool') or CANDIDATE_POOL), MAX_CANDIDATE_POOL))
+    results = search(job, k, pool)
+    print(f"Candidate search: top {len(results)} in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Candidate search completed',
+            'jd_id': jd_id,
+            'results': results
+        })
+    }
+
+def handle_stream_event(records):
+    """
+    Keep the candidate index current from the analysis table's stream.
+    Records that fail are reported as a partial batch response
+    (ReportBatchItemFailures) and retried; any other error raises, so the
+    whole batch is retried instead of being acknowledged.
+    """
+    from candidate_index import apply_stream_records
+    failures = apply_stream_records(records)
+    print(f"Candidate index: {len(records) - len(failures)} of {len(records)} stream records applied")
+    return {'batchItemFailures': [{'itemIdentifier': sequence} for sequence in failures]}
+
 def lambda_handler(event, context):
     """
     Lambda handler for score calculation
-    Expects analysis_id and job_description in the request
+    Expects analysis_id and job_description (or the jd_id of a registered job) in the request
     """
+    # Analysis table stream: handled outside the try, whose error response
+    # would count as a successful batch
+    if isinstance(event, dict) and event.get('Records') and event['Records'][0].get('eventSource') == 'aws:dynamodb':
+        return handle_stream_event(event['Records'])
+    
     try:
         print(f"Received event: {json.dumps(event)}")
         
@@ -707,6 +1063,27 @@ def lambda_handler(event, context):
                 })
             }
         
+        if vocabulary.reset_if_full():
+            # Cached job vectors hold ids from the forgotten vocabulary
+            cached_job_profile.cache_clear()
+            job_registry.memory_cache.clear()
+        
+        # Store job descriptions once and score against their jd_id afterwards
+        if isinstance(event, dict) and event.get('action') == 'register_jobs':
+            return register_jobs(event)
+        
+        # Rank one analyzed resume against many job descriptions
+        if isinstance(event, dict) and event.get('action') == 'batch_compare':
+            return batch_compare(event)
+        
+        # Best registered jobs for one analyzed resume, from the job index
+        if isinstance(event, dict) and event.get('action') == 'recommend_jobs':
+            return recommend_jobs(event)
+        
+        # Best indexed resumes for one job description
+        if isinstance(event, dict) and event.get('action') == 'search_candidates':
+            return search_candidates(event)
+        
         # Parse request body for normal scoring
         if 'body' in event:
             body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
@@ -715,8 +1092,9 @@ def lambda_handler(event, context):
         
         analysis_id = body.get('analysis_id')
         job_description = body.get('job_description')
+        jd_id = body.get('jd_id')
         
-        if not analysis_id or not job_description:
+        if not analysis_id or not (job_description or jd_id):
             return {
                 'statusCode': 400,
                 'headers': {
@@ -724,10 +1102,25 @@ def lambda_handler(event, context):
                     'Access-Control-Allow-Origin': '*'
                 },
                 'body': json.dumps({
-                    'error': 'Missing required fields: analysis_id and job_description'
+                    'error': 'Missing required fields: analysis_id and job_description (or jd_id)'
                 })
             }
         
+        if jd_id:
+            registered = registered_jobs([jd_id])
+            if jd_id not in registered:
+                return {
+                    'statusCode': 404,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'error': 'Job description not found'
+                    })
+                }
+            job_description = registered[jd_id][1]
+        
         # Retrieve resume data from DynamoDB
         response = table.get_item(Key={'analysis_id': analysis_id})
         
@@ -745,77 +1138,15 @@ def lambda_handler(event, context):
         
         resume_data = response['Item']
         
-        # Prepare texts for comparison
-        resume_text = ' '.join([
-            ' '.join(resume_data.get('skills', [])),
-            ' '.join(resume_data.get('education', [])),
-            ' '.join(resume_data.get('experience', {}).get('positions', []))
-        ])
-        
-        # Calculate enhanced TF-IDF similarity with domain-aware boosting
-        # Lightweight hybrid approach - no external ML libraries needed
-        # Returns 0-1, we'll convert to percentage in final_score calculation
-        similarity_score = calculate_enhanced_similarity(resume_text, job_description)
-        
-        # Calculate skill match percentage
-        skill_match, matched_count, total_resume_skills = calculate_skill_match(resume_data.get('skills', []), job_description)
-        
-        # Enhanced weighted scoring with multiple factors
-        # Weights: TF-IDF similarity (40%), Skill match (35%), Experience relevance (15%), Education (10%)
-        
-        # Check experience relevance
-        experience_score = 0
-        if resume_data.get('experience', {}).get('years', 0) > 0:
-            years = resume_data['experience']['years']
-            if 'years' in job_description.lower() or 'experience' in job_description.lower():
-                # Extract required years from job description
-                import re
-                year_matches = re.findall(r'(\d+)\+?\s*year', job_description.lower())
-                if year_matches:
-                    required_years = max([int(y) for y in year_matches])
-                    experience_score = min(100, (years / required_years) * 100) if required_years > 0 else 50
-                else:
-                    experience_score = min(100, years * 20)  # 5 years = 100%
-            else:
-                experience_score = min(100, years * 20)
-        
-        # Check education relevance
-        education_score = 0
-        if resume_data.get('education'):
-            education_text = ' '.join(resume_data['education']).lower()
-            job_lower = job_description.lower()
-            
-            # Check for degree match
-            if any(deg in education_text for deg in ['phd', 'doctorate']):
-                education_score = 100
-            elif any(deg in education_text for deg in ['master', 'msc', 'ms', 'mba']):
-                education_score = 85
-            elif any(deg in education_text for deg in ['bachelor', 'bsc', 'bs', 'be', 'btech']):
-                education_score = 70
-            
-            # Boost if relevant field
-            relevant_fields = ['computer science', 'software', 'engineering', 'information technology', 'cs']
-            if any(field in education_text for field in relevant_fields):
-                education_score = min(100, education_score + 15)
-        
-        # Calculate weighted final score (all components are 0-100 scale)
-        # similarity_score is 0-1, multiply by 100 to get percentage
-        # Then apply weights: 40% similarity, 35% skills, 15% experience, 10% education
-        final_score = (
-            (similarity_score * 100) * 0.40 +
-            skill_match * 0.35 +
-            experience_score * 0.15 +
-            education_score * 0.10
-        )
-        
-        # Ensure score is capped at 100
-        final_score = min(100, max(0, final_score))
+        final_score, skill_match, matched_count, total_resume_skills = score_resume(resume_data, job_description)
         
         # Extract job keywords
-        job_keywords = extract_keywords(job_description)
+        job_keywords = job_profile(job_description).keywords
         
         # Generate feedback
         feedback = generate_feedback(final_score, skill_match, resume_data, job_keywords, job_description, matched_count, total_resume_skills)
+        print(f"Term classification cache: {classify_technical_term.cache_info()}")
+        print(f"Job profile cache: {cached_job_profile.cache_info()}")
         
         # Convert float values to Decimal for DynamoDB
         def convert_floats(obj):
@@ -843,7 +1174,7 @@ def lambda_handler(event, context):
             ExpressionAttributeValues={
                 ':score': feedback_decimal['overall_score'],
                 ':feedback': feedback_decimal,
-                ':job_desc': job_description[:500],  # Store first 500 chars
+                ':job_desc': job_profile(job_description).text[:500],  # Store first 500 chars
                 ':scored_at': datetime.now().isoformat(),
                 ':status': 'completed'
             }
@@ -858,6 +1189,7 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Score calculated successfully',
                 'analysis_id': analysis_id,
+                'jd_id': jd_id,
                 'results': {
                     'compatibility_score': feedback['overall_score'],
                     'skill_match': feedback['skill_match_percentage'],
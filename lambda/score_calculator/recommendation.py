@@ -0,0 +1,223 @@
+"""
+Job Recommendation
+Top-K registered jobs for one resume, ranked by the same blend as
+lambda_handler, without scoring every job.
+
+Each resume term and skill becomes a feature with a postings list from
+the job index and an upper bound on what it adds to a job's score:
+  term    similarity weight x (resume weight x job weight), plus the
+          tech-term boost when the term is technical
+  skill   its share of the skill match, for every job that could match
+          it (canonical skill postings, the terms containing its longest
+          word, and its tokens)
+Experience and education are bounded by constants. Features are added
+term-at-a-time, largest bound first (max-score): once no job outside
+the best candidates can catch up, new jobs stop being admitted, and
+candidates that can no longer reach the cut-off are dropped.
+
+The surviving candidates are re-scored exactly from the job registry.
+If a job left out could still beat the K-th exact score, the search is
+repeated deeper, so results equal scoring every indexed job. Indexed
+jobs no longer in the registry are excluded and replaced at the same
+depth. Jobs registered after the index was built are not considered
+until it is rebuilt.
+"""
+import heapq
+import os
+import re
+from bisect import bisect_left
+from collections import Counter
+
+import batch_scoring
+import lambda_function as scorer
+from job_index import load_job_index
+
+JOB_INDEX = os.environ.get('JOB_INDEX', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_index.bin'))
+job_index = load_job_index(JOB_INDEX, scorer.TOKENIZER_VERSION, scorer.idf_table)
+
+# Score points per unit of each component, read off the scorer's blend
+SIMILARITY_WEIGHT = scorer.combine_scores(1, 0, 0, 0)
+SKILL_WEIGHT = scorer.combine_scores(0, 1, 0, 0)
+EXPERIENCE_WEIGHT = scorer.combine_scores(0, 0, 1, 0)
+EDUCATION_WEIGHT = scorer.combine_scores(0, 0, 0, 1)
+# Covers float32 job weights in the index
+BOUND_SLACK = 1e-4
+# Candidates re-scored exactly per requested result, and growth when that is not enough
+DEPTH_FACTOR = 4
+
+
+def skill_postings(index, skill):
+    """
+    Sorted job numbers that could match a normalized resume skill in
+    match_resume_skills, or None if any job could
+    """
+    docs = set()
+    canonicals = scorer.SYNONYM_INDEX.get(skill)
+    if canonicals is not None:
+        for canonical in canonicals:
+            docs.update(index.skill_postings(canonical))
+    else:
+        # A substring match puts the skill's longest word inside a job token,
+        # unless that token is too short to be kept or is a stop word
+        words = re.findall(r'[a-z0-9]+', skill)
+        longest = max(words, key=len, default='')
+        if len(longest) < 3 or any(longest in stop_word for stop_word in scorer.STOP_WORDS):
+            return None
+        for term_id in index.terms_containing(longest):
+            docs.update(index.term_postings(term_id)[0])
+    # Whole or partial token matches need one of the skill's words as a job token
+    for part in skill.split():
+        term_id = index.term_id(part) if scorer.tokenize(part) == [part] else None
+        if term_id is not None:
+            docs.update(index.term_postings(term_id)[0])
+    return sorted(docs)
+
+
+def query_features(index, resume_data):
+    """
+    ([(bound, docs, weights, scale, bonus)], constant): a feature adds
+    scale x weight + bonus (just bonus without weights) to each job in
+    docs; constant bounds what no postings list carries
+    """
+    features = []
+    tokens = scorer.tokenize(scorer.build_resume_text(resume_data))
+    counts = Counter(tokens)
+    weights = {term: count / len(tokens) * scorer.idf_table.get(term) for term, count in counts.items()}
+    norm = sum(weight * weight for weight in weights.values()) ** 0.5
+    for term, weight in weights.items():
+        term_id = index.term_id(term)
+        if term_id is None:
+            continue
+        docs, job_weights, largest = index.term_postings(term_id)
+        scale = SIMILARITY_WEIGHT * weight / norm if norm else 0.0
+        bonus = SIMILARITY_WEIGHT * scorer.TECH_BOOST_PER_TERM if scorer.is_technical_keyword(term) else 0.0
+        if scale or bonus:
+            features.append((scale * largest + bonus, docs, job_weights, scale, bonus))
+
+    constant = EDUCATION_WEIGHT * scorer.education_relevance(resume_data)
+    skills = Counter(scorer.normalize_resume_skills(resume_data.get('skills', [])))
+    total_skills = sum(skills.values())
+    for skill, count in skills.items():
+        share = SKILL_WEIGHT * 100 * count / total_skills
+        docs = skill_postings(index, skill)
+        if docs is None:
+            constant += share
+        elif docs:
+            features.append((share, docs, None, 0.0, share))
+    return features, constant
+
+
+def update_existing(scores, docs, weights, scale, bonus):
+    """Add a feature to the jobs already in scores only"""
+    if len(scores) * 16 < len(docs):
+        # Few candidates against a long list: binary-search each of them
+        end = len(docs)
+        for doc in scores:
+            i = bisect_left(docs, doc)
+            if i < end and docs[i] == doc:
+                scores[doc] += scale * weights[i] + bonus if weights is not None else bonus
+    elif weights is None:
+        for doc in docs:
+            if doc in scores:
+                scores[doc] += bonus
+    else:
+        for doc, weight in zip(docs, weights):
+            if doc in scores:
+                scores[doc] += scale * weight + bonus
+
+
+def max_score(features, depth):
+    """
+    ({job: feature sum} for the candidates, bound on every other job's
+    feature sum), keeping at least the depth best jobs
+    """
+    features = sorted(features, key=lambda feature: feature[0], reverse=True)
+    remaining = sum(feature[0] for feature in features)
+    added = 0.0
+    scores = {}
+    admitting = True
+    rest = 0.0
+    for bound, docs, weights, scale, bonus in features:
+        # No sum can exceed the bounds added so far, so the cut-off is only
+        # worth computing once those outweigh what is left
+        if len(scores) >= depth and added >= remaining:
+            cutoff = heapq.nlargest(depth, scores.values())[-1]
+            if admitting and cutoff >= remaining:
+                # A job not seen yet scores at most the remaining bounds
+                admitting = False
+                rest = remaining
+            if not admitting:
+                for doc in [doc for doc, score in scores.items() if score + remaining < cutoff]:
+                    rest = max(rest, scores.pop(doc) + remaining)
+        if admitting:
+            get = scores.get
+            if weights is None:
+                for doc in docs:
+                    scores[doc] = get(doc, 0.0) + bonus
+            else:
+                for doc, weight in zip(docs, weights):
+                    scores[doc] = get(doc, 0.0) + scale * weight + bonus
+        else:
+            update_existing(scores, docs, weights, scale, bonus)
+        remaining -= bound
+        added += bound
+    return scores, rest
+
+
+def candidates(index, features, constant, years, depth, excluded):
+    """
+    (up to depth job numbers by upper bound, bound on every other job's
+    score), leaving out the excluded job numbers
+    """
+    scores, rest = max_score(features, depth + len(excluded))
+    if depth + len(excluded) >= len(index):
+        # Every job is a candidate, including ones no feature reaches
+        scores = {doc: scores.get(doc, 0.0) for doc in range(len(index))}
+    for doc in excluded:
+        scores.pop(doc, None)
+    best_experience = EXPERIENCE_WEIGHT * 100 if years > 0 else 0.0
+    rest_bound = rest + constant + best_experience if len(scores) + len(excluded) < len(index) else 0.0
+    bounds = {}
+    for doc, score in scores.items():
+        experience = scorer.experience_score(years, index.required_years(doc)) if years > 0 else 0
+        bounds[doc] = score + constant + EXPERIENCE_WEIGHT * experience
+    chosen = heapq.nlargest(depth, bounds, key=bounds.__getitem__)
+    if len(bounds) > len(chosen):
+        chosen_set = set(chosen)
+        rest_bound = max(rest_bound, max(bound for doc, bound in bounds.items() if doc not in chosen_set))
+    return chosen, rest_bound
+
+
+def recommend(resume_data, k=10, feedback_limit=None, index=None):
+    """
+    The k best registered jobs in the job index for one resume, as
+    batch_compare results (best first, with jd_id and title)
+    """
+    index = index or job_index
+    features, constant = query_features(index, resume_data)
+    years = float(resume_data.get('experience', {}).get('years', 0) or 0)
+    # {job number: (job, profile, score, skill match, matched count)}, kept across deeper searches
+    exact = {}
+    # Indexed job numbers whose jd_id is no longer registered
+    unregistered = set()
+    depth = k * DEPTH_FACTOR
+    while True:
+        docs, rest_bound = candidates(index, features, constant, years, depth, unregistered)
+        fresh = {index.jd_id(doc): doc for doc in docs if doc not in exact}
+        jobs, profiles, errors = batch_scoring.resolve_jobs([{'jd_id': jd_id} for jd_id in fresh])
+        scores, skill_match, matched_counts, resume_skill_count = batch_scoring.score_profiles(resume_data, profiles)
+        for row in zip(jobs, profiles, scores, skill_match, matched_counts):
+            exact[fresh[row[0]['jd_id']]] = row
+        if errors:
+            # Pick replacements for the unregistered jobs at the same depth
+            unregistered.update(fresh[error['jd_id']] for error in errors)
+            continue
+        best = heapq.nlargest(k, exact.values(), key=lambda row: row[2])
+        # Exact once no job left out can beat the k-th score
+        if depth + len(unregistered) >= len(index) or (len(best) == k and best[-1][2] >= rest_bound + BOUND_SLACK):
+            print(f"Recommendation: {len(exact)} of {len(index)} jobs re-scored, "
+                  f"{len(unregistered)} indexed jobs no longer registered")
+            jobs, profiles, scores, skill_match, matched_counts = (list(column) for column in zip(*best)) if best else ([],) * 5
+            return batch_scoring.build_results(resume_data, jobs, profiles, (scores, skill_match, matched_counts, resume_skill_count),
+                                               range(len(best)), feedback_limit)
+        depth *= DEPTH_FACTOR
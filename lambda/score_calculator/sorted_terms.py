@@ -0,0 +1,66 @@
+"""
+Sorted Terms
+A sorted vocabulary stored in a binary artifact and searched where it
+lies, so a memory-mapped table needs no per-term objects at load.
+
+Layout: the terms in sorted order, UTF-8, each followed by a newline,
+and a uint32 table with the byte offset of each term plus the end.
+UTF-8 byte order matches code point order, so the bytes stay sorted.
+"""
+from array import array
+from bisect import bisect_right
+
+
+def pack_terms(terms):
+    """(vocab bytes, uint32 offsets) for sorted terms"""
+    vocab = bytearray()
+    offsets = array('I', [0])
+    for term in terms:
+        vocab += term.encode('utf-8') + b'\n'
+        offsets.append(len(vocab))
+    return bytes(vocab), offsets
+
+
+class SortedTerms:
+    """
+    Term lookup over packed terms at byte offset base of buffer (an mmap
+    or bytes), with their offsets: lookups bisect the bytes in place
+    """
+
+    def __init__(self, buffer, base, offsets):
+        self.buffer = buffer
+        self.base = base
+        self.offsets = offsets
+        self.end = base + offsets[-1]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def term_bytes(self, i):
+        return self.buffer[self.base + self.offsets[i]:self.base + self.offsets[i + 1] - 1]
+
+    def find(self, term):
+        """Index of a term, or None"""
+        key = term.encode('utf-8')
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.term_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < len(self) and self.term_bytes(lo) == key else None
+
+    def containing(self, fragment):
+        """Indexes of the terms with fragment inside them"""
+        needle = fragment.encode('utf-8')
+        if not needle or b'\n' in needle:
+            return []
+        found = []
+        position = self.buffer.find(needle, self.base, self.end)
+        while position != -1:
+            i = bisect_right(self.offsets, position - self.base) - 1
+            found.append(i)
+            # Continue after this term, so each term is reported once
+            position = self.buffer.find(needle, self.base + self.offsets[i + 1], self.end)
+        return found
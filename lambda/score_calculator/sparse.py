@@ -0,0 +1,126 @@
+"""
+Sparse Vectors
+Token vocabulary with integer ids and array-backed sparse vectors for
+TF-IDF cosine similarity. Vectors keep their ids sorted so a dot product
+is a merge of two id lists, and cache their norm, so a job description
+vector can be compared against many resumes without being rebuilt.
+"""
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import repeat
+from operator import mul, truediv
+
+
+class Vocabulary:
+    """Interns tokens to dense integer ids"""
+
+    def __init__(self, max_terms=None):
+        self.ids = {}
+        self.max_terms = max_terms
+
+    def __len__(self):
+        return len(self.ids)
+
+    def intern(self, token):
+        """Id of a token, assigning the next id to new tokens"""
+        token_id = self.ids.get(token)
+        if token_id is None:
+            token_id = self.ids[token] = len(self.ids)
+        return token_id
+
+    def reset_if_full(self):
+        """
+        Forget all ids once max_terms is exceeded. Only safe between
+        requests: vectors built before and after a reset do not line up.
+        """
+        if self.max_terms is not None and len(self.ids) > self.max_terms:
+            self.ids = {}
+            return True
+        return False
+
+
+class SparseVector:
+    """Sorted term ids with float64 weights and a cached norm"""
+    __slots__ = ('ids', 'values', '_norm')
+
+    def __init__(self, weights):
+        """weights: {term_id: weight}"""
+        order = sorted(weights)
+        self.ids = array('i', order)
+        self.values = array('d', map(weights.__getitem__, order))
+        self._norm = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def norm(self):
+        if self._norm is None:
+            self._norm = math.sqrt(sum(map(mul, self.values, self.values)))
+        return self._norm
+
+    def dot(self, other):
+        """Dot product: merge the id lists, or binary-search the longer one"""
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        if not small.ids:
+            return 0.0
+        large_ids, large_values = large.ids, large.values
+        total = 0.0
+        if len(small) * 8 < len(large):
+            # Far fewer probes than a full merge when the sizes are lopsided
+            lo = 0
+            end = len(large_ids)
+            for term_id, value in zip(small.ids, small.values):
+                lo = bisect_left(large_ids, term_id, lo)
+                if lo == end:
+                    break
+                if large_ids[lo] == term_id:
+                    total += value * large_values[lo]
+            return total
+
+        i = j = 0
+        small_ids, small_values = small.ids, small.values
+        small_end, large_end = len(small_ids), len(large_ids)
+        a, b = small_ids[0], large_ids[0]
+        while True:
+            if a == b:
+                total += small_values[i] * large_values[j]
+                i += 1
+                j += 1
+                if i == small_end or j == large_end:
+                    break
+                a, b = small_ids[i], large_ids[j]
+            elif a < b:
+                i += 1
+                if i == small_end:
+                    break
+                a = small_ids[i]
+            else:
+                j += 1
+                if j == large_end:
+                    break
+                b = large_ids[j]
+        return total
+
+    def cosine(self, other):
+        """Cosine similarity (0.0 if either vector is all zeros)"""
+        if self.norm == 0 or other.norm == 0:
+            return 0.0
+        return self.dot(other) / (self.norm * other.norm)
+
+
+def tfidf_vector(tokens, vocabulary, idf):
+    """TF-IDF vector of a token list; idf is anything with .get(token)"""
+    if not tokens:
+        return SparseVector({})
+    counts = Counter(tokens)
+    try:
+        term_ids = list(map(vocabulary.ids.__getitem__, counts))
+    except KeyError:
+        # Some tokens are new to the vocabulary
+        term_ids = [vocabulary.intern(token) for token in counts]
+    # count / len(tokens) * idf, as the dict implementation computed it
+    weights = map(mul, map(truediv, counts.values(), repeat(len(tokens))), map(idf.get, counts))
+    return SparseVector(dict(zip(term_ids, weights)))
@@ -0,0 +1,40 @@
+"""
+LRU Cache
+Bounded in-container cache shared by the Lambda functions. deploy.sh
+copies this directory into each function package, like its vendored
+dependencies; local runners put lambda/shared on sys.path.
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded least-recently-used mapping with hit/miss counters"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
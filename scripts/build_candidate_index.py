@@ -0,0 +1,75 @@
+"""
+Candidate Index Backfill
+Indexes analyses that were parsed before the analysis table's stream
+fed the candidate index (or re-indexes all of them after the skill keys
+change), writing the same postings and feature records as the stream.
+
+Input is the analysis DynamoDB table or a JSONL export with analysis_id
+(or id) and parsed resume fields per row (e.g. the output of
+bulk_ingest.py).
+
+Usage:
+  python scripts/build_candidate_index.py --table ResumeAnalysisResults
+  python scripts/build_candidate_index.py --input results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from decimal import Decimal
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'lambda', 'score_calculator'))
+sys.path.append(os.path.join(ROOT, 'lambda', 'shared'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import candidate_index  # noqa: E402
+
+
+def iter_jsonl(path):
+    """Yield (analysis_id, resume data) from a JSONL export"""
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            # DynamoDB takes Decimal, not float
+            row = json.loads(line, parse_float=Decimal)
+            yield row.get('analysis_id') or row.get('id'), row
+
+
+def iter_table(table_name):
+    """Yield (analysis_id, resume data) from the analysis table"""
+    import boto3
+    table = boto3.resource('dynamodb').Table(table_name)
+    request = {'ProjectionExpression': 'analysis_id, resume_key, skills, education, experience'}
+    while True:
+        response = table.scan(**request)
+        for item in response['Items']:
+            yield item['analysis_id'], item
+        if 'LastEvaluatedKey' not in response:
+            return
+        request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Backfill the candidate search index')
+    source = arg_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='JSONL export with analysis_id and parsed resume fields per row')
+    source.add_argument('--table', help='DynamoDB analysis table to scan')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    indexed = skipped = 0
+    for analysis_id, resume_data in (iter_jsonl(args.input) if args.input else iter_table(args.table)):
+        if not analysis_id or not resume_data.get('skills'):
+            skipped += 1
+            continue
+        candidate_index.index_resume(analysis_id, resume_data)
+        indexed += 1
+    print(f"Indexed {indexed} analyses ({skipped} without an id or skills) into "
+          f"{candidate_index.CANDIDATE_INDEX_TABLE} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+IDF Artifact Builder
+Counts document frequencies over a corpus of job descriptions and resumes
+with the score calculator's tokenizer and writes the IDF artifact it
+memory-maps at cold start (lambda/score_calculator/idf.bin by default).
+
+Each source is a directory of .txt files (one document per file) or a
+JSONL file. JSONL rows with a "job_description" or "text" field count as
+that text; rows with parsed resume fields (e.g. the output of
+bulk_ingest.py) count as the resume text the scorer compares.
+
+Usage:
+  python scripts/build_idf.py jobs/ results.jsonl
+  python scripts/build_idf.py jobs.jsonl results.jsonl --min-df 2 --output idf.bin
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SCORER_DIR = os.path.join(ROOT, 'lambda', 'score_calculator')
+sys.path.append(SCORER_DIR)
+sys.path.append(os.path.join(ROOT, 'lambda', 'shared'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import lambda_function as scorer  # noqa: E402
+from idf_artifact import write_idf_artifact  # noqa: E402
+
+
+def iter_documents(source):
+    """Yield the text of each document in a directory or JSONL file"""
+    if os.path.isdir(source):
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith('.txt'):
+                    with open(os.path.join(dirpath, filename), errors='replace') as f:
+                        yield f.read()
+        return
+
+    with open(source) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            text = row.get('job_description') or row.get('text')
+            if text:
+                yield text
+            elif row.get('skills') or row.get('experience'):
+                yield scorer.build_resume_text(row)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Build the corpus IDF artifact for the score calculator')
+    arg_parser.add_argument('sources', nargs='+', help='Directories of .txt files or JSONL files')
+    arg_parser.add_argument('--output', default=os.path.join(SCORER_DIR, 'idf.bin'))
+    arg_parser.add_argument('--min-df', type=int, default=1,
+                            help='Drop terms in fewer documents (they get the unseen-term IDF)')
+    args = arg_parser.parse_args()
+
+    doc_freqs = Counter()
+    doc_count = 0
+    for source in args.sources:
+        for text in iter_documents(source):
+            doc_freqs.update(set(scorer.tokenize(text)))
+            doc_count += 1
+    if not doc_count:
+        arg_parser.error('no documents found')
+
+    kept = {term: freq for term, freq in doc_freqs.items() if freq >= args.min_df}
+    write_idf_artifact(args.output, kept, doc_count, scorer.TOKENIZER_VERSION)
+    print(f"{doc_count} documents, {len(kept)} terms ({len(doc_freqs) - len(kept)} below --min-df) "
+          f"-> {args.output} ({os.path.getsize(args.output) / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
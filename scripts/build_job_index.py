@@ -0,0 +1,97 @@
+"""
+Job Index Builder
+Writes the inverted index the score calculator memory-maps for job
+recommendations (lambda/score_calculator/job_index.bin by default) from
+the registered job descriptions.
+
+Input is the job registry DynamoDB table or a JSONL export with jd_id,
+job_description and (optionally) features per row. Jobs whose stored
+features are missing or outdated are re-analyzed from their text.
+The scorer's IDF artifact must be in place: job weights are computed
+with it, and the index is only used alongside the same artifact.
+
+Usage:
+  python scripts/build_job_index.py --table JobDescriptions
+  python scripts/build_job_index.py --input jobs.jsonl --output job_index.bin
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SCORER_DIR = os.path.join(ROOT, 'lambda', 'score_calculator')
+sys.path.append(SCORER_DIR)
+sys.path.append(os.path.join(ROOT, 'lambda', 'shared'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import job_registry  # noqa: E402
+import lambda_function as scorer  # noqa: E402
+from job_index import write_job_index  # noqa: E402
+
+
+def iter_jsonl(path):
+    """Yield (jd_id, text, features) from a JSONL export"""
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            text = row.get('job_description') or row.get('description') or ''
+            features = row.get('features')
+            if isinstance(features, str):
+                features = json.loads(features)
+            yield row.get('jd_id') or job_registry.job_id(text), text, features
+
+
+def iter_table(table_name):
+    """Yield (jd_id, text, features) from the job registry table"""
+    import boto3
+    client = boto3.client('dynamodb')
+    paginator = client.get_paginator('scan')
+    for page in paginator.paginate(TableName=table_name,
+                                   ProjectionExpression='jd_id, job_description, features'):
+        for item in page['Items']:
+            features = item.get('features', {}).get('S')
+            yield (item['jd_id']['S'], item.get('job_description', {}).get('S', ''),
+                   json.loads(features) if features else None)
+
+
+def current_features(text, features):
+    """Stored features if they are current, else the features of the text"""
+    if (features and features.get('version') == scorer.JOB_FEATURES_VERSION and
+            features.get('tokenizer_version') == scorer.TOKENIZER_VERSION):
+        return features, False
+    return scorer.JobProfile(text).to_features(), True
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Build the job recommendation index for the score calculator')
+    source = arg_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='JSONL export with jd_id, job_description and features per row')
+    source.add_argument('--table', help='Job registry DynamoDB table to scan')
+    arg_parser.add_argument('--output', default=os.path.join(SCORER_DIR, 'job_index.bin'))
+    args = arg_parser.parse_args()
+    if scorer.idf_table is None:
+        arg_parser.error('the IDF artifact is required; build it with scripts/build_idf.py first')
+
+    start = time.perf_counter()
+    jobs = []
+    analyzed = 0
+    for jd_id, text, features in (iter_jsonl(args.input) if args.input else iter_table(args.table)):
+        if not features and not text.strip():
+            continue
+        features, stale = current_features(text, features)
+        analyzed += stale
+        jobs.append((jd_id, features))
+    if not jobs:
+        arg_parser.error('no jobs found')
+
+    write_job_index(args.output, jobs, scorer.idf_table, scorer.TOKENIZER_VERSION)
+    print(f"{len(jobs)} jobs ({analyzed} re-analyzed) -> {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""
+Bulk Resume Ingestion
+Parses a local archive of resumes with the resume parser's extractors,
+outside Lambda, in a multiprocessing pool.
+
+Input is a directory (searched recursively for .pdf and .txt files) or a
+JSONL manifest with one {"path": ..., "id": ...} object per line ("id"
+defaults to the path). Results stream to JSONL, or to Parquet part files
+when pyarrow is installed. Finished ids are appended to a checkpoint file
+after every batch, so an interrupted run picks up where it stopped;
+failed documents are logged to <output>.errors.jsonl and retried on the
+next run. With --skill-table, workers start from a precomputed table of
+skill-candidate verdicts and the table is extended with every new verdict
+(the same file can be shipped to the Lambda as SKILL_TABLE_PATH).
+
+Usage:
+  python scripts/bulk_ingest.py archive/ results.jsonl
+  python scripts/bulk_ingest.py manifest.jsonl results/ --format parquet --workers 8
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Appended so a locally installed PyMuPDF wins over the Lambda-only vendored copy
+sys.path.append(os.path.join(ROOT, 'lambda', 'resume_parser'))
+sys.path.append(os.path.join(ROOT, 'lambda', 'shared'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import lambda_function as parser  # noqa: E402
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+RESUME_EXTENSIONS = ('.pdf', '.txt')
+
+
+def iter_inputs(source):
+    """Yield (doc_id, path) for a directory or a JSONL manifest"""
+    if os.path.isdir(source):
+        for dirpath, dirnames, filenames in os.walk(source):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.lower().endswith(RESUME_EXTENSIONS):
+                    path = os.path.join(dirpath, filename)
+                    yield os.path.relpath(path, source), path
+        return
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source) as manifest:
+        for line in manifest:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            path = entry['path']
+            if not os.path.isabs(path):
+                path = os.path.join(base, path)
+            yield str(entry.get('id', entry['path'])), path
+
+
+def load_checkpoint(path):
+    """Ids already written by a previous run"""
+    if not os.path.exists(path):
+        return set()
+    with open(path) as checkpoint:
+        return {line.rstrip('\n') for line in checkpoint if line.strip()}
+
+
+ats_profile = parser.ATS_PROFILE
+
+
+def init_worker(skill_table_path, profile):
+    """Pool workers are daemonic and cannot fork page workers of their own"""
+    global ats_profile
+    parser.PDF_PARALLEL_PAGE_THRESHOLD = float('inf')
+    ats_profile = profile
+    if skill_table_path:
+        parser.skill_table = parser.load_skill_table(skill_table_path)
+        parser.skill_verdict_log = {}
+
+
+def parse_file(item):
+    """
+    Worker body: parse one file, returning (doc_id, path, parsed, error, verdicts)
+    where verdicts are the skill-candidate classifications new to this worker
+    """
+    doc_id, path = item
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        # The extractors log per document; keep the CLI output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            parsed = parser.parse_resume_bytes(path, content, ats_profile)
+        result = doc_id, path, parsed, None
+    except Exception as e:
+        result = doc_id, path, None, f"{type(e).__name__}: {e}"
+
+    verdicts = parser.skill_verdict_log
+    if verdicts:
+        parser.skill_verdict_log = {}
+    return result + (verdicts or None,)
+
+
+class JsonlWriter:
+    """Appends one JSON object per parsed resume"""
+
+    def __init__(self, path):
+        self.file = open(path, 'a')
+
+    def write(self, rows):
+        for row in rows:
+            self.file.write(json.dumps(row) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """Writes each batch as its own part file so resumed runs only add files"""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.part = len([f for f in os.listdir(directory) if f.endswith('.parquet')])
+
+    def write(self, rows):
+        table = pa.Table.from_pylist([{
+            'id': row['id'],
+            'path': row['path'],
+            'skills': row['skills'],
+            'ats_score': row['ats_score'].get('score'),
+            'raw_text_length': row['raw_text_length'],
+            # Nested extractor output is kept as JSON text
+            'education': json.dumps(row['education']),
+            'experience': json.dumps(row['experience']),
+            'ats': json.dumps(row['ats_score']),
+            'extraction': json.dumps(row.get('extraction'))
+        } for row in rows])
+        pq.write_table(table, os.path.join(self.directory, f"part-{self.part:05d}.parquet"))
+        self.part += 1
+
+    def close(self):
+        pass
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Parse a resume archive in bulk')
+    arg_parser.add_argument('source', help='directory of resumes or JSONL manifest')
+    arg_parser.add_argument('output', help='JSONL file, or directory for --format parquet')
+    arg_parser.add_argument('--format', choices=['jsonl', 'parquet'], default='jsonl')
+    arg_parser.add_argument('--workers', type=int, default=0, help='worker processes (0 = one per CPU)')
+    arg_parser.add_argument('--batch-size', type=int, default=500, help='documents per write and checkpoint')
+    arg_parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.checkpoint)')
+    arg_parser.add_argument('--skill-table', help='precomputed skill-candidate table to use and extend')
+    arg_parser.add_argument('--ats-profile', choices=sorted(parser.ATS_PROFILES), default=parser.ATS_PROFILE,
+                            help='ATS check profile (fast skips the expensive checks)')
+    args = arg_parser.parse_args()
+    if args.format == 'parquet' and pa is None:
+        arg_parser.error('--format parquet requires pyarrow (pip install pyarrow)')
+
+    output = args.output.rstrip('/')
+    checkpoint_path = args.checkpoint or output + '.checkpoint'
+    done = load_checkpoint(checkpoint_path)
+    pending = [item for item in iter_inputs(args.source) if item[0] not in done]
+    if done:
+        print(f"Resuming: {len(done)} already done, {len(pending)} to go")
+
+    writer = ParquetWriter(output) if args.format == 'parquet' else JsonlWriter(output)
+    workers = parser.worker_count(args.workers)
+    print(f"Parsing {len(pending)} resumes with {workers} workers")
+
+    parsed_count = 0
+    failed_count = 0
+    batch = []
+    start = time.perf_counter()
+
+    def flush():
+        writer.write(batch)
+        # Checkpoint only after the rows are safely written
+        with open(checkpoint_path, 'a') as checkpoint:
+            checkpoint.write(''.join(row['id'] + '\n' for row in batch))
+        batch.clear()
+        elapsed = time.perf_counter() - start
+        print(f"{parsed_count} parsed, {failed_count} failed, {parsed_count / elapsed:.1f} docs/sec")
+
+    skill_table = parser.load_skill_table(args.skill_table)
+    table_size = len(skill_table)
+
+    with Pool(workers, initializer=init_worker, initargs=(args.skill_table, args.ats_profile)) as pool, \
+            open(output + '.errors.jsonl', 'a') as errors:
+        for doc_id, path, parsed, error, verdicts in pool.imap_unordered(parse_file, pending, chunksize=8):
+            if verdicts:
+                skill_table.update(verdicts)
+            if error:
+                failed_count += 1
+                errors.write(json.dumps({'id': doc_id, 'path': path, 'error': error}) + '\n')
+                continue
+            row = {'id': doc_id, 'path': path}
+            row.update(parsed)
+            batch.append(row)
+            parsed_count += 1
+            if len(batch) >= args.batch_size:
+                flush()
+        if batch:
+            flush()
+
+    writer.close()
+    if args.skill_table and len(skill_table) > table_size:
+        parser.save_skill_table(args.skill_table, skill_table)
+        print(f"Skill table: {len(skill_table)} candidates ({len(skill_table) - table_size} new)")
+    elapsed = time.perf_counter() - start
+    rate = parsed_count / elapsed if elapsed else 0.0
+    print(f"Done: {parsed_count} parsed, {failed_count} failed in {elapsed:.1f}s ({rate:.1f} docs/sec)")
+
+
+if __name__ == '__main__':
+    main()
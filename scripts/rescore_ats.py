@@ -0,0 +1,99 @@
+"""
+Bulk ATS Re-scoring
+Recomputes ATS scores and ratings from the ats_features vectors stored
+with each analysis, without touching resume text or PDFs. Run it after
+changing ATS thresholds or ATS_CHECK_WEIGHTS to see how ratings move.
+
+Input is the analysis DynamoDB table or a JSONL export (e.g. the output of
+bulk_ingest.py). Requires NumPy.
+
+Usage:
+  python scripts/rescore_ats.py --table ResumeAnalysisResults --output rescored.jsonl
+  ATS_CHECK_WEIGHTS='{"density": 0}' python scripts/rescore_ats.py --input results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'lambda', 'resume_parser'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+from ats_bulk import score_feature_matrix  # noqa: E402
+from ats_checker import ATS_FEATURES_VERSION, ATS_PROFILES  # noqa: E402
+
+
+def iter_jsonl(path):
+    """Yield (id, vector, version, stored_score) from a JSONL export"""
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            yield (row.get('analysis_id') or row.get('id'), row.get('ats_features'),
+                   row.get('ats_features_version'), (row.get('ats_score') or {}).get('score'))
+
+
+def iter_table(table_name):
+    """Yield (id, vector, version, stored_score) from the analysis table"""
+    import boto3
+    client = boto3.client('dynamodb')
+    paginator = client.get_paginator('scan')
+    pages = paginator.paginate(
+        TableName=table_name,
+        ProjectionExpression='analysis_id, ats_features, ats_features_version, ats_score.score'
+    )
+    for page in pages:
+        for item in page['Items']:
+            vector = [int(value['N']) for value in item.get('ats_features', {}).get('L', [])]
+            version = item.get('ats_features_version', {}).get('N')
+            stored = item.get('ats_score', {}).get('M', {}).get('score', {}).get('N')
+            yield (item['analysis_id']['S'], vector or None, int(version) if version else None,
+                   int(stored) if stored else None)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Re-score stored ATS feature vectors')
+    source = arg_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='JSONL export with ats_features per row')
+    source.add_argument('--table', help='DynamoDB analysis table to scan')
+    arg_parser.add_argument('--output', help='JSONL file for {id, score, rating, previous_score}')
+    arg_parser.add_argument('--profile', choices=sorted(ATS_PROFILES), default='full')
+    args = arg_parser.parse_args()
+
+    start = time.perf_counter()
+    rows = iter_jsonl(args.input) if args.input else iter_table(args.table)
+    ids, vectors, previous = [], [], []
+    skipped = 0
+    for row_id, vector, version, stored_score in rows:
+        # Analyses parsed before the vector existed (or with another layout) need a re-parse
+        if not vector or version != ATS_FEATURES_VERSION:
+            skipped += 1
+            continue
+        ids.append(row_id)
+        vectors.append(vector)
+        previous.append(stored_score)
+    loaded = time.perf_counter()
+
+    scores, ratings = score_feature_matrix(vectors, args.profile)
+    scored = time.perf_counter()
+    rate = len(ids) / (scored - loaded) if scored > loaded else 0.0
+    print(f"Loaded {len(ids)} vectors ({skipped} without a current vector) in {loaded - start:.1f}s")
+    print(f"Scored {len(ids)} resumes in {(scored - loaded) * 1000:.1f} ms ({rate:.0f} resumes/sec)")
+
+    changed = sum(1 for old, new in zip(previous, scores) if old is not None and old != new)
+    print(f"Scores changed: {changed}")
+    for rating, count in Counter(ratings.tolist()).most_common():
+        print(f"  {rating:>18}: {count}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            for row_id, score, rating, old in zip(ids, scores.tolist(), ratings.tolist(), previous):
+                f.write(json.dumps({'id': row_id, 'score': score, 'rating': rating, 'previous_score': old}) + '\n')
+
+
+if __name__ == '__main__':
+    main()
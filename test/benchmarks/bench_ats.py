@@ -0,0 +1,67 @@
+"""
+Benchmark: ATS signal collection, per-check scans vs the single-pass scanner
+Also checks that the scanner reproduces the per-check counts on the corpus,
+and reports per-check time and the cost of each ATS profile
+Usage: python test/benchmarks/bench_ats.py
+"""
+import timeit
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import patterns  # noqa: E402
+from ats_checker import ATS_PROFILES, run_ats_checks, scan_ats_features  # noqa: E402
+from document import ParsedDocument  # noqa: E402
+from lambda_function import extract_education, extract_experience, extract_skills  # noqa: E402
+
+
+def legacy_signals(text):
+    """The text scans check_ats_compatibility made before the scanner, one per check"""
+    text_lower = text.lower()
+    words = text_lower.split()
+    return {
+        'dates_found': len(patterns.DATE.findall(text)),
+        'verb_count': sum(1 for verb in patterns.STRONG_VERBS if verb in text_lower),
+        'numbers_found': len(patterns.QUANTIFIED.findall(text)),
+        'has_phone': bool(patterns.PHONE.search(text)),
+        'token_count': len(words),
+        'unique_token_count': len(set(words)),
+    }
+
+
+def scanner_signals(text):
+    features = scan_ats_features(ParsedDocument(text), {})
+    return {name: features[name] for name in legacy_signals('')}
+
+
+def main():
+    texts = corpus.resumes(200) + corpus.job_descriptions(50)
+    # Digit-heavy edge cases for the phone, year and metric rules
+    texts += ['(555) 123-4567', '555.123.4567', '5551234567', '555) 1234567', '555123 4567',
+              '12345-678-9012', 'FY2020 2020s 1999, $2020 2019x', '$5% 12+3% 3x4 $$7', 'Jan-Dec 2021']
+    mismatches = [t for t in texts if legacy_signals(t) != scanner_signals(t)]
+    print(f"{len(texts)} texts, {len(mismatches)} signal mismatches")
+
+    per_text = lambda fn: min(timeit.repeat(lambda: [fn(t) for t in texts], number=1, repeat=5)) / len(texts) * 1e6  # noqa: E731
+    print(f"legacy per-check scans: {per_text(legacy_signals):8.1f} us/text")
+    print(f"single-pass scanner:    {per_text(scanner_signals):8.1f} us/text")
+
+    docs = [ParsedDocument(t) for t in corpus.resumes(200)]
+    data = [{'skills': extract_skills(d), 'education': extract_education(d), 'experience': extract_experience(d)}
+            for d in docs]
+    for profile in ATS_PROFILES:
+        elapsed = min(timeit.repeat(lambda: [run_ats_checks(d, r, profile) for d, r in zip(docs, data)],
+                                    number=1, repeat=5))
+        print(f"ATS checks, {profile} profile (shared doc): {elapsed / len(docs) * 1e6:.1f} us/resume")
+
+    # Per-check time, including the feature scans each check triggers first
+    totals = {}
+    for doc, resume_data in zip(docs, data):
+        for name, micros in run_ats_checks(ParsedDocument(doc.text), resume_data)[1].items():
+            totals[name] = totals.get(name, 0) + micros
+    for name, micros in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {name:>16} {micros / len(docs):8.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: re-scoring stored ATS feature vectors, per-row vs NumPy bulk
+Vectors come from parsing the synthetic corpus and are jittered up to
+100k rows; bulk scores must equal the per-row scorer
+Usage: python test/benchmarks/bench_ats_bulk.py
+"""
+import random
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+from ats_bulk import score_feature_matrix  # noqa: E402
+from ats_checker import FEATURE_VECTOR_FIELDS, score_ats_features, vector_features  # noqa: E402
+import lambda_function as parser  # noqa: E402
+
+ROWS = 100000
+JITTERED = ('text_length', 'skills_count', 'dates_found', 'verb_count', 'numbers_found',
+            'token_count', 'unique_token_count')
+
+
+def corpus_vectors():
+    vectors = []
+    for text in corpus.resumes(300):
+        with corpus.quiet():
+            parsed = parser.parse_resume_bytes('resume.txt', text.encode())
+        vectors.append(parsed['ats_features'])
+    return vectors
+
+
+def jittered(rng, vectors, count):
+    """Corpus vectors with their counts scaled so thresholds fall both ways"""
+    columns = [FEATURE_VECTOR_FIELDS.index(name) for name in JITTERED]
+    rows = []
+    for _ in range(count):
+        row = list(rng.choice(vectors))
+        for column in columns:
+            row[column] = int(row[column] * rng.uniform(0.2, 1.8))
+        rows.append(row)
+    return rows
+
+
+def main():
+    rng = random.Random(5)
+    rows = jittered(rng, corpus_vectors(), ROWS)
+
+    start = time.perf_counter()
+    expected = [score_ats_features(vector_features(row)) for row in rows]
+    per_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores, ratings = score_feature_matrix(rows)
+    bulk = time.perf_counter() - start
+
+    mismatches = sum(1 for result, score, rating in zip(expected, scores.tolist(), ratings.tolist())
+                     if (result['score'], result['rating']) != (score, rating))
+    print(f"{ROWS} vectors, {mismatches} score/rating mismatches")
+    print(f"per-row scorer: {per_row:.2f}s ({ROWS / per_row:,.0f} resumes/sec)")
+    print(f"NumPy bulk:     {bulk:.3f}s ({ROWS / bulk:,.0f} resumes/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: incremental ATS re-scoring of line edits vs a full rescan
+Random line edits are applied to corpus resumes; after each edit the
+incremental features are compared with scan_ats_features on the new text.
+Malformed client states, and edits removing lines the state does not
+hold, must be rejected with ValueError.
+Usage: python test/benchmarks/bench_ats_incremental.py
+"""
+import random
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import ats_incremental  # noqa: E402
+from ats_checker import scan_ats_features, score_ats_features  # noqa: E402
+from document import ParsedDocument  # noqa: E402
+
+EDITS_PER_RESUME = 20
+
+
+def random_edit(rng, lines, donor_lines):
+    """Replace 0-3 lines with 0-3 lines from another resume, sometimes truncated"""
+    start = rng.randrange(len(lines))
+    stop = min(len(lines), start + rng.randint(0, 3))
+    at = rng.randrange(len(donor_lines))
+    added = donor_lines[at:at + rng.randint(0, 3)]
+    if rng.random() < 0.3:
+        added = [line[:len(line) // 2] for line in added]
+    edit = {'removed': lines[start:stop], 'added': added}
+    lines[start:stop] = added
+    return edit
+
+
+BAD_STATES = [
+    None,
+    {'counters': {}},
+    {'counters': {'line_count': '3'}, 'extracted': {}},
+    {'counters': {'line_count': -1}, 'extracted': {}},
+]
+
+
+def rejected(state):
+    """Number of malformed variants of a valid state that validate_state rejects"""
+    counters = state['counters']
+    variants = BAD_STATES + [
+        {**state, 'version': ats_incremental.STATE_VERSION - 1},
+        {**state, 'counters': {**counters, 'verbs': {'not a verb': 1}}},
+        {**state, 'counters': {**counters, 'markers': []}},
+        {**state, 'counters': {**counters, 'tokens': {'two words': 1}}},
+        {**state, 'counters': {**counters, 'lines': {'not a hash': 1}}},
+        {**state, 'extracted': {**state['extracted'], 'skills_count': None}},
+    ]
+    count = 0
+    for variant in variants:
+        try:
+            ats_incremental.validate_state(variant)
+        except ValueError:
+            count += 1
+    bad_edits = [
+        [{'removed': ['x'] * (counters['line_count'] + 1)}],
+        # One line the resume never had
+        [{'removed': ['Led a team that does not appear in this resume']}],
+    ]
+    for edits in bad_edits:
+        try:
+            ats_incremental.apply_edits(ats_incremental.validate_state(state), edits)
+        except ValueError:
+            count += 1
+    return count, len(variants) + len(bad_edits)
+
+
+def main():
+    rng = random.Random(3)
+    donors = [text.split('\n') for text in corpus.resumes(20, seed=99)]
+    incremental = []
+    full = []
+    mismatches = 0
+    for text in corpus.resumes(100):
+        lines = text.split('\n')
+        state = ats_incremental.new_state(text, scan_ats_features(text, {}))
+        for _ in range(EDITS_PER_RESUME):
+            edit = random_edit(rng, lines, rng.choice(donors))
+
+            new_text = '\n'.join(lines)
+            start = time.perf_counter()
+            ats_incremental.apply_edits(state, [edit])
+            features = ats_incremental.state_features(state)
+            score_ats_features(features)
+            incremental.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            expected = scan_ats_features(ParsedDocument(new_text), {})
+            score_ats_features(expected)
+            full.append(time.perf_counter() - start)
+
+            if any(features[name] != expected[name] for name in expected
+                   if name not in ats_incremental.EXTRACTED_FEATURES):
+                mismatches += 1
+
+    print(f"{len(incremental)} edits, {mismatches} feature mismatches")
+    print("malformed states rejected: {}/{}".format(*rejected(state)))
+    for name, samples in (('incremental', incremental), ('full rescan', full)):
+        samples.sort()
+        print(f"{name:>12}: median {samples[len(samples) // 2] * 1000:.3f} ms, "
+              f"p99 {samples[int(len(samples) * 0.99)] * 1000:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: top 10 of 5,000 job descriptions for a few resumes, scoring
+every job (with feedback for all of them, and for the top 10 only) vs
+the cascade that fully scores only jobs whose upper bound can make the
+top 10; the rankings must agree. Runs with per-pair IDF and with a
+temporary IDF artifact over the synthetic jobs; job profiles are warm.
+Usage: python test/benchmarks/bench_batch_cascade.py
+"""
+import os
+import tempfile
+import time
+from collections import Counter
+
+import corpus
+
+JOBS = 5000
+RESUMES = 5
+K = 10
+
+workdir = tempfile.mkdtemp()
+os.environ['JOB_PROFILE_CACHE_SIZE'] = str(JOBS)
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+from idf_artifact import load_idf_table, write_idf_artifact  # noqa: E402
+import batch_scoring  # noqa: E402
+
+
+def main():
+    texts = corpus.job_descriptions(JOBS, seed=43)
+    jobs = [{'title': f'Job {i}', 'description': text} for i, text in enumerate(texts)]
+    resumes = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+                'education': ['Bachelor of Science in Computer Science'],
+                'experience': {'years': 1 + i % 8, 'positions': ['Software Engineer']}}
+               for i, text in enumerate(corpus.resumes(RESUMES, seed=47))]
+
+    doc_freqs = Counter()
+    for text in texts:
+        doc_freqs.update(set(scorer.tokenize(text)))
+    idf_path = os.path.join(workdir, 'idf.bin')
+    write_idf_artifact(idf_path, doc_freqs, len(texts), scorer.TOKENIZER_VERSION)
+    with corpus.quiet():
+        artifact = load_idf_table(idf_path, scorer.TOKENIZER_VERSION)
+
+    print(f"{RESUMES} resumes x {JOBS} jobs, top {K} (NumPy {'on' if batch_scoring.np is not None else 'off'})")
+    for label, idf_table in (('per-pair IDF', None), ('IDF artifact', artifact)):
+        scorer.idf_table = idf_table
+        scorer.cached_job_profile.cache_clear()
+        with corpus.quiet():
+            # Warm the profiles, as registered or repeated jobs would be
+            batch_scoring.score_jobs(resumes[0], jobs, feedback_limit=0, top_k=K)
+
+        times = {'all, feedback for all': 0.0, 'all, top-10 feedback': 0.0, 'cascade': 0.0}
+        mismatches = 0
+        for resume_data in resumes:
+            for name, run in (('all, feedback for all', lambda: batch_scoring.score_jobs(resume_data, jobs)[0][:K]),
+                              ('all, top-10 feedback', lambda: batch_scoring.score_jobs(resume_data, jobs, K)[0][:K]),
+                              ('cascade', lambda: batch_scoring.score_jobs(resume_data, jobs, K, top_k=K)[0])):
+                start = time.perf_counter()
+                with corpus.quiet():
+                    results = run()
+                times[name] += time.perf_counter() - start
+                if name == 'all, feedback for all':
+                    expected = results
+                else:
+                    mismatches += sum(1 for a, b in zip(expected, results) if a['score'] != b['score'])
+        print(f"{label} ({mismatches} ranking mismatches)")
+        for name, elapsed in times.items():
+            print(f"{name:>24}: {elapsed / RESUMES * 1000:8.1f} ms/resume")
+
+
+if __name__ == '__main__':
+    main()
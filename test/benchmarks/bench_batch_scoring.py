@@ -0,0 +1,66 @@
+"""
+Benchmark: one resume against 1,000 job descriptions, per-job scoring
+loop vs the batch engine (scores only, and with feedback for the top 10)
+Usage: python test/benchmarks/bench_batch_scoring.py
+"""
+import time
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+import batch_scoring  # noqa: E402
+
+JOBS = 1000
+
+RESUME = {
+    'skills': ['Python', 'AWS', 'Docker', 'Kubernetes', 'PostgreSQL', 'React', 'TypeScript',
+               'Terraform', 'Kafka', 'GraphQL', 'Machine Learning', 'CI/CD'],
+    'education': ['Bachelor of Science in Computer Science'],
+    'experience': {'years': 6, 'positions': ['Senior Software Engineer', 'Backend Developer']}
+}
+
+
+def per_job(resume_data, jobs):
+    """What scoring each job on its own costs (one scorer invoke per job, minus the I/O)"""
+    resume_text = scorer.build_resume_text(resume_data)
+    results = []
+    for job in jobs:
+        description = job['description']
+        similarity = scorer.calculate_enhanced_similarity(resume_text, description)
+        skill_match, matched, total = scorer.calculate_skill_match(resume_data['skills'], description)
+        score = scorer.combine_scores(similarity, skill_match, scorer.experience_relevance(resume_data, description),
+                                      scorer.education_relevance(resume_data))
+        score = min(100, max(0, score))
+        scorer.generate_feedback(score, skill_match, resume_data, scorer.extract_keywords(description),
+                                 description, matched, total)
+        results.append(score)
+    return sorted(results, reverse=True)
+
+
+def timed(fn):
+    # Every run starts without cached job profiles
+    scorer.cached_job_profile.cache_clear()
+    scorer.job_canonical_skills.cache_clear()
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    jobs = [{'title': f'Job {i}', 'description': text}
+            for i, text in enumerate(corpus.job_descriptions(JOBS, seed=21))]
+    print(f"1 resume x {JOBS} jobs (NumPy {'on' if batch_scoring.np is not None else 'off'}, "
+          f"IDF {'artifact' if scorer.idf_table is not None else 'per pair'})")
+
+    expected, loop_time = timed(lambda: per_job(RESUME, jobs))
+    for label, limit in (('batch, scores only', 0), ('batch, top-10 feedback', 10)):
+        (results, _), elapsed = timed(lambda: batch_scoring.score_jobs(RESUME, jobs, feedback_limit=limit))
+        mismatches = sum(1 for a, b in zip(expected, results) if round(a, 2) != b['score'])
+        print(f"{label:>24}: {elapsed * 1000:8.1f} ms  ({mismatches} ranking mismatches)")
+    print(f"{'per-job loop':>24}: {loop_time * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: top-50 resumes for a job, scoring every analysis (what a full
+table scan would do) vs pruning by skill overlap through the candidate
+index and re-scoring the pool; reports how many of the true top 50 the
+pruned search returns. Postings are built in memory from the same skill
+keys the index stores, so DynamoDB is never called.
+Usage: python test/benchmarks/bench_candidate_search.py
+"""
+import time
+from collections import defaultdict
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import candidate_index  # noqa: E402
+    import lambda_function as scorer  # noqa: E402
+
+RESUMES = 3000
+JOBS = 10
+K = 50
+
+
+def main():
+    records = {}
+    for i, text in enumerate(corpus.resumes(RESUMES, seed=37)):
+        records[f'resume_{i}'] = {
+            'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+            'education': [corpus.DEGREES[i % len(corpus.DEGREES)]],
+            'experience': {'years': 1 + i % 9, 'positions': [corpus.TITLES[i % len(corpus.TITLES)]]}
+        }
+    postings = defaultdict(list)
+    for analysis_id, resume_data in records.items():
+        keys, skill_count = candidate_index.skill_keys(resume_data['skills'])
+        years, education_score = resume_data['experience']['years'], scorer.education_relevance(resume_data)
+        for key, count in keys.items():
+            postings[key].append((analysis_id, count, skill_count, years, education_score))
+    jobs = corpus.job_descriptions(JOBS, seed=41)
+
+    key_count = sum(len(candidate_index.job_keys(job)) for job in jobs)
+    print(f"{RESUMES} resumes x {JOBS} jobs, top {K}, {key_count / JOBS:.1f} posting queries/job")
+    for pool in (100, 200, 500):
+        scan_time = search_time = 0.0
+        found = 0
+        for job in jobs:
+            start = time.perf_counter()
+            expected = candidate_index.rank_candidates(job, records, K)
+            scan_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            survivors = candidate_index.candidate_pool(
+                job, (postings.get(key, []) for key in candidate_index.job_keys(job)), pool)
+            results = candidate_index.rank_candidates(job, {analysis_id: records[analysis_id] for analysis_id in survivors}, K)
+            search_time += time.perf_counter() - start
+            # Ties at the cut-off can swap ids, so compare by score
+            cutoff = expected[-1]['score']
+            found += sum(1 for result in results if result['score'] >= cutoff)
+        print(f"pool {pool:>4}: scan {scan_time / JOBS * 1000:7.1f} ms/job, "
+              f"index {search_time / JOBS * 1000:6.1f} ms/job, recall {found / (JOBS * K):.1%}")
+
+
+if __name__ == '__main__':
+    main()
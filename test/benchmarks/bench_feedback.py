@@ -0,0 +1,80 @@
+"""
+Benchmark: generate_feedback's matched/missing keyword detection, the
+previous per-term whitelist scan vs the precompiled whole-word matcher,
+by number of resume skills (job profiles built beforehand, as when
+scoring runs first). Matched skills must agree; missing keywords
+differ only where the old substring scan hit inside another word
+(e.g. 'r' in 'for', 'java' in 'javascript', 'sql' in 'postgresql').
+Whitelist terms glued to '+', '#' or '&' must not match either
+Usage: python test/benchmarks/bench_feedback.py
+"""
+import random
+import time
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+
+
+# Job text -> whitelist terms it must yield
+BOUNDARY_CASES = [
+    ('c++ and c# developer', {'c++', 'c#'}),
+    ('r&d team, golang and rust', {'rust'}),
+    ('experience with c, r and go', {'c', 'r', 'go'}),
+    ('asp.net or .net core, node.js', {'asp.net', '.net', 'node', 'node.js'}),
+    ('machine learning (ml) with scikit-learn', {'machine learning', 'ml', 'scikit-learn', 'scikit'}),
+]
+
+
+def previous_keywords(resume_data, job_keywords, job_description):
+    """The previous matched/missing loops (resume skill set rebuilt for every whitelist hit)"""
+    valid_resume_skills = [skill for skill in resume_data.get('skills', []) if scorer.is_valid_skill.__wrapped__(skill)]
+    resume_skills_lower = {skill.lower(): skill for skill in valid_resume_skills}
+    job_keywords_lower = set(kw.lower() for kw in job_keywords[:20])
+    matched = []
+    for skill_lower, skill_original in resume_skills_lower.items():
+        if skill_lower in job_keywords_lower or any(skill_lower in kw or kw in skill_lower for kw in job_keywords_lower):
+            matched.append(skill_original)
+
+    job_lower = job_description.lower()
+    missing = []
+    for tech in scorer.TECH_WHITELIST:
+        if tech in job_lower:
+            if tech not in {s.lower() for s in resume_data.get('skills', [])}:
+                missing.append(tech)
+    missing.sort(key=lambda term: (-len(term), term))
+    return matched[:15], missing[:8]
+
+
+def main():
+    rng = random.Random(8)
+    jobs = [(text, scorer.extract_keywords(text)) for text in corpus.job_descriptions(300, seed=5)]
+    for text, _ in jobs:
+        scorer.job_profile(text).whitelist_terms
+    pool = sorted({skill for skill in corpus.SKILLS} | {term.title() for term in scorer.TECH_WHITELIST})
+
+    wrong = [(text, scorer.whitelist_terms_in(text)) for text, expected in BOUNDARY_CASES
+             if scorer.whitelist_terms_in(text) != expected]
+    print(f"whitelist boundary cases: {len(BOUNDARY_CASES) - len(wrong)}/{len(BOUNDARY_CASES)} correct")
+    for text, terms in wrong:
+        print(f"  {text!r}: {sorted(terms)}")
+    print(f"{'skills':>6} {'previous us/job':>16} {'single pass us/job':>19} {'matched diff':>13} {'missing diff':>13}")
+    for count in (5, 20, 80):
+        resumes = [{'skills': rng.sample(pool, min(count, len(pool))), 'experience': {'years': 3}} for _ in jobs]
+        start = time.perf_counter()
+        expected = [previous_keywords(resume, keywords, text) for resume, (text, keywords) in zip(resumes, jobs)]
+        previous = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = [scorer.generate_feedback(70, 60, resume, keywords, text)
+                  for resume, (text, keywords) in zip(resumes, jobs)]
+        single = time.perf_counter() - start
+        matched_diff = sum(1 for (matched, _), feedback in zip(expected, actual) if matched != feedback['matched_skills'])
+        missing_diff = sum(1 for (_, missing), feedback in zip(expected, actual) if missing != feedback['missing_keywords'])
+        print(f"{count:>6} {previous / len(jobs) * 1e6:>16.1f} {single / len(jobs) * 1e6:>19.1f} "
+              f"{matched_diff:>13} {missing_diff:>13}")
+
+
+if __name__ == '__main__':
+    main()
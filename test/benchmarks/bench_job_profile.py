@@ -0,0 +1,63 @@
+"""
+Benchmark: the single-score pipeline (similarity, skill match,
+experience, keywords and feedback) for many candidates against the same
+job descriptions, rebuilding the job profile every time vs reusing the
+container's cached JobProfile; scores must agree
+Usage: python test/benchmarks/bench_job_profile.py
+"""
+import json
+import time
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+
+CANDIDATES = 50
+
+
+def score(resume_data, job_description):
+    """What lambda_handler computes for one analysis and job"""
+    similarity = scorer.calculate_enhanced_similarity(scorer.build_resume_text(resume_data), job_description)
+    skill_match, matched, total = scorer.calculate_skill_match(resume_data.get('skills', []), job_description)
+    final = scorer.combine_scores(similarity, skill_match, scorer.experience_relevance(resume_data, job_description),
+                                  scorer.education_relevance(resume_data))
+    final = min(100, max(0, final))
+    feedback = scorer.generate_feedback(final, skill_match, resume_data, scorer.job_profile(job_description).keywords,
+                                        job_description, matched, total)
+    return json.dumps([round(final, 10), feedback], default=str)
+
+
+def run(resumes, jobs, cold):
+    start = time.perf_counter()
+    results = []
+    for job in jobs:
+        for resume_data in resumes:
+            if cold:
+                scorer.cached_job_profile.cache_clear()
+                scorer.job_canonical_skills.cache_clear()
+            results.append(score(resume_data, job))
+    return results, time.perf_counter() - start
+
+
+def main():
+    resumes = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+                'education': ['Bachelor of Science in Computer Science'],
+                'experience': {'years': 4, 'positions': ['Software Engineer']}}
+               for text in corpus.resumes(CANDIDATES)]
+    jobs = corpus.job_descriptions(20, seed=13)
+    pairs = len(resumes) * len(jobs)
+
+    expected, cold = run(resumes, jobs, cold=True)
+    scorer.cached_job_profile.cache_clear()
+    actual, warm = run(resumes, jobs, cold=False)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"{CANDIDATES} candidates x {len(jobs)} jobs ({mismatches} mismatches)")
+    print(f"{'profile rebuilt per score':>26}: {cold / pairs * 1e6:8.1f} us/score")
+    print(f"{'cached JobProfile':>26}: {warm / pairs * 1e6:8.1f} us/score")
+    print(scorer.cached_job_profile.cache_info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: building a JobProfile from the job text vs from the features
+stored in the job registry (as they come back from DynamoDB), plus the
+request payload saved by sending a jd_id; scores must agree
+Usage: python test/benchmarks/bench_job_registry.py
+"""
+import json
+import time
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import job_registry  # noqa: E402
+    import lambda_function as scorer  # noqa: E402
+
+CANDIDATES = 20
+
+
+def score(resume_data, job):
+    """Final score and feedback for one analysis and JobProfile"""
+    similarity = scorer.calculate_enhanced_similarity(scorer.build_resume_text(resume_data), job)
+    skill_match, matched, total = scorer.calculate_skill_match(resume_data.get('skills', []), job)
+    final = scorer.combine_scores(similarity, skill_match, scorer.experience_relevance(resume_data, job),
+                                  scorer.education_relevance(resume_data))
+    final = min(100, max(0, final))
+    feedback = scorer.generate_feedback(final, skill_match, resume_data, job.keywords, job, matched, total)
+    return json.dumps([round(final, 10), feedback], default=str)
+
+
+def analyze(text):
+    """A profile from text, with the lazily computed parts a stored one already has"""
+    profile = scorer.JobProfile(text)
+    profile.keywords, profile.whitelist_terms
+    return profile
+
+
+def timed(build, items):
+    start = time.perf_counter()
+    profiles = [build(item) for item in items]
+    return profiles, time.perf_counter() - start
+
+
+def main():
+    resumes = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+                'education': ['Bachelor of Science in Computer Science'],
+                'experience': {'years': 4, 'positions': ['Software Engineer']}}
+               for text in corpus.resumes(CANDIDATES)]
+    jobs = corpus.job_descriptions(200, seed=13)
+    # What register_jobs stores, after the JSON round trip through the table
+    stored = [(text, json.loads(json.dumps(scorer.JobProfile(text).to_features()))) for text in jobs]
+
+    analyzed, analyze_time = timed(lambda item: analyze(item[0]), stored)
+    restored, restore_time = timed(lambda item: scorer.JobProfile(item[0], item[1]), stored)
+    mismatches = sum(1 for a, b in zip(analyzed, restored) for resume_data in resumes
+                     if score(resume_data, a) != score(resume_data, b))
+
+    text_payload = sum(len(json.dumps({'analysis_id': 'x', 'job_description': text})) for text in jobs)
+    id_payload = sum(len(json.dumps({'analysis_id': 'x', 'jd_id': job_registry.job_id(text)})) for text in jobs)
+    print(f"{len(jobs)} jobs x {CANDIDATES} candidates ({mismatches} mismatches)")
+    print(f"{'analyzed from text':>22}: {analyze_time / len(jobs) * 1e6:8.1f} us/job")
+    print(f"{'restored from features':>22}: {restore_time / len(jobs) * 1e6:8.1f} us/job")
+    print(f"{'scorer payload':>22}: {text_payload / len(jobs):8.0f} B with text, {id_payload / len(jobs):.0f} B with jd_id")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark: full resume parse (skills, education, experience, ATS) per resume
+Usage: python test/benchmarks/bench_parse.py [count]
+"""
+import sys
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import lambda_function as parser  # noqa: E402
+from ats_checker import check_ats_compatibility  # noqa: E402
+
+
+def parse(text):
+    """Mirror the parsing steps of lambda_handler, minus S3 and DynamoDB"""
+    doc = parser.ParsedDocument(text) if hasattr(parser, 'ParsedDocument') else text
+    skills = parser.extract_skills(doc)
+    education = parser.extract_education(doc)
+    experience = parser.extract_experience(doc)
+    return check_ats_compatibility(doc, {
+        'skills': skills,
+        'education': education,
+        'experience': experience
+    })
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    texts = corpus.resumes(count)
+    avg_kb = sum(len(t) for t in texts) / len(texts) / 1024
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for text in texts:
+            parse(text)
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(f"{count} resumes, {avg_kb:.1f} KB avg: {best / count * 1000:.3f} ms/resume "
+          f"({count / best:.0f} resumes/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: per-call cost of skill validation and ATS pattern checks
+Compares building patterns inside each call (the previous code) with the
+module-level registry in patterns.py and the ATS single-pass scanner, and
+the registry with the skill memo
+Usage: python test/benchmarks/bench_patterns.py
+"""
+import re
+import timeit
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import patterns  # noqa: E402
+from ats_checker import count_signals  # noqa: E402
+from lambda_function import classify_skill_candidate, is_valid_skill, skill_memo  # noqa: E402
+
+
+def legacy_looks_like_tech_skill(skill):
+    """looks_like_tech_skill as it was, rebuilding its word lists per call"""
+    skill_lower = skill.lower().strip()
+    if any(c.isdigit() for c in skill_lower):
+        return True
+    if '.' in skill_lower and len(skill_lower) <= 15:
+        return True
+    if '-' in skill_lower and len(skill_lower) >= 5:
+        return True
+    if any(c in skill_lower for c in ['+', '#']):
+        return True
+    if skill.isupper() and 2 <= len(skill) <= 5 and skill.isalpha():
+        return True
+    tech_parts = ['script', 'base', 'flow', 'ware', 'sys', 'sql', 'data',
+                  'web', 'net', 'cloud', 'micro', 'api', 'dev', 'ops', 'bot',
+                  'app', 'mobile', 'server', 'client', 'proto', 'graph']
+    if any(part in skill_lower for part in tech_parts):
+        return True
+    lang_patterns = ['python', 'java', 'ruby', 'rust', 'swift', 'kotlin',
+                     'scala', 'perl', 'php', 'bash', 'shell', 'react', 'angular',
+                     'vue', 'node', 'django', 'flask', 'spring', 'docker', 'kubernetes']
+    return any(lang in skill_lower for lang in lang_patterns)
+
+
+def legacy_is_valid_skill(skill):
+    """is_valid_skill as it was, rebuilding seven lambdas per call"""
+    from lambda_function import INVALID_SKILLS
+    skill_lower = skill.lower().strip()
+    if skill_lower in INVALID_SKILLS or len(skill_lower) < 2:
+        return False
+    if not re.search(r'[a-zA-Z]', skill) or skill.isdigit():
+        return False
+    soft_skill_patterns = [
+        lambda s: s.endswith('ing') and not any(t in s for t in ['testing', 'programming', 'debugging', 'logging', 'caching', 'parsing', 'rendering', 'scaling', 'monitoring', 'computing', 'processing', 'engineering', 'modeling', 'training']),
+        lambda s: s.endswith(('ness', 'ship', 'hood', 'dom')) and not any(t in s for t in ['relationship']),
+        lambda s: s.endswith(('tion', 'sion')) and not any(t in s for t in ['authentication', 'authorization', 'implementation', 'configuration', 'automation', 'virtualization', 'integration', 'migration']),
+        lambda s: s.endswith('ment') and not any(t in s for t in ['development', 'deployment', 'environment', 'management']),
+        lambda s: s.endswith(('ance', 'ence')) and not any(t in s for t in ['performance', 'intelligence', 'compliance']),
+        lambda s: s.endswith(('ful', 'ive', 'able', 'ible', 'ous', 'ent', 'ant')),
+        lambda s: s in {'clinical', 'others', 'matters', 'details', 'various', 'multiple',
+                        'several', 'strong', 'excellent', 'great', 'issues', 'needs',
+                        'results', 'benefits', 'values', 'people', 'teams', 'ways'}
+    ]
+    if any(pattern(skill_lower) for pattern in soft_skill_patterns):
+        if not legacy_looks_like_tech_skill(skill):
+            return False
+    return True
+
+
+def legacy_ats_patterns(text):
+    re.findall(r'\b(19|20)\d{2}\b|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec', text)
+    re.findall(r'\d+[%+]|\$\d+|\d+x', text)
+    re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+
+
+def registry_ats_patterns(text):
+    patterns.DATE.findall(text)
+    patterns.QUANTIFIED.findall(text)
+    patterns.PHONE.search(text)
+
+
+def scanner_ats_patterns(text):
+    count_signals(text)
+
+
+def per_call_us(fn, items, repeat=9):
+    best = min(timeit.repeat(lambda: [fn(item) for item in items], number=1, repeat=repeat))
+    return best / len(items) * 1e6
+
+
+def main():
+    texts = corpus.resumes(100)
+    # Skill candidates as the Skills-section splitter produces them
+    candidates = [c.strip() for t in texts for c in patterns.SKILL_SEPARATORS.split(t) if 2 <= len(c.strip()) <= 35]
+    assert [legacy_is_valid_skill(c) for c in candidates] == [classify_skill_candidate(c) for c in candidates]
+    print(f"{len(candidates)} skill candidates, {len(texts)} resumes")
+    print(f"{'':>22} {'legacy us':>10} {'registry us':>12} {'speedup':>8}")
+    rows = [
+        ('is_valid_skill', legacy_is_valid_skill, classify_skill_candidate, candidates),
+        # re caches compiled patterns, so this pair is even to within noise
+        # (0.8x-1.1x from run to run): the registry forms are no speedup
+        ('ats date/number/phone', legacy_ats_patterns, registry_ats_patterns, texts),
+        # What the ATS checker runs instead: one ATS_SIGNALS pass
+        ('ats count_signals', legacy_ats_patterns, scanner_ats_patterns, texts),
+    ]
+    for name, legacy, registry, items in rows:
+        old = per_call_us(legacy, items)
+        new = per_call_us(registry, items)
+        print(f"{name:>22} {old:>10.2f} {new:>12.2f} {old / new:>7.1f}x")
+
+    # Warm-container behaviour: the same candidates recur across resumes
+    cold = per_call_us(classify_skill_candidate, candidates)
+    memo = per_call_us(is_valid_skill, candidates)
+    print(f"memoized is_valid_skill: {memo:.2f} us vs {cold:.2f} us unmemoized ({cold / memo:.1f}x)")
+    print(f"{len(set(candidates))} distinct candidates, memo {skill_memo.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: serial vs process-parallel PDF page extraction
+Synthetic multi-page PDFs are generated locally with PyMuPDF
+Usage: python test/benchmarks/bench_pdf_extraction.py
+"""
+import random
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import fitz  # noqa: E402
+import lambda_function as parser  # noqa: E402
+from process_pool import available_cpus  # noqa: E402
+
+PAGE_COUNTS = (20, 80, 200)
+
+
+def make_pdf(pages, seed=5):
+    """A PDF with a full page of resume-like text on every page"""
+    rng = random.Random(seed)
+    pdf = fitz.open()
+    for _ in range(pages):
+        page = pdf.new_page()
+        body = corpus.make_resume(rng, n_jobs=4, bullets=6)
+        page.insert_textbox(fitz.Rect(36, 36, 576, 756), body, fontsize=7)
+    data = pdf.tobytes()
+    pdf.close()
+    return data
+
+
+def timed(data, workers):
+    parser.PDF_WORKERS = workers
+    start = time.perf_counter()
+    text, extraction = parser.extract_text_from_pdf(data)
+    return time.perf_counter() - start, text
+
+
+def main():
+    cpus = available_cpus()
+    parser.PDF_MAX_PAGES = max(PAGE_COUNTS)
+    parser.PDF_MAX_CHARS = 10 ** 9
+    worker_options = sorted({1, 2, 4, cpus} - {w for w in (2, 4) if w > cpus})
+    print(f"available CPUs: {cpus}, parallel threshold: {parser.PDF_PARALLEL_PAGE_THRESHOLD} pages")
+    print(f"{'pages':>6} " + ' '.join(f"{f'{w} worker(s) s':>15}" for w in worker_options))
+    for pages in PAGE_COUNTS:
+        data = make_pdf(pages)
+        baseline = None
+        row = []
+        for workers in worker_options:
+            elapsed, text = min(timed(data, workers) for _ in range(3))
+            baseline = baseline or text
+            assert text == baseline, 'parallel extraction must preserve page order'
+            row.append(f"{elapsed:>15.3f}")
+        print(f"{pages:>6} " + ' '.join(row))
+
+
+if __name__ == '__main__':
+    main()
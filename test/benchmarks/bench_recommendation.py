@@ -0,0 +1,104 @@
+"""
+Benchmark: top-10 registered jobs for each of a few resumes, scoring
+every job vs max-score retrieval over the job index; the rankings must
+agree. Builds a temporary IDF artifact and job index over the synthetic
+jobs and preloads the registry cache, so DynamoDB is never called. A
+second pass removes each resume's best jobs and every 50th job from the
+registry after the index is built; they must be skipped without
+deepening the search to the whole index.
+Usage: python test/benchmarks/bench_recommendation.py
+"""
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+
+import corpus
+
+JOBS = 5000
+RESUMES = 10
+K = 10
+
+workdir = tempfile.mkdtemp()
+os.environ['IDF_ARTIFACT'] = os.path.join(workdir, 'idf.bin')
+os.environ['JOB_INDEX'] = os.path.join(workdir, 'job_index.bin')
+os.environ['JOB_REGISTRY_CACHE_SIZE'] = str(JOBS)
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+    import recommendation  # noqa: E402
+from idf_artifact import load_idf_table, write_idf_artifact  # noqa: E402
+from job_index import load_job_index, write_job_index  # noqa: E402
+import batch_scoring  # noqa: E402
+import job_registry  # noqa: E402
+from lru_cache import LRUCache  # noqa: E402
+
+
+def main():
+    texts = corpus.job_descriptions(JOBS, seed=29)
+    resume_texts = corpus.resumes(RESUMES, seed=31)
+    doc_freqs = Counter()
+    for text in texts + resume_texts:
+        doc_freqs.update(set(scorer.tokenize(text)))
+    write_idf_artifact(os.environ['IDF_ARTIFACT'], doc_freqs, len(texts) + len(resume_texts), scorer.TOKENIZER_VERSION)
+    with corpus.quiet():
+        scorer.idf_table = load_idf_table(os.environ['IDF_ARTIFACT'], scorer.TOKENIZER_VERSION)
+
+    # What register_jobs stores, after the JSON round trip through the table
+    registered = []
+    for i, text in enumerate(texts):
+        jd_id = job_registry.job_id(f"{text}\n#{i}")
+        features = json.loads(json.dumps(scorer.JobProfile(text).to_features()))
+        job_registry.memory_cache.put(jd_id, (f'Job {i}', scorer.JobProfile(text, features)))
+        registered.append((jd_id, features))
+    write_job_index(os.environ['JOB_INDEX'], registered, scorer.idf_table, scorer.TOKENIZER_VERSION)
+    with corpus.quiet():
+        index = load_job_index(os.environ['JOB_INDEX'], scorer.TOKENIZER_VERSION, scorer.idf_table)
+    profiles = [job_registry.memory_cache.get(jd_id)[1] for jd_id, _ in registered]
+
+    resumes = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+                'education': ['Bachelor of Science in Computer Science'],
+                'experience': {'years': 2 + i % 6, 'positions': ['Software Engineer']}}
+               for i, text in enumerate(resume_texts)]
+
+    all_scores = [batch_scoring.score_profiles(resume_data, profiles)[0] for resume_data in resumes]
+    for label, unregistered in (('all registered', set()), ('some unregistered', unregister(all_scores))):
+        job_registry.memory_cache = LRUCache(JOBS)
+        for i, (jd_id, _) in enumerate(registered):
+            if i not in unregistered:
+                job_registry.memory_cache.put(jd_id, (f'Job {i}', profiles[i]))
+        mismatches = 0
+        brute_time = indexed_time = 0.0
+        for resume_data in resumes:
+            start = time.perf_counter()
+            scores = batch_scoring.score_profiles(resume_data, [profile for i, profile in enumerate(profiles)
+                                                                if i not in unregistered])[0]
+            expected = sorted(scores, reverse=True)[:K]
+            brute_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            with corpus.quiet():
+                results = recommendation.recommend(resume_data, K, feedback_limit=0, index=index)
+            indexed_time += time.perf_counter() - start
+            mismatches += sum(1 for a, b in zip(expected, results) if round(a, 2) != b['score'])
+            mismatches += len(results) != K
+
+        print(f"{RESUMES} resumes x {JOBS} jobs, {label} ({len(unregistered)}), "
+              f"top {K} ({mismatches} ranking mismatches)")
+        print(f"{'score every job':>16}: {brute_time / RESUMES * 1000:8.1f} ms/resume")
+        print(f"{'job index':>16}: {indexed_time / RESUMES * 1000:8.1f} ms/resume")
+
+
+def unregister(all_scores):
+    """Job numbers to drop from the registry: each resume's top 3 and every 50th job"""
+    dropped = set(range(0, JOBS, 50))
+    for scores in all_scores:
+        dropped.update(sorted(range(JOBS), key=scores.__getitem__, reverse=True)[:3])
+    # Registry misses would go to DynamoDB; the dropped jobs are simply not there
+    job_registry.dynamodb.batch_get_item = lambda RequestItems: {'Responses': {}}
+    return dropped
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Parity check: section-derived results against the substring and regex
+checks they replaced, on the synthetic corpus and on resumes with
+compound headings ("SKILLS & TOOLS", "Experience & Leadership"). The ATS
+section flags and job titles must match the previous checks, and every
+compound Skills heading must yield a skills block.
+Usage: python test/benchmarks/bench_section_parity.py
+"""
+import re
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import lambda_function as parser  # noqa: E402
+from ats_checker import section_features  # noqa: E402
+from document import ParsedDocument  # noqa: E402
+
+# What check_ats_compatibility and extract_experience checked before the segmenter
+LEGACY_SECTION_HEADERS = ['experience', 'education', 'skills', 'projects', 'certifications']
+LEGACY_JOB_TITLES = [
+    'software engineer', 'developer', 'data scientist', 'analyst', 'manager',
+    'architect', 'consultant', 'designer', 'administrator', 'specialist',
+    'lead', 'senior', 'junior', 'intern', 'director', 'coordinator'
+]
+
+COMPOUND_SAMPLES = [
+    """Jane Doe
+jane@example.com | (555) 123-4567
+
+SKILLS & TOOLS
+Python, Docker, Kubernetes, Terraform
+
+Experience & Leadership
+Senior Software Engineer, Acme Corp, 2019 - 2024
+- Led migration of 40 services to AWS
+
+Education & Certifications
+Bachelor of Science in Computer Science, State University, 2015
+AWS Solutions Architect
+""",
+    """John Smith
+Technical Skills & Tools:
+React, TypeScript, GraphQL
+
+Work Experience and Projects
+Data Analyst at Initech (2018-2022), built dashboards in Tableau
+
+Education
+Master of Science in Statistics
+""",
+    """Alex Lee
+Profile / Summary
+Backend developer focused on distributed systems.
+
+Core Skills / Technologies
+Go, Kafka, PostgreSQL
+
+Employment History
+Consultant, Globex, 2020 - present
+"""
+]
+
+
+def legacy_section_features(text):
+    text_lower = text.lower()
+    return {
+        'has_skills_section': bool(re.search(r'(?:technical\s+)?skills?\s*:', text_lower, re.IGNORECASE)),
+        'has_summary': any(word in text_lower for word in ['summary', 'objective', 'profile', 'about']),
+        'headers_found': sum(1 for header in LEGACY_SECTION_HEADERS if header in text_lower)
+    }
+
+
+def legacy_positions(text):
+    return {title for title in LEGACY_JOB_TITLES if re.search(r'\b' + re.escape(title) + r'\b', text, re.IGNORECASE)}
+
+
+def main():
+    texts = corpus.resumes(300) + COMPOUND_SAMPLES
+    flag_mismatches = title_mismatches = 0
+    start = time.perf_counter()
+    for text in texts:
+        doc = ParsedDocument(text)
+        if section_features(doc, {}) != legacy_section_features(text):
+            flag_mismatches += 1
+        # extract_experience keeps the first 10 titles; compare the full sets
+        if set(parser.JOB_TITLE_MATCHER.find_terms(doc.lower)) != legacy_positions(text):
+            title_mismatches += 1
+    elapsed = time.perf_counter() - start
+    missing_blocks = sum(1 for text in COMPOUND_SAMPLES if not ParsedDocument(text).sections.first_block('skills'))
+
+    print(f"{len(texts)} resumes ({len(COMPOUND_SAMPLES)} with compound headings) in {elapsed * 1000:.1f} ms")
+    print(f"  ATS section flag mismatches: {flag_mismatches}")
+    print(f"  job title mismatches:        {title_mismatches}")
+    print(f"  compound Skills headings without a skills block: {missing_blocks}")
+
+
+if __name__ == '__main__':
+    main()
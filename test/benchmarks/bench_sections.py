@@ -0,0 +1,63 @@
+"""
+Benchmark: worst-case inputs for skills-section detection
+Compares the previous skills-section regexes with the one-pass section segmenter
+Usage: python test/benchmarks/bench_sections.py
+"""
+import re
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+from document import ParsedDocument  # noqa: E402
+from lambda_function import extract_skills  # noqa: E402
+
+# The patterns extract_skills used before the segmenter
+LEGACY_SKILLS_SECTION_PATTERNS = [
+    r'(?:technical\s+)?skills?\s*:?\s*\n((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
+    r'(?:key|core)\s+(?:technical\s+)?(?:skills|competencies|technologies)\s*:?\s*\n((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
+    r'technologies?\s+(?:used|known|familiar)\s*:?\s*\n?((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)',
+    r'programming\s+languages?\s*:?\s*\n?((?:[^\n]+\n?)+?)(?:\n\n|(?=[A-Z][a-z]+\s*:)|\Z)'
+]
+
+# Inputs that defeat the legacy regexes; each builder takes a size in bytes
+ADVERSARIAL = {
+    'heading + whitespace, no newline': lambda n: 'Skills' + ' ' * n,
+    'skills lines, no blank lines': lambda n: 'Skills:\n' + 'Python, Java, Docker, AWS\n' * (n // 25),
+    'repeated heading words': lambda n: 'technical skills ' * (n // 17),
+}
+
+SIZES_KB = (25, 50, 100, 200)
+# The legacy regexes are quadratic; cap them so the run stays short
+LEGACY_MAX_KB = 50
+
+
+def legacy(text):
+    for pattern in LEGACY_SKILLS_SECTION_PATTERNS:
+        re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+
+
+def segmenter(text):
+    ParsedDocument(text).sections.first_block('skills')
+
+
+def timed(fn, text):
+    start = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    for name, build in ADVERSARIAL.items():
+        print(name)
+        print(f"  {'KB':>4} {'legacy s':>10} {'segmenter ms':>13} {'ms per KB':>10} {'extract_skills ms':>18}")
+        for kb in SIZES_KB:
+            text = build(kb * 1024)
+            legacy_time = f"{timed(legacy, text):10.3f}" if kb <= LEGACY_MAX_KB else f"{'skipped':>10}"
+            seg = min(timed(segmenter, text) for _ in range(3))
+            full = timed(extract_skills, text)
+            print(f"  {kb:>4} {legacy_time} {seg * 1000:>13.2f} {seg * 1000 / kb:>10.4f} {full * 1000:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
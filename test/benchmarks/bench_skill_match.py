@@ -0,0 +1,76 @@
+"""
+Benchmark: calculate_skill_match's per-skill synonym loop vs the inverted
+synonym index, by number of resume skills, with the job's canonical
+skills looked up lazily or passed in prebuilt; matches must agree
+Usage: python test/benchmarks/bench_skill_match.py
+"""
+import random
+import time
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+
+
+def previous_match(resume_skill_set, job_text_lower, job_tokens):
+    """The previous match loop (synonym dict scanned for every resume skill)"""
+    matched_skills = []
+    for resume_skill in resume_skill_set:
+        if resume_skill in job_text_lower:
+            matched_skills.append(resume_skill)
+            continue
+        matched = False
+        for canonical, variants in scorer.SKILL_SYNONYMS.items():
+            if resume_skill in variants:
+                if any(variant in job_text_lower for variant in variants):
+                    matched_skills.append(resume_skill)
+                    matched = True
+                    break
+        if matched:
+            continue
+        resume_skill_tokens = set(resume_skill.split())
+        if resume_skill_tokens.issubset(job_tokens):
+            matched_skills.append(resume_skill)
+            continue
+        if len(resume_skill_tokens) > 1:
+            overlap = resume_skill_tokens.intersection(job_tokens)
+            if len(overlap) / len(resume_skill_tokens) >= 0.7:
+                matched_skills.append(resume_skill)
+    return matched_skills
+
+
+def skill_pool():
+    """Corpus skills, every synonym variant and some multi-word near misses"""
+    pool = {skill.lower() for skill in corpus.SKILLS} | set(scorer.SYNONYM_INDEX)
+    pool |= {'distributed systems', 'event pipeline design', 'customer billing', 'rust tooling'}
+    return sorted(pool)
+
+
+def main():
+    rng = random.Random(4)
+    jobs = [(text.lower(), set(scorer.tokenize(text))) for text in corpus.job_descriptions(300)]
+    pool = skill_pool()
+
+    canonicals = [scorer.job_canonical_skills(text) for text, _ in jobs]
+    print(f"{'skills':>6} {'previous us/job':>16} {'indexed us/job':>15} {'+ job canonicals':>17} {'mismatches':>11}")
+    for count in (5, 20, 80):
+        skill_sets = [rng.sample(pool, count) for _ in jobs]
+        start = time.perf_counter()
+        expected = [previous_match(skills, text, tokens) for skills, (text, tokens) in zip(skill_sets, jobs)]
+        previous = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = [scorer.match_resume_skills(skills, text, tokens) for skills, (text, tokens) in zip(skill_sets, jobs)]
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        reused = [scorer.match_resume_skills(skills, text, tokens, job_canonicals)
+                  for skills, (text, tokens), job_canonicals in zip(skill_sets, jobs, canonicals)]
+        prebuilt = time.perf_counter() - start
+        mismatches = sum(1 for a, b, c in zip(expected, actual, reused) if not a == b == c)
+        print(f"{count:>6} {previous / len(jobs) * 1e6:>16.1f} {indexed / len(jobs) * 1e6:>15.1f} "
+              f"{prebuilt / len(jobs) * 1e6:>17.1f} {mismatches:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: per-skill regex loop vs the Aho-Corasick SkillMatcher
+Usage: python test/benchmarks/bench_skill_matcher.py
+"""
+import random
+import re
+import time
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+from lambda_function import SKILLS_BY_DOMAIN  # noqa: E402
+from skill_matcher import SkillMatcher  # noqa: E402
+
+
+def regex_loop(skills, text_lower):
+    """The previous extract_skills Method 1"""
+    found = []
+    for skill in skills:
+        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
+            found.append(skill)
+    return found
+
+
+def grow_dictionary(base, size, seed=3):
+    """Pad the real dictionary with plausible multi-word terms"""
+    rng = random.Random(seed)
+    words = sorted({w for term in base for w in re.split(r'[\s./-]+', term) if len(w) > 2})
+    terms = list(base)
+    seen = set(terms)
+    while len(terms) < size:
+        term = ' '.join(rng.sample(words, rng.randint(1, 3)))
+        if term not in seen:
+            seen.add(term)
+            terms.append(term)
+    return terms
+
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    texts = [t.lower() for t in corpus.resumes(100)]
+    base = SKILLS_BY_DOMAIN['tech']
+    print(f"{'terms':>6} {'regex ms/doc':>13} {'automaton ms/doc':>17} {'build ms':>9}")
+    for size in (len(base), 1000, 3000, 6000):
+        terms = grow_dictionary(base, size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(terms)
+        build = time.perf_counter() - start
+        regex_time = best_of(lambda: [regex_loop(terms, t) for t in texts])
+        ac_time = best_of(lambda: [matcher.find_terms(t) for t in texts])
+        print(f"{size:>6} {regex_time / len(texts) * 1000:>13.3f} "
+              f"{ac_time / len(texts) * 1000:>17.3f} {build * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: dict-of-string TF-IDF vectors vs array-backed SparseVector
+Vectors are built once per document (full corpus resumes and job
+descriptions) and compared pairwise; similarities must agree with the
+dict implementation
+Usage: python test/benchmarks/bench_sparse.py
+"""
+import math
+import time
+from collections import Counter
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+from sparse import Vocabulary, tfidf_vector  # noqa: E402
+
+
+def dict_vector(tokens, idf):
+    """The previous compute_tf + compute_tfidf"""
+    counter = Counter(tokens)
+    return {word: count / len(tokens) * idf.get(word) for word, count in counter.items()}
+
+
+def dict_cosine(vec1, vec2):
+    """The previous cosine_similarity"""
+    all_words = set(vec1.keys()) | set(vec2.keys())
+    dot_product = sum(vec1.get(word, 0) * vec2.get(word, 0) for word in all_words)
+    magnitude1 = math.sqrt(sum(val ** 2 for val in vec1.values()))
+    magnitude2 = math.sqrt(sum(val ** 2 for val in vec2.values()))
+    if magnitude1 == 0 or magnitude2 == 0:
+        return 0.0
+    return dot_product / (magnitude1 * magnitude2)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    resumes = [scorer.tokenize(text) for text in corpus.resumes(100)]
+    jobs = [scorer.tokenize(text) for text in corpus.job_descriptions(20)]
+    pairs = [(r, j) for r in resumes for j in jobs]
+    # Corpus-style IDF so both paths see the same positive weights
+    idf = {}
+    for tokens in resumes + jobs:
+        for word in set(tokens):
+            idf[word] = idf.get(word, 0) + 1
+    idf = {word: math.log((1 + len(resumes) + len(jobs)) / (1 + df)) + 1 for word, df in idf.items()}
+    vocabulary = Vocabulary()
+    documents = resumes + jobs
+    print(f"{len(pairs)} pairs, ~{sum(map(len, resumes)) // len(resumes)} resume tokens, "
+          f"~{sum(map(len, jobs)) // len(jobs)} JD tokens")
+
+    dicts, dict_build = timed(lambda: [dict_vector(tokens, idf) for tokens in documents])
+    vectors, sparse_build = timed(lambda: [tfidf_vector(tokens, vocabulary, idf) for tokens in documents])
+    n = len(resumes)
+    expected, dict_time = timed(lambda: [dict_cosine(dicts[r], dicts[n + j])
+                                         for r in range(n) for j in range(len(jobs))])
+    actual, sparse_time = timed(lambda: [vectors[r].cosine(vectors[n + j])
+                                         for r in range(n) for j in range(len(jobs))])
+
+    drift = max(abs(a - b) for a, b in zip(expected, actual))
+    print(f"max |dict - sparse| similarity: {drift:.2e}")
+    print(f"{'':>13} {'build us/doc':>13} {'cosine us/pair':>15}")
+    for name, build, cosine in (('dict', dict_build, dict_time), ('SparseVector', sparse_build, sparse_time)):
+        print(f"{name:>13} {build / len(documents) * 1e6:>13.1f} {cosine / len(pairs) * 1e6:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
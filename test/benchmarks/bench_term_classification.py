@@ -0,0 +1,254 @@
+"""
+Benchmark: term classifiers (is_technical_keyword, soft-skill detection)
+and extract_keywords on job descriptions, previous per-call tables vs
+prebuilt tables with a per-token memo. Verdicts must agree.
+Usage: python test/benchmarks/bench_term_classification.py
+"""
+import time
+from collections import Counter
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+
+ODD_WORDS = ['react-native', 'end-to-end', 'node.js', 'c++', 'AWS', 'TypeScript', 'python3', 'x-ray',
+             'teams', 'users', 'escalating', 'testing', 'oauth2', 'graphql', 'micro-frontend', 'DevOps',
+             'meaningful', 'trustworthy', 'k8s', 'scikit-learn', 'a-b', 'ci-cd', 'Go']
+
+
+def previous_is_technical_keyword(word, context_words=None):
+    """The previous is_technical_keyword"""
+    word_lower = word.lower()
+
+    # First, check against known technical domains (core technical terms only)
+    tech_domains = {
+        'languages': ['python', 'java', 'javascript', 'typescript', 'kotlin', 'swift', 'ruby', 
+                      'php', 'golang', 'rust', 'scala', 'cpp', 'csharp', 'perl', 'dart', 'sql'],
+        'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 
+                       'fastapi', 'nextjs', 'gatsby', 'svelte', 'rails', 'laravel', 'dotnet', 'redux'],
+        'cloud': ['aws', 'azure', 'gcp', 'ec2', 's3', 'lambda', 'dynamodb', 'cloudformation',
+                  'terraform', 'ansible', 'puppet', 'chef', 'kubernetes', 'docker', 'k8s'],
+        'databases': ['mongodb', 'postgresql', 'mysql', 'redis', 'cassandra', 'elasticsearch', 
+                      'neo4j', 'oracle', 'sqlite', 'dynamodb', 'firebase', 'mariadb'],
+        'tools': ['git', 'jenkins', 'gitlab', 'github', 'circleci', 'jira', 'gradle', 'maven', 
+                  'npm', 'yarn', 'webpack', 'vite', 'babel'],
+        'ml_ai': ['tensorflow', 'pytorch', 'keras', 'pandas', 'numpy', 'spark', 'scikit',
+                  'hadoop', 'airflow', 'mlflow', 'sagemaker', 'opencv'],
+        'testing': ['junit', 'pytest', 'jest', 'mocha', 'selenium', 'cypress', 'testng'],
+        'protocols': ['graphql', 'grpc', 'websocket', 'mqtt', 'amqp', 'kafka', 'rabbitmq'],
+    }
+
+    # Check if word is in any technical domain
+    for domain, keywords in tech_domains.items():
+        if word_lower in keywords:
+            return True
+        # Check if word contains a technical term (e.g., "react-native" contains "react")
+        if any(tech in word_lower for tech in keywords if len(tech) > 3):
+            return True
+
+    # Pattern-based detection for technical terms
+    tech_patterns = [
+        lambda w: w.endswith(('js', 'py', 'rb', 'go', 'rs')) and len(w) <= 10,  # Language extensions
+        lambda w: w.endswith(('.js', '.py', '.java', '.cpp', '.rb')),  # File extensions
+        lambda w: w.endswith(('sql', 'db', 'ql')) and len(w) > 2,  # Database/Query languages
+        lambda w: any(x in w for x in ['sdk', 'ide', 'cli', 'orm', 'jwt', 'oauth', 'saml', 'xml', 'json', 'yaml']) and len(w) <= 15,  # Tech acronyms
+    ]
+
+    if any(pattern(word_lower) for pattern in tech_patterns):
+        return True
+
+    # Technical acronyms (2-4 uppercase letters)
+    if len(word) <= 4 and word.isupper() and len(word) >= 2 and word.isalpha():
+        return True
+
+    # Semantic pattern recognition: technical words have specific characteristics
+    # 1. Contains version numbers or dots (e.g., "node.js", "c++", "python3")
+    if any(char in word_lower for char in ['.', '+']) and len(word_lower) <= 12:
+        return True
+
+    # 2. CamelCase or PascalCase (common in tech: "TypeScript", "JavaScript", "DevOps")
+    if word[0].isupper() and any(c.isupper() for c in word[1:]) and len(word) > 3:
+        return True
+
+    # 3. Hyphenated technical compounds (e.g., "react-native", "end-to-end")
+    if '-' in word_lower and len(word_lower) > 5:
+        parts = word_lower.split('-')
+        # At least one part should be a known technical term
+        if any(part in tech_term for domain in tech_domains.values() for tech_term in domain for part in parts):
+            return True
+
+    # 4. Contains numbers (version indicators: python3, angular2, etc.)
+    if any(c.isdigit() for c in word) and len(word) <= 15:
+        # But not just numbers, must have letters too
+        if any(c.isalpha() for c in word):
+            return True
+
+    # If none of the patterns match, it's likely not a technical keyword
+    return False
+
+
+def previous_is_soft_skill(word):
+    """The previous is_likely_soft_skill_or_business_term"""
+    word_lower = word.lower().strip()
+
+    # Pattern 1: Gerunds (ending in -ing) are often soft skills or actions
+    if word_lower.endswith('ing') and len(word_lower) > 5:
+        # Exceptions: some -ing words are technical (e.g., "testing", "profiling")
+        tech_ing_words = {'testing', 'profiling', 'debugging', 'logging', 'caching', 
+                          'hashing', 'parsing', 'rendering', 'scaling', 'monitoring'}
+        if word_lower not in tech_ing_words:
+            return True
+
+    # Pattern 2: Abstract nouns ending in -tion, -ment, -ness, -ship, -ity
+    if word_lower.endswith(('tion', 'sion', 'ment', 'ness', 'ship', 'ity', 'ance', 'ence')):
+        return True
+
+    # Pattern 3: Plural generic terms (teams, peers, partners, people, users)
+    if word_lower.endswith('s') and len(word_lower) > 3:
+        singular = word_lower[:-1]
+        generic_plurals = ['team', 'peer', 'partner', 'people', 'person', 'member', 
+                          'client', 'customer', 'user', 'engineer', 'developer', 'blocker', 'answer']
+        if singular in generic_plurals or word_lower in [p + 's' for p in generic_plurals]:
+            return True
+
+    # Pattern 4: Adjectives ending in -ful, -ive, -able, -ible (meaningful, effective, scalable)
+    if word_lower.endswith(('ful', 'ive', 'able', 'ible', 'ous', 'ent', 'ant')):
+        return True
+
+    # Pattern 5: Common action verbs (identify, escalate, coordinate, etc.)
+    action_verbs = {'identify', 'escalate', 'coordinate', 'facilitate', 'enable', 'drive',
+                    'ensure', 'provide', 'support', 'assist', 'help', 'deliver', 'achieve',
+                    'establish', 'maintain', 'develop', 'create', 'build', 'implement',
+                    'execute', 'perform', 'conduct', 'manage', 'oversee', 'direct'}
+    if word_lower in action_verbs:
+        return True
+
+    # Pattern 6: Common soft skill roots
+    soft_skill_roots = ['trust', 'leader', 'manage', 'collaborat', 'communi', 'organiz',
+                       'motiv', 'passion', 'creativ', 'innov', 'strate', 'vision', 'escalat',
+                       'integrit', 'hones', 'ethic', 'transparen', 'accountab', 'depend',
+                       'cooperat', 'interpers', 'empath', 'adapt', 'resilien', 'patien', 'diligen']
+    if any(root in word_lower for root in soft_skill_roots):
+        return True
+
+    # Pattern 7: Exact soft skill words (catch common ones directly)
+    exact_soft_skills = {'trust', 'integrity', 'honesty', 'ethics', 'transparency',
+                        'accountability', 'teamwork', 'leadership', 'empathy', 'patience',
+                        'adaptability', 'flexibility', 'resilience', 'diligence'}
+    if word_lower in exact_soft_skills:
+        return True
+
+    return False
+
+
+def previous_extract_keywords(text, top_n=20):
+    """The previous extract_keywords"""
+    tokens = scorer.tokenize(text)
+
+    # Get context words for better classification
+    context_words = set(text.lower().split())
+
+    # Core stop words - supplemented by pattern-based detection
+    generic_words = {
+        # Common verbs (will catch -ing forms with pattern detection)
+        'experience', 'work', 'build', 'create', 'develop', 'implement', 'maintain',
+        'design', 'write', 'test', 'deploy', 'drive', 'manage', 'lead', 'help',
+
+        # Position-related terms
+        'senior', 'junior', 'lead', 'principal', 'staff', 'associate', 'intern',
+        'manager', 'director', 'engineer', 'engineers', 'developer', 'developers',
+        'architect', 'consultant', 'team', 'teams', 'member', 'members',
+
+        # Generic tech context words
+        'product', 'products', 'project', 'projects', 'platform', 'platforms',
+        'system', 'systems', 'service', 'services', 'application', 'applications',
+        'solution', 'solutions', 'feature', 'features', 'component', 'components',
+        'code', 'software', 'hardware', 'tool', 'tools', 'environment',
+
+        # Time & quantities
+        'years', 'year', 'months', 'month', 'day', 'days', 'experience',
+        'millions', 'thousands', 'scale', 'least', 'active',
+
+        # Role descriptors
+        'requirements', 'responsibilities', 'duties', 'tasks', 'qualifications',
+        'skills', 'skill', 'ability', 'knowledge', 'expertise', 'proficiency',
+
+        # Common tech-adjacent words that aren't skills
+        'production', 'field', 'based', 'related', 'using', 'native',
+        'computer', 'machines', 'user', 'users', 'client', 'clients',
+        'customer', 'customers', 'people', 'person', 'business', 'company'
+    }
+
+    # Use ML-inspired scoring: combine frequency + technical classification
+    technical_tokens = []
+    for token in tokens:
+        # Skip generic words and very short words
+        if token in generic_words or len(token) < 3:
+            continue
+        # Only include if it's classified as technical
+        if previous_is_technical_keyword(token, context_words):
+            technical_tokens.append(token)
+
+    # Score tokens by frequency (TF-IDF intuition)
+    counter = Counter(technical_tokens)
+
+    # Return top N most frequent technical keywords
+    return [word for word, _ in counter.most_common(top_n)]
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    jobs = corpus.job_descriptions(300)
+    words = sorted({word for text in jobs + corpus.resumes(50) for word in text.split()} | set(ODD_WORDS))
+    words += [word.lower() for word in words] + scorer.tokenize(' '.join(jobs))
+    mismatches = sum(1 for word in words if previous_is_technical_keyword(word) != scorer.is_technical_keyword(word))
+    mismatches += sum(1 for word in words
+                      if previous_is_soft_skill(word) != scorer.is_likely_soft_skill_or_business_term(word))
+    mismatches += sum(1 for text in jobs if previous_extract_keywords(text) != scorer.extract_keywords(text))
+    print(f"{len(set(words))} distinct words, {len(jobs)} JDs, {mismatches} mismatches")
+
+    def cold():
+        scorer.classify_technical_term.cache_clear()
+        scorer.is_likely_soft_skill_or_business_term.cache_clear()
+        for text in jobs:
+            scorer.extract_keywords(text)
+
+    rows = (
+        ('previous', best_of(lambda: [previous_extract_keywords(text) for text in jobs])),
+        ('prebuilt, cold memo', best_of(cold)),
+        ('prebuilt, warm memo', best_of(lambda: [scorer.extract_keywords(text) for text in jobs])),
+    )
+    print(f"{'extract_keywords':>20} {'us/JD':>8}")
+    for name, elapsed in rows:
+        print(f"{name:>20} {elapsed / len(jobs) * 1e6:>8.1f}")
+
+    start = time.perf_counter()
+    for word in words:
+        previous_is_technical_keyword(word)
+        previous_is_soft_skill(word)
+    previous = time.perf_counter() - start
+    start = time.perf_counter()
+    for word in words:
+        scorer.classify_technical_term.__wrapped__(word)
+        scorer.is_likely_soft_skill_or_business_term.__wrapped__(word)
+    prebuilt = time.perf_counter() - start
+    start = time.perf_counter()
+    for word in words:
+        scorer.is_technical_keyword(word)
+        scorer.is_likely_soft_skill_or_business_term(word)
+    memoized = time.perf_counter() - start
+    print(f"classifiers per word: previous {previous / len(words) * 1e6:.2f} us, "
+          f"prebuilt {prebuilt / len(words) * 1e6:.2f} us, memoized {memoized / len(words) * 1e6:.2f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Synthetic resume and job description corpus for the benchmarks
+Deterministic for a given seed so runs are comparable across commits
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def use_lambda(name):
+    """Make a Lambda function directory importable (its vendored boto3 included)"""
+    # Appended rather than prepended: the vendored fitz/ in resume_parser is
+    # only complete inside the Lambda image, so a local PyMuPDF must win
+    path = os.path.join(ROOT, 'lambda', name)
+    # Modules deploy.sh copies into every function package
+    shared = os.path.join(ROOT, 'lambda', 'shared')
+    for entry in (path, shared):
+        if entry not in sys.path:
+            sys.path.append(entry)
+    # Several functions have a lambda_function module: other functions'
+    # directories go behind this one, and one already imported from them
+    # is dropped (the unit tests load both functions in one session)
+    others = [entry for entry in sys.path
+              if os.path.dirname(entry) == os.path.join(ROOT, 'lambda') and entry not in (path, shared)]
+    for entry in others:
+        sys.path.remove(entry)
+        sys.path.append(entry)
+    loaded = sys.modules.get('lambda_function')
+    if loaded is not None and os.path.dirname(os.path.abspath(loaded.__file__)) != path:
+        del sys.modules['lambda_function']
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    return path
+
+
+def quiet():
+    """Silence the per-document log lines the Lambda code prints"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+NAMES = ['Alex Morgan', 'Priya Raman', 'Jordan Lee', 'Sam Okafor', 'Chen Wei', 'Maria Gomez']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Scientist', 'DevOps Engineer',
+          'Backend Developer', 'Full Stack Developer', 'Cloud Architect', 'QA Analyst']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries']
+SKILLS = ['Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Node.js', 'AWS', 'Docker',
+          'Kubernetes', 'PostgreSQL', 'MongoDB', 'Redis', 'Terraform', 'Jenkins', 'GraphQL',
+          'Django', 'Flask', 'Spring Boot', 'TensorFlow', 'PyTorch', 'Pandas', 'Kafka',
+          'Git', 'Linux', 'CI/CD', 'REST API', 'Microservices', 'Go', 'Rust', 'C++', 'Scala',
+          'Spark', 'Airflow', 'Elasticsearch', 'Selenium', 'Jest', 'Agile', 'Scrum']
+VERBS = ['Developed', 'Implemented', 'Designed', 'Led', 'Built', 'Optimized', 'Reduced',
+         'Improved', 'Architected', 'Delivered', 'Launched', 'Managed', 'Created']
+OBJECTS = ['a distributed event pipeline', 'the customer billing service', 'internal tooling',
+           'a real-time analytics dashboard', 'the deployment workflow', 'search ranking',
+           'a machine learning platform', 'the mobile API gateway', 'data ingestion jobs']
+IMPACTS = ['cutting latency by {n}%', 'serving {n}k daily users', 'saving ${n}k per year',
+           'improving throughput {n}x', 'reducing costs by {n}%', 'with {n}+ engineers']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'B.S. in Software Engineering', 'Master of Engineering in Computer Engineering']
+SCHOOLS = ['University of Washington', 'Georgia Institute of Technology', 'Stanford University',
+           'University of Texas at Austin', 'Carnegie Mellon University']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def make_resume(rng, n_jobs=3, bullets=4):
+    """Build one plain-text resume"""
+    name = rng.choice(NAMES)
+    lines = [
+        name,
+        f"{name.split()[0].lower()}@example.com | ({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        '',
+        'Summary',
+        f"{rng.choice(TITLES)} with {rng.randint(2, 12)}+ years of experience building "
+        f"scalable systems with {', '.join(rng.sample(SKILLS, 3))}.",
+        '',
+        'Technical Skills:',
+        ', '.join(rng.sample(SKILLS, rng.randint(8, 16))),
+        ', '.join(rng.sample(SKILLS, rng.randint(3, 6))),
+        '',
+        'Experience',
+    ]
+    year = 2024
+    for _ in range(n_jobs):
+        start = year - rng.randint(1, 3)
+        lines.append(f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)} "
+                     f"({rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {year})")
+        for _ in range(bullets):
+            impact = rng.choice(IMPACTS).format(n=rng.randint(2, 90))
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using "
+                         f"{rng.choice(SKILLS)} and {rng.choice(SKILLS)}, {impact}")
+        year = start
+    lines += [
+        '',
+        'Projects',
+        f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {rng.choice(SKILLS)}",
+        '',
+        'Education',
+        f"{rng.choice(DEGREES)}, {rng.choice(SCHOOLS)}, {year - rng.randint(0, 4)}",
+        '',
+        'Certifications',
+        'AWS Certified Solutions Architect',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def make_job_description(rng):
+    """Build one plain-text job description"""
+    skills = rng.sample(SKILLS, rng.randint(5, 10))
+    return '\n'.join([
+        f"We are hiring a {rng.choice(TITLES)} to join {rng.choice(COMPANIES)}.",
+        f"You will design and build {rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}.",
+        f"Requirements: {rng.randint(2, 8)}+ years of experience with {', '.join(skills[:4])}.",
+        f"Experience with {', '.join(skills[4:])} is a plus.",
+        'Strong communication skills and ability to work in an agile team.',
+        "Bachelor's degree in Computer Science or related field.",
+    ])
+
+
+def resumes(count=200, seed=7):
+    """Return a list of synthetic resumes"""
+    rng = random.Random(seed)
+    return [make_resume(rng, n_jobs=rng.randint(2, 5), bullets=rng.randint(3, 6))
+            for _ in range(count)]
+
+
+def job_descriptions(count=200, seed=11):
+    """Return a list of synthetic job descriptions"""
+    rng = random.Random(seed)
+    return [make_job_description(rng) for _ in range(count)]
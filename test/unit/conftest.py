@@ -0,0 +1,9 @@
+"""
+Unit tests share the synthetic corpus and Lambda path handling with the
+benchmarks
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
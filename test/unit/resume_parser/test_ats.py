@@ -0,0 +1,133 @@
+"""
+ATS results against the checker as it was before the single-pass scanner
+and the check registry, on a fixed corpus
+"""
+import re
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+from ats_checker import (FEATURE_VECTOR_FIELDS, check_ats_compatibility, feature_vector,  # noqa: E402
+                         scan_ats_features, score_ats_features)
+from document import ParsedDocument  # noqa: E402
+
+EDGE_TEXTS = [
+    '',
+    'hello',
+    '(555) 123-4567', '555.123.4567', '5551234567', '555) 1234567', '555123 4567', '12345-678-9012',
+    'FY2020 2020s 1999, $2020 2019x', '$5% 12+3% 3x4 $$7', 'Jan-Dec 2021',
+    'Technical Skills:\nPython\nSummary\nled and developed', 'SKILLS : go\nabout me',
+    'word ' * 150,
+]
+
+
+def baseline_ats(text, resume_data):
+    """check_ats_compatibility before the scanner, checks in their original order"""
+    score = 100
+    issues = []
+    text_lower = text.lower()
+    skills_count = len(resume_data.get('skills', []))
+    has_skills_section = bool(re.search(r'(?:technical\s+)?skills?\s*:', text_lower, re.IGNORECASE))
+    education = resume_data.get('education', [])
+    positions = resume_data.get('experience', {}).get('positions', [])
+    strong_verbs = ['achieved', 'improved', 'developed', 'implemented', 'designed', 'managed',
+                    'led', 'created', 'built', 'increased', 'reduced', 'optimized',
+                    'established', 'launched', 'delivered', 'architected', 'engineered']
+    words = text_lower.split()
+
+    if len(text) < 400:
+        score -= 25
+        issues.append("Resume is too brief - needs more detail")
+    elif len(text) > 5000:
+        score -= 10
+        issues.append("Resume is too lengthy")
+    if skills_count == 0 and not has_skills_section:
+        score -= 25
+        issues.append("No technical skills section detected")
+    elif skills_count == 0:
+        score -= 10
+        issues.append("Skills section found but couldn't parse specific technologies")
+    elif skills_count < 3:
+        score -= 15
+        issues.append("Limited technical skills detected - add more relevant technologies")
+    elif skills_count < 6:
+        score -= 5
+        issues.append("Good start on skills, but could list more")
+    elif skills_count >= 8:
+        score += 5
+    if not education:
+        score -= 15
+        issues.append("No education section found")
+    elif any(deg in ' '.join(education).lower() for deg in ['bachelor', 'master', 'phd', 'degree', 'university']):
+        score += 5
+    if not positions:
+        score -= 20
+        issues.append("No work experience details detected")
+    elif len(re.findall(r'\b(19|20)\d{2}\b|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec', text)) < 2:
+        score -= 10
+        issues.append("Missing dates in experience section")
+    verb_count = sum(1 for verb in strong_verbs if verb in text_lower)
+    if verb_count < 3:
+        score -= 15
+        issues.append("Limited use of strong action verbs")
+    elif verb_count >= 8:
+        score += 5
+    if len(re.findall(r'\d+[%+]|\$\d+|\d+x', text)) < 2:
+        score -= 10
+        issues.append("Few quantifiable achievements")
+    if not ('@' in text and '.' in text):
+        score -= 15
+        issues.append("No email address found")
+    if not re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text):
+        score -= 5
+        issues.append("No phone number detected")
+    if not any(word in text_lower for word in ['summary', 'objective', 'profile', 'about']) and len(text) > 500:
+        score -= 5
+        issues.append("No professional summary section")
+    if len(words) > 100 and len(set(words)) / len(words) < 0.3:
+        score -= 10
+        issues.append("Content appears repetitive")
+    if sum(1 for header in ['experience', 'education', 'skills', 'projects', 'certifications']
+           if header in text_lower) < 3:
+        score -= 10
+        issues.append("Missing standard section headers")
+    return max(0, min(100, score)), issues[:8]
+
+
+def resume_data_variants(text):
+    """Extractor results covering every branch of the skills, education and experience checks"""
+    skills = [skill for skill in corpus.SKILLS if skill.lower() in text.lower()]
+    for count in (0, 1, 4, 7, 9):
+        yield {'skills': (skills + corpus.SKILLS)[:count],
+               'education': [corpus.DEGREES[count % len(corpus.DEGREES)]] if count % 2 else [],
+               'experience': {'positions': ['Software Engineer'] if count > 1 else []}}
+    yield {'education': ['Some coursework'], 'experience': {}}
+
+
+@pytest.mark.parametrize('text', corpus.resumes(40) + corpus.job_descriptions(10) + EDGE_TEXTS)
+def test_results_match_baseline(text):
+    for resume_data in resume_data_variants(text):
+        result = check_ats_compatibility(text, resume_data)
+        assert (result['score'], result['issues']) == baseline_ats(text, resume_data)
+        assert len(result['recommendations']) == len(result['issues'])
+
+
+def test_shared_document_scores_like_text():
+    text = corpus.resumes(1, seed=5)[0]
+    resume_data = {'skills': ['Python'], 'education': [], 'experience': {'positions': ['Analyst']}}
+    assert check_ats_compatibility(ParsedDocument(text), resume_data) == check_ats_compatibility(text, resume_data)
+
+
+def test_feature_vectors_round_trip_through_bulk_scoring():
+    np = pytest.importorskip('numpy')
+    from ats_bulk import score_feature_matrix
+    records = [scan_ats_features(text, resume_data)
+               for text in corpus.resumes(20, seed=9) + EDGE_TEXTS
+               for resume_data in resume_data_variants(text)]
+    scores, ratings = score_feature_matrix(np.array([feature_vector(record) for record in records]))
+    expected = [score_ats_features(record) for record in records]
+    assert scores.tolist() == [result['score'] for result in expected]
+    assert ratings.tolist() == [result['rating'] for result in expected]
+    assert all(len(feature_vector(record)) == len(FEATURE_VECTOR_FIELDS) for record in records)
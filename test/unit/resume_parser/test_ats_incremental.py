@@ -0,0 +1,92 @@
+import json
+import random
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+import ats_incremental  # noqa: E402
+from ats_checker import scan_ats_features  # noqa: E402
+
+
+def state_for(text):
+    return ats_incremental.new_state(text, scan_ats_features(text, {}))
+
+
+def text_features(text):
+    expected = scan_ats_features(text, {})
+    return {name: value for name, value in expected.items() if name not in ats_incremental.EXTRACTED_FEATURES}
+
+
+def test_line_edits_match_a_full_rescan():
+    rng = random.Random(3)
+    donors = [text.split('\n') for text in corpus.resumes(5, seed=99)]
+    for text in corpus.resumes(20):
+        lines = text.split('\n')
+        # Through JSON each time, as the client holds it between requests
+        state = state_for(text)
+        for _ in range(10):
+            start = rng.randrange(len(lines))
+            stop = min(len(lines), start + rng.randint(0, 3))
+            donor = rng.choice(donors)
+            at = rng.randrange(len(donor))
+            edit = {'removed': lines[start:stop], 'added': donor[at:at + rng.randint(0, 3)]}
+            lines[start:stop] = edit['added']
+
+            state = ats_incremental.validate_state(json.loads(json.dumps(state)))
+            ats_incremental.apply_edits(state, [edit])
+            features = ats_incremental.state_features(state)
+            assert {name: features[name] for name in text_features('')} == text_features('\n'.join(lines))
+
+
+def test_empty_edit_list_leaves_the_score():
+    text = corpus.resumes(1)[0]
+    state = state_for(text)
+    before = ats_incremental.rescore(state)
+    assert ats_incremental.rescore(ats_incremental.apply_edits(ats_incremental.validate_state(state), [])) == before
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda state: None,
+    lambda state: {'counters': {}},
+    lambda state: {**state, 'version': ats_incremental.STATE_VERSION - 1},
+    lambda state: {**state, 'counters': {**state['counters'], 'line_count': '3'}},
+    lambda state: {**state, 'counters': {**state['counters'], 'chars': -1}},
+    lambda state: {**state, 'counters': {**state['counters'], 'verbs': {'not a verb': 1}}},
+    lambda state: {**state, 'counters': {**state['counters'], 'markers': []}},
+    lambda state: {**state, 'counters': {**state['counters'], 'tokens': {'two words': 1}}},
+    lambda state: {**state, 'counters': {**state['counters'], 'tokens': {'Upper': 1}}},
+    lambda state: {**state, 'counters': {**state['counters'], 'lines': {'not a hash': 1}}},
+    lambda state: {**state, 'counters': {**state['counters'], 'lines': {'0' * 16: 0}}},
+    lambda state: {**state, 'extracted': {**state['extracted'], 'skills_count': None}},
+])
+def test_malformed_states_are_rejected(mutate):
+    with pytest.raises(ValueError):
+        ats_incremental.validate_state(mutate(state_for(corpus.resumes(1)[0])))
+
+
+@pytest.mark.parametrize('edits', [
+    [{'removed': ['a line this resume never had']}],
+    # The same line removed once more than it occurs
+    [{'removed': ['']}] * 50,
+    # A line added by an earlier edit and then removed twice
+    [{'added': ['Led 5 engineers']}, {'removed': ['Led 5 engineers']}, {'removed': ['Led 5 engineers']}],
+])
+def test_edits_removing_lines_the_state_does_not_hold_are_rejected(edits):
+    state = ats_incremental.validate_state(state_for(corpus.resumes(1)[0]))
+    with pytest.raises(ValueError):
+        ats_incremental.apply_edits(state, edits)
+
+
+def test_lines_removed_after_being_added_are_accepted():
+    text = corpus.resumes(1)[0]
+    state = ats_incremental.validate_state(state_for(text))
+    ats_incremental.apply_edits(state, [{'added': ['Led 5 engineers']}, {'removed': ['Led 5 engineers']}])
+    assert ats_incremental.state_features(state) == ats_incremental.state_features(state_for(text))
+
+
+@pytest.mark.parametrize('edits', [None, {}, ['not an edit'], [{'removed': 'a line'}], [{'added': [1]}]])
+def test_malformed_edits_are_rejected(edits):
+    with pytest.raises(ValueError):
+        ats_incremental.validate_edits(edits)
@@ -0,0 +1,43 @@
+import re
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('resume_parser')
+from lambda_function import SKILL_MATCHERS, SKILLS_BY_DOMAIN  # noqa: E402
+from skill_matcher import SkillMatcher  # noqa: E402
+
+MATCHER = SkillMatcher(['c++', 'c#', '.net', 'asp.net', 'node.js', 'java', 'javascript', 'go', 'r&d', 'machine learning'])
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('c++ and c# developer', ['c++', 'c#']),
+    ('c++/c# on .net', ['c++', 'c#', '.net']),
+    ('r&d team', ['r&d']),
+    ('r&d, asp.net and node.js', ['.net', 'asp.net', 'node.js', 'r&d']),
+    ('javascript only', ['javascript']),
+    ('java, go and machine learning', ['java', 'go', 'machine learning']),
+    ('golang, django, machine learnings', []),
+    ('abc++ and xc#', []),
+])
+def test_word_boundaries(text, expected):
+    assert MATCHER.find_terms(text) == [term for term in MATCHER.terms if term in expected]
+
+
+def test_overlapping_matches_are_all_reported():
+    assert sorted(term for _, _, term in MATCHER.find_all('asp.net')) == ['.net', 'asp.net']
+
+
+def test_tech_dictionary_keeps_symbols_with_their_letters():
+    assert SKILL_MATCHERS['tech'].find_terms('c++ and c# developer') == ['c++', 'c#']
+    assert SKILL_MATCHERS['tech'].find_terms('worked in r&d') == []
+
+
+def test_word_edged_terms_match_like_the_boundary_regex():
+    terms = [term for term in SKILLS_BY_DOMAIN['tech'] if term[0].isalnum() and term[-1].isalnum()]
+    matcher = SkillMatcher(terms)
+    for text in corpus.resumes(30) + corpus.job_descriptions(10):
+        text_lower = text.lower()
+        expected = [term for term in terms if re.search(r'\b' + re.escape(term) + r'\b', text_lower)]
+        assert matcher.find_terms(text_lower) == expected
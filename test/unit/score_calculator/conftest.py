@@ -0,0 +1,15 @@
+import sys
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def scorer_module(monkeypatch):
+    """The parser tests import their own lambda_function; keep this one importable"""
+    monkeypatch.setitem(sys.modules, 'lambda_function', lambda_function)
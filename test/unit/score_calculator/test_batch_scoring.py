@@ -0,0 +1,83 @@
+from collections import Counter
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+import batch_scoring  # noqa: E402
+from idf_artifact import load_idf_table, write_idf_artifact  # noqa: E402
+
+JOB_TEXTS = corpus.job_descriptions(300, seed=43)
+RESUMES = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+            'education': ['Bachelor of Science in Computer Science'],
+            'experience': {'years': 1 + i % 8, 'positions': ['Software Engineer']}}
+           for i, text in enumerate(corpus.resumes(4, seed=47))]
+RESUMES.append({'skills': [], 'education': [], 'experience': {}})
+
+
+@pytest.fixture(params=['per-pair IDF', 'IDF artifact'])
+def idf_table(request, tmp_path, monkeypatch):
+    """Each test runs with two-document IDF and with a corpus artifact; job profiles are rebuilt for each"""
+    table = None
+    if request.param == 'IDF artifact':
+        doc_freqs = Counter()
+        for text in JOB_TEXTS:
+            doc_freqs.update(set(scorer.tokenize(text)))
+        path = str(tmp_path / 'idf.bin')
+        write_idf_artifact(path, doc_freqs, len(JOB_TEXTS), scorer.TOKENIZER_VERSION)
+        with corpus.quiet():
+            table = load_idf_table(path, scorer.TOKENIZER_VERSION)
+    monkeypatch.setattr(scorer, 'idf_table', table)
+    scorer.cached_job_profile.cache_clear()
+    yield table
+    scorer.cached_job_profile.cache_clear()
+
+
+@pytest.fixture(params=['NumPy', 'pure Python'])
+def scoring_path(request, monkeypatch):
+    """Score with NumPy (skipped where it is not installed) and with the single-job fallback"""
+    if request.param == 'NumPy':
+        monkeypatch.setattr(batch_scoring, 'np', pytest.importorskip('numpy'))
+    else:
+        monkeypatch.setattr(batch_scoring, 'np', None)
+    return request.param
+
+
+def jobs():
+    return [{'title': f'Job {i}', 'description': text} for i, text in enumerate(JOB_TEXTS)]
+
+
+@pytest.mark.usefixtures('idf_table', 'scoring_path')
+def test_batch_scores_equal_the_single_job_scorer():
+    profiles = [scorer.job_profile(text) for text in JOB_TEXTS[:60]]
+    for resume_data in RESUMES:
+        scores, skill_match, matched_counts, _ = batch_scoring.score_profiles(resume_data, profiles)
+        for i, profile in enumerate(profiles):
+            expected = scorer.score_resume(resume_data, profile)
+            assert scores[i] == pytest.approx(expected[0], abs=1e-9)
+            assert skill_match[i] == pytest.approx(expected[1], abs=1e-9)
+            assert matched_counts[i] == expected[2]
+
+
+@pytest.mark.usefixtures('idf_table', 'scoring_path')
+@pytest.mark.parametrize('k', [1, 10, 50])
+def test_cascade_top_k_equals_scoring_every_job(k):
+    for resume_data in RESUMES:
+        with corpus.quiet():
+            everything = batch_scoring.score_jobs(resume_data, jobs(), feedback_limit=0)[0]
+            top = batch_scoring.score_jobs(resume_data, jobs(), feedback_limit=0, top_k=k)[0]
+        # Ties at the cut-off may pick different jobs, so compare by score
+        assert [result['score'] for result in top] == [result['score'] for result in everything[:k]]
+        titles = {result['title']: result['score'] for result in everything}
+        assert all(titles[result['title']] == result['score'] for result in top)
+
+
+def test_unscorable_jobs_are_reported():
+    batch = [{'title': 'Blank', 'description': '  '}, {'title': 'Real', 'description': JOB_TEXTS[0]}]
+    with corpus.quiet():
+        results, errors = batch_scoring.score_jobs(RESUMES[0], batch)
+    assert [result['title'] for result in results] == ['Real']
+    assert errors == [{'index': 0, 'title': 'Blank', 'error': 'Empty job description'}]
@@ -0,0 +1,60 @@
+"""
+Candidate search against scoring every analysis. Postings are built in
+memory from the skill keys the index stores, and search() reads them
+through patched DynamoDB helpers.
+"""
+from collections import defaultdict
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+    import candidate_index  # noqa: E402
+
+K = 50
+JOBS = corpus.job_descriptions(6, seed=41)
+
+
+@pytest.fixture(scope='module')
+def indexed():
+    """({analysis_id: resume data}, {skill key: postings}) for the corpus resumes"""
+    records = {}
+    for i, text in enumerate(corpus.resumes(1000, seed=37)):
+        records[f'resume_{i}'] = {
+            'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+            'education': [corpus.DEGREES[i % len(corpus.DEGREES)]],
+            'experience': {'years': 1 + i % 9, 'positions': [corpus.TITLES[i % len(corpus.TITLES)]]}
+        }
+    postings = defaultdict(list)
+    for analysis_id, resume_data in records.items():
+        keys, skill_count = candidate_index.skill_keys(resume_data['skills'])
+        years, education_score = resume_data['experience']['years'], scorer.education_relevance(resume_data)
+        for key, count in keys.items():
+            postings[key].append((analysis_id, count, skill_count, years, education_score))
+    return records, postings
+
+
+@pytest.mark.parametrize('job', JOBS)
+def test_search_top_k_equals_scoring_every_resume(indexed, job, monkeypatch):
+    records, postings = indexed
+    monkeypatch.setattr(candidate_index, 'query_postings', lambda key: postings.get(key, []))
+    monkeypatch.setattr(candidate_index, 'feature_records', lambda ids: {i: records[i] for i in ids})
+    expected = candidate_index.rank_candidates(job, records, K)
+    with corpus.quiet():
+        results = candidate_index.search(job, K)
+    # Ties at the cut-off can swap ids, so compare by score
+    assert [result['score'] for result in results] == [result['score'] for result in expected]
+
+
+def test_pool_keeps_resumes_by_estimate(indexed):
+    records, postings = indexed
+    job = JOBS[0]
+    posting_lists = [postings.get(key, []) for key in candidate_index.job_keys(job)]
+    everyone = candidate_index.candidate_pool(job, posting_lists, len(records))
+    # Resumes without a shared skill key have no estimate
+    sharing = {posting[0] for postings_for_key in posting_lists for posting in postings_for_key}
+    assert set(everyone) == sharing
+    assert candidate_index.candidate_pool(job, posting_lists, 20) == everyone[:20]
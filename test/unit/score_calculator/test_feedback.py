@@ -0,0 +1,29 @@
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+
+
+@pytest.mark.parametrize('job_text, expected', [
+    ('c++ and c# developer', {'c++', 'c#'}),
+    ('r&d team, golang and rust', {'rust'}),
+    ('experience with c, r and go', {'c', 'r', 'go'}),
+    ('asp.net or .net core, node.js', {'asp.net', '.net', 'node', 'node.js'}),
+    ('machine learning (ml) with scikit-learn', {'machine learning', 'ml', 'scikit-learn', 'scikit'}),
+    ('javascript and postgresql', {'javascript', 'postgresql'}),
+])
+def test_whitelist_terms_are_whole_terms(job_text, expected):
+    assert scorer.whitelist_terms_in(job_text) == expected
+
+
+def test_missing_keywords_leave_out_resume_skills():
+    job_text = 'Senior engineer: C++, C#, Docker and Kubernetes in an R&D group'
+    resume_data = {'skills': ['Docker', 'C#'], 'experience': {'years': 3}}
+    feedback = scorer.generate_feedback(70, 60, resume_data, scorer.extract_keywords(job_text), job_text)
+    assert 'docker' not in feedback['missing_keywords'] and 'c#' not in feedback['missing_keywords']
+    assert {'c++', 'kubernetes'} <= set(feedback['missing_keywords'])
+    assert not {'c', 'r'} & set(feedback['missing_keywords'])
+    assert 'Docker' in feedback['matched_skills']
@@ -0,0 +1,69 @@
+import math
+import struct
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+from idf_artifact import IdfTable, load_idf_table, smoothed_idf, write_idf_artifact  # noqa: E402
+from sorted_terms import SortedTerms, pack_terms  # noqa: E402
+
+DOC_FREQS = {'python': 40, 'aws': 25, 'c++': 3, 'node.js': 7, 'café': 1, 'zürich': 2, 'a': 90, 'ab': 5}
+DOC_COUNT = 100
+
+
+def float32(value):
+    return struct.unpack('<f', struct.pack('<f', value))[0]
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    path = tmp_path / 'idf.bin'
+    write_idf_artifact(str(path), DOC_FREQS, DOC_COUNT, tokenizer_version=3)
+    return str(path)
+
+
+def test_round_trip(artifact):
+    with corpus.quiet():
+        table = load_idf_table(artifact, 3)
+    assert len(table) == len(DOC_FREQS)
+    assert table.doc_count == DOC_COUNT
+    for term, doc_freq in DOC_FREQS.items():
+        assert table.get(term) == float32(smoothed_idf(DOC_COUNT, doc_freq))
+    assert table.get('missing') == float32(smoothed_idf(DOC_COUNT, 0)) == table.default
+    # Neighbours and prefixes of stored terms are not found
+    for term in ('', 'b', 'pytho', 'pythons', 'c+', 'cafe'):
+        assert table.get(term) == table.default
+
+
+def test_rarer_terms_get_larger_idf(artifact):
+    table = IdfTable(artifact)
+    assert table.get('café') > table.get('python') > table.get('a')
+    assert table.default == pytest.approx(math.log(101) + 1, rel=1e-6)
+
+
+def test_other_tokenizer_or_missing_file_falls_back(artifact, tmp_path):
+    with corpus.quiet():
+        assert load_idf_table(artifact, 4) is None
+        assert load_idf_table(str(tmp_path / 'absent.bin'), 3) is None
+
+
+def test_other_format_is_rejected(tmp_path):
+    path = tmp_path / 'bad.bin'
+    path.write_bytes(b'XXXX' + bytes(64))
+    with pytest.raises(ValueError):
+        IdfTable(str(path))
+
+
+def test_sorted_terms_find_and_containing():
+    terms = sorted(DOC_FREQS)
+    vocab, offsets = pack_terms(terms)
+    # Terms at a non-zero base, as in the artifact
+    sorted_terms = SortedTerms(b'header' + vocab + b'trailer', len(b'header'), offsets)
+    assert len(sorted_terms) == len(terms)
+    assert [sorted_terms.find(term) for term in terms] == list(range(len(terms)))
+    assert sorted_terms.find('trailer') is None and sorted_terms.find('header') is None
+    assert sorted(terms[i] for i in sorted_terms.containing('a')) == sorted(term for term in terms if 'a' in term)
+    assert [terms[i] for i in sorted_terms.containing('ü')] == ['zürich']
+    assert sorted_terms.containing('') == [] and sorted_terms.containing('a\nb') == []
@@ -0,0 +1,90 @@
+"""
+Job index retrieval against scoring every registered job. The registry
+cache is preloaded and DynamoDB answers nothing, so jobs dropped from the
+cache are unregistered.
+"""
+import json
+from collections import Counter
+
+import pytest
+
+import corpus
+
+corpus.use_lambda('score_calculator')
+with corpus.quiet():
+    import lambda_function as scorer  # noqa: E402
+    import recommendation  # noqa: E402
+import batch_scoring  # noqa: E402
+import job_registry  # noqa: E402
+from idf_artifact import load_idf_table, write_idf_artifact  # noqa: E402
+from job_index import load_job_index, write_job_index  # noqa: E402
+from lru_cache import LRUCache  # noqa: E402
+
+JOBS = 400
+K = 10
+JOB_TEXTS = corpus.job_descriptions(JOBS, seed=29)
+RESUMES = [{'skills': [skill for skill in corpus.SKILLS if skill.lower() in text.lower()],
+            'education': ['Bachelor of Science in Computer Science'],
+            'experience': {'years': 2 + i % 6, 'positions': ['Software Engineer']}}
+           for i, text in enumerate(corpus.resumes(5, seed=31))]
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    """(job index, [(jd_id, JobProfile)]) for the registered corpus jobs"""
+    doc_freqs = Counter()
+    for text in JOB_TEXTS:
+        doc_freqs.update(set(scorer.tokenize(text)))
+    idf_path = str(tmp_path / 'idf.bin')
+    write_idf_artifact(idf_path, doc_freqs, JOBS, scorer.TOKENIZER_VERSION)
+    with corpus.quiet():
+        monkeypatch.setattr(scorer, 'idf_table', load_idf_table(idf_path, scorer.TOKENIZER_VERSION))
+
+    # What register_jobs stores, after the JSON round trip through the table
+    registered = []
+    for i, text in enumerate(JOB_TEXTS):
+        features = json.loads(json.dumps(scorer.JobProfile(text).to_features()))
+        registered.append((job_registry.job_id(f"{text}\n#{i}"), features))
+    index_path = str(tmp_path / 'job_index.bin')
+    write_job_index(index_path, registered, scorer.idf_table, scorer.TOKENIZER_VERSION)
+    with corpus.quiet():
+        index = load_job_index(index_path, scorer.TOKENIZER_VERSION, scorer.idf_table)
+    monkeypatch.setattr(job_registry, 'memory_cache', LRUCache(JOBS))
+    monkeypatch.setattr(job_registry.dynamodb, 'batch_get_item', lambda RequestItems: {'Responses': {}})
+    jobs = [(jd_id, scorer.JobProfile(text, features)) for (jd_id, features), text in zip(registered, JOB_TEXTS)]
+    return index, jobs
+
+
+def register(jobs, dropped=()):
+    for i, (jd_id, profile) in enumerate(jobs):
+        if i not in dropped:
+            job_registry.memory_cache.put(jd_id, (f'Job {i}', profile))
+
+
+def brute_force(resume_data, jobs, dropped=()):
+    scores = batch_scoring.score_profiles(resume_data, [profile for _, profile in jobs])[0]
+    return sorted((round(score, 2) for i, score in enumerate(scores) if i not in dropped), reverse=True)[:K]
+
+
+def test_top_k_equals_scoring_every_job(registry):
+    index, jobs = registry
+    register(jobs)
+    for resume_data in RESUMES:
+        with corpus.quiet():
+            results = recommendation.recommend(resume_data, K, feedback_limit=0, index=index)
+        assert [result['score'] for result in results] == brute_force(resume_data, jobs)
+        assert len({result['jd_id'] for result in results}) == K
+
+
+def test_unregistered_jobs_are_skipped(registry):
+    index, jobs = registry
+    for resume_data in RESUMES:
+        scores = batch_scoring.score_profiles(resume_data, [profile for _, profile in jobs])[0]
+        # The resume's three best jobs and every 25th job leave the registry
+        dropped = set(sorted(range(JOBS), key=scores.__getitem__, reverse=True)[:3]) | set(range(0, JOBS, 25))
+        job_registry.memory_cache = LRUCache(JOBS)
+        register(jobs, dropped)
+        with corpus.quiet():
+            results = recommendation.recommend(resume_data, K, feedback_limit=0, index=index)
+        assert [result['score'] for result in results] == brute_force(resume_data, jobs, dropped)
+        assert not {result['jd_id'] for result in results} & {jobs[i][0] for i in dropped}